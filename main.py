@@ -19,12 +19,18 @@ src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
 from src.gui.main_window import MainWindow
-from src.utils.config import config_manager
+from src.utils.config import ConfigError, get_config_manager
 from src.utils.logger import setup_logger
 
 
 def main():
     """Main application entry point."""
+    try:
+        config_manager = get_config_manager()
+    except ConfigError as e:
+        print(f"Configuration error: {e}", file=sys.stderr)
+        return 2
+    
     try:
         logger = setup_logger()
         logger.info("=" * 50)
@@ -32,6 +38,7 @@ def main():
         logger.info("=" * 50)
         
         config_manager.ensure_directories()
+        config_manager.watch()
         
         app = MainWindow()
         app.run()
@@ -43,8 +50,9 @@ def main():
         print(f"An unexpected error occurred: {e}")
         print("Check the logs for more details.")
     finally:
+        config_manager.close()
         logger.info("Application shutting down")
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
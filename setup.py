@@ -28,8 +28,8 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/BJ-dev0706/solana-airdrop-tool",
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
+    packages=find_packages(include=["src", "src.*"]),
+    py_modules=["main"],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -54,11 +54,13 @@ setup(
             "black>=21.0",
             "flake8>=3.8",
             "mypy>=0.800",
+            "lxml>=4.6",
         ],
     },
     entry_points={
         "console_scripts": [
             "solana-airdrop-tool=main:main",
+            "solana-airdrop-cli=src.cli:main",
         ],
     },
     include_package_data=True,
@@ -0,0 +1,273 @@
+"""
+Command Line Interface - Headless entry point for servers and containers.
+
+This module drives AirdropManager without Tk. Wallets come from arguments
+and wallet-list files; progress goes to stdout as text or JSON lines. In
+daemon mode every wallet is retried as its cooldown expires until SIGTERM
+or SIGINT, which stops the run cleanly.
+
+Usage:
+    solana-airdrop-cli WALLET [WALLET ...] [--file wallets.txt] [--daemon] [--json]
+"""
+
+import argparse
+import json
+import math
+import signal
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, TextIO
+
+from .core.airdrop_manager import AirdropManager
+from .core.attempt_ledger import AttemptRecord
+from .core.browser_profile import PROFILES
+from .core.wallet_import import WalletImporter
+from .utils.config import AppConfig, ConfigError, ConfigManager, set_config_manager
+from .utils.logger import setup_logger, stop_logging
+
+
+class ProgressPrinter:
+    """Writes progress events to a stream as text or JSON lines."""
+
+    def __init__(self, stream: TextIO, json_lines: bool = False):
+        """
+        Initialize the printer.
+
+        Args:
+            stream: Output stream, usually stdout
+            json_lines: Write one JSON object per event instead of text
+        """
+        self.stream = stream
+        self.json_lines = json_lines
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, message: str = "", **fields: Any) -> None:
+        """
+        Write one event. Safe to call from any thread.
+
+        Args:
+            event: Event name, e.g. ``status`` or ``attempt``
+            message: Human-readable text
+            **fields: Structured fields for JSON output
+        """
+        if self.json_lines:
+            entry: Dict[str, Any] = {"time": round(time.time(), 3), "event": event}
+            if message:
+                entry["message"] = message
+            entry.update(fields)
+            line = json.dumps(entry)
+        else:
+            line = message or " ".join(f"{key}={value}" for key, value in fields.items())
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    def status(self, message: str) -> None:
+        """Write a status message from the airdrop manager."""
+        self.emit("status", message)
+
+    def attempt(self, record: AttemptRecord) -> None:
+        """Write the result of a finished attempt."""
+        self.emit(
+            "attempt",
+            f"{record.wallet}: {record.outcome} ({record.message})",
+            wallet=record.wallet,
+            outcome=record.outcome,
+            latency=round(record.ended_at - record.started_at, 3),
+            next_eligible_at=None if math.isinf(record.next_eligible_at) else round(record.next_eligible_at, 3),
+            detail=record.message,
+        )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="solana-airdrop-cli",
+        description="Request Solana airdrops without the GUI.",
+    )
+    parser.add_argument("wallets", nargs="*", help="wallet addresses to fund")
+    parser.add_argument(
+        "-f", "--file", action="append", default=[], metavar="PATH",
+        help="wallet list (.txt, one per line, or .csv); may be repeated",
+    )
+    parser.add_argument(
+        "--daemon", action="store_true",
+        help="keep retrying every wallet as its cooldown expires until stopped",
+    )
+    parser.add_argument("--json", action="store_true", help="write progress to stdout as JSON lines")
+    parser.add_argument(
+        "--config", metavar="PATH",
+        help="TOML settings file; timing settings are reloaded when it changes in daemon mode",
+    )
+    parser.add_argument("--backend", choices=("browser", "rpc"), help="airdrop backend")
+    parser.add_argument("--rpc-url", help="validator JSON-RPC URL for the rpc backend")
+    parser.add_argument(
+        "--no-confirm", action="store_true", help="do not wait for rpc airdrops to confirm"
+    )
+    parser.add_argument("--profile", choices=sorted(PROFILES), help="browser profile")
+    parser.add_argument("--cooldown", type=int, metavar="SECONDS", help="wait between attempts")
+    parser.add_argument("--ledger", metavar="PATH", help="attempt ledger database; empty to disable")
+    parser.add_argument("--log-dir", metavar="PATH", help="log file directory")
+    parser.add_argument("--log-format", choices=("text", "json"), help="log file format")
+    parser.add_argument("--log-level", help="log level, e.g. INFO or DEBUG")
+    parser.add_argument(
+        "--trace",
+        choices=("off", "attempt", "buffer"),
+        help="write Chrome trace-event timelines: one file per attempt, or a rolling buffer",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {AppConfig.app_version}")
+    return parser
+
+
+def build_config(args: argparse.Namespace) -> ConfigManager:
+    """
+    Load the configuration with command-line options applied on top.
+
+    Raises:
+        ConfigError: If the config file or an option value is invalid
+    """
+    overrides: Dict[str, Any] = {}
+    if args.backend:
+        overrides["airdrop_backend"] = args.backend
+    if args.rpc_url:
+        overrides["rpc_url"] = args.rpc_url
+    if args.no_confirm:
+        overrides["confirm_airdrops"] = False
+    if args.profile:
+        overrides["browser_profile"] = args.profile
+    if args.cooldown is not None:
+        overrides["retry_cooldown_seconds"] = args.cooldown
+    if args.ledger is not None:
+        # A path given on the command line is relative to the working directory.
+        overrides["ledger_path"] = str(Path(args.ledger).resolve()) if args.ledger else ""
+    if args.log_dir:
+        overrides["logs_dir"] = args.log_dir
+    if args.log_format:
+        overrides["log_format"] = args.log_format
+    if args.log_level:
+        overrides["log_level"] = args.log_level.upper()
+    if args.trace:
+        overrides["trace_mode"] = args.trace
+    # stdout carries the progress output; logs go to the log file only.
+    overrides["log_to_console"] = False
+    settings = ConfigManager(args.config, overrides)
+    # A headless run has no desktop to show pop-ups on.
+    settings.config.notification_sinks = [
+        sink for sink in settings.config.notification_sinks if sink != "desktop"
+    ]
+    return settings
+
+
+def collect_wallets(
+    args: argparse.Namespace, printer: ProgressPrinter, max_wallets: Optional[int] = None
+) -> List[str]:
+    """Gather wallets from the arguments and files, dropping repeats."""
+    wallets = list(dict.fromkeys(args.wallets))
+    seen = set(wallets)
+    for path in args.file:
+        importer = WalletImporter(path, max_wallets=max_wallets)
+        for wallet in importer:
+            if wallet not in seen:
+                seen.add(wallet)
+                wallets.append(wallet)
+        printer.emit("import", f"{path}: {importer.stats.summary()}", path=path,
+                     imported=importer.stats.imported, invalid=importer.stats.invalid,
+                     duplicates=importer.stats.duplicates)
+    return wallets
+
+
+def run_daemon(manager: AirdropManager, wallets: Sequence[str], printer: ProgressPrinter,
+               stopped: threading.Event) -> None:
+    """Retry every wallet as its cooldown expires until ``stopped`` is set."""
+    scheduler = manager.create_scheduler(printer.status)
+    manager.scheduler = scheduler
+    tracked = 0
+    for wallet in wallets:
+        due = manager.next_eligible_time(wallet)
+        if math.isinf(due):
+            printer.emit("skipped", f"{wallet}: rejected by the faucet earlier; not retrying.", wallet=wallet)
+            continue
+        scheduler.schedule(wallet, due)
+        tracked += 1
+    scheduler.start()
+    printer.emit("started", f"Tracking {tracked} wallets.", wallets=tracked)
+    # A bounded wait keeps the main thread responsive to signals.
+    while not stopped.wait(1.0):
+        pass
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the command-line interface.
+
+    Args:
+        argv: Arguments, defaults to ``sys.argv[1:]``
+
+    Returns:
+        Process exit code: 0 when every requested airdrop succeeded or the
+        daemon was stopped, 1 when an airdrop failed, 2 on usage errors
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    printer = ProgressPrinter(sys.stdout, json_lines=args.json)
+
+    try:
+        settings = build_config(args)
+    except ConfigError as e:
+        printer.emit("error", str(e))
+        return 2
+    set_config_manager(settings)
+    app_config = settings.config
+    logger = setup_logger(app_config=app_config)
+
+    try:
+        wallets = collect_wallets(args, printer, app_config.import_max_wallets)
+    except OSError as e:
+        printer.emit("error", f"Could not read wallet list: {e}")
+        return 2
+    if not wallets:
+        parser.print_usage(sys.stderr)
+        printer.emit("error", "No wallets given.")
+        return 2
+
+    try:
+        manager = AirdropManager(app_config)
+    except ValueError as e:
+        printer.emit("error", str(e))
+        return 2
+    manager.attempt_listeners.append(printer.attempt)
+
+    stopped = threading.Event()
+
+    def on_signal(signum, frame) -> None:
+        logger.info(f"Received signal {signum}, stopping.")
+        stopped.set()
+        manager.stop()
+
+    previous = {sig: signal.signal(sig, on_signal) for sig in (signal.SIGTERM, signal.SIGINT)}
+    try:
+        if args.daemon:
+            settings.watch()
+            run_daemon(manager, wallets, printer, stopped)
+            exit_code = 0
+        else:
+            results = manager.perform_bulk_airdrop(wallets, printer.status)
+            succeeded = sum(1 for result in results if result.success)
+            printer.emit("finished", f"{succeeded}/{len(results)} airdrops succeeded.",
+                         succeeded=succeeded, total=len(results))
+            exit_code = 0 if succeeded == len(results) else 1
+    finally:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+        settings.close()
+        manager.close()
+        if stopped.is_set():
+            printer.emit("stopped", "Stopped.")
+        stop_logging()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+"""
+Address Validator - Solana wallet address decoding and validation.
+
+This module decodes base58 addresses with precomputed lookup tables and
+checks that they are exact 32-byte public keys, optionally verifying that
+the key is a point on the ed25519 curve. A batch API validates large
+address lists with the per-address work kept to a few C-level operations.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+PUBLIC_KEY_LENGTH = 32
+
+# A 32-byte key encodes to 32-44 base58 characters.
+MIN_ADDRESS_LENGTH = 32
+MAX_ADDRESS_LENGTH = 44
+
+_DIGITS = {char: value for value, char in enumerate(BASE58_ALPHABET)}
+
+# Two characters at a time halves the number of big-int multiply-adds.
+_PAIRS = {
+    high + low: high_value * 58 + low_value
+    for high, high_value in _DIGITS.items()
+    for low, low_value in _DIGITS.items()
+}
+
+
+def _encode_int(number: int) -> str:
+    """Encode a positive integer as base58 digits."""
+    digits = []
+    while number:
+        number, remainder = divmod(number, 58)
+        digits.append(BASE58_ALPHABET[remainder])
+    return "".join(reversed(digits))
+
+
+# The alphabet is in ASCII order, so for equal lengths base58 strings compare
+# like the numbers they encode. For each count of leading "1"s (zero bytes),
+# the rest of a 32-byte key must lie between these two encodings.
+_BODY_BOUNDS = [
+    (
+        _encode_int(256 ** (PUBLIC_KEY_LENGTH - zeros - 1)),
+        _encode_int(256 ** (PUBLIC_KEY_LENGTH - zeros) - 1),
+    )
+    for zeros in range(PUBLIC_KEY_LENGTH)
+]
+
+_VALID_CHARS = re.compile(r"[1-9A-HJ-NP-Za-km-z]*\Z")
+_INVALID_CHAR = re.compile(r"[^1-9A-HJ-NP-Za-km-z]")
+
+# ed25519 curve parameters.
+_P = 2 ** 255 - 19
+_D = (-121665 * pow(121666, _P - 2, _P)) % _P
+_Y_MASK = (1 << 255) - 1
+
+# Stable rejection codes, for counting; the REASON_* messages are for people.
+REJECT_EMPTY = "empty"
+REJECT_TYPE = "type"
+REJECT_LENGTH = "length"
+REJECT_CHARACTER = "character"
+REJECT_DECODED_LENGTH = "decoded_length"
+REJECT_OFF_CURVE = "off_curve"
+
+REASON_EMPTY = "empty address"
+REASON_TYPE = "not a string"
+REASON_LENGTH = "invalid length"
+REASON_CHARACTER = "invalid base58 character"
+REASON_DECODED_LENGTH = "does not decode to 32 bytes"
+REASON_OFF_CURVE = "not on the ed25519 curve"
+
+
+@dataclass
+class ValidationResult:
+    """Result of validating one address."""
+
+    address: str
+    valid: bool
+    reason: Optional[str] = None
+    code: Optional[str] = None
+
+
+def _decode_int(value: str) -> int:
+    """Decode base58 digits to an integer, ignoring leading-zero semantics."""
+    pairs = _PAIRS
+    if len(value) % 2:
+        number = _DIGITS[value[0]]
+        value = value[1:]
+    else:
+        number = 0
+    for index in range(0, len(value), 2):
+        number = number * 3364 + pairs[value[index:index + 2]]
+    return number
+
+
+def b58decode(value: str) -> bytes:
+    """
+    Decode a base58 string.
+
+    Args:
+        value: Base58-encoded string
+
+    Returns:
+        Decoded bytes
+
+    Raises:
+        ValueError: If the string contains a non-base58 character
+    """
+    if not _VALID_CHARS.match(value):
+        raise ValueError(REASON_CHARACTER)
+    leading_zeros = len(value) - len(value.lstrip("1"))
+    number = _decode_int(value)
+    body = number.to_bytes((number.bit_length() + 7) // 8, "big")
+    return b"\x00" * leading_zeros + body
+
+
+def is_on_curve(public_key: bytes) -> bool:
+    """
+    Check whether a 32-byte key is a valid compressed ed25519 point.
+
+    Program-derived addresses are deliberately off the curve, so this check
+    only belongs where a wallet (keypair) address is expected.
+
+    Args:
+        public_key: 32-byte public key
+
+    Returns:
+        True if the key decompresses to a curve point
+    """
+    if len(public_key) != PUBLIC_KEY_LENGTH:
+        return False
+    y = int.from_bytes(public_key, "little") & _Y_MASK
+    if y >= _P:
+        return False
+    y2 = y * y % _P
+    # x^2 = u / v has a root exactly when u * v is zero or a quadratic residue.
+    return _jacobi((y2 - 1) * (_D * y2 + 1)) >= 0
+
+
+def _jacobi(value: int) -> int:
+    """Return the Legendre symbol of value modulo the curve prime."""
+    a = value % _P
+    n = _P
+    result = 1
+    while a:
+        while not a & 1:
+            a >>= 1
+            if n & 7 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a & 3 == 3 and n & 3 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def _check(address: Optional[str], check_on_curve: bool) -> Optional[Tuple[str, str]]:
+    """Return the rejection code and reason for an address, or None if it is valid."""
+    if not address:
+        return REJECT_EMPTY, REASON_EMPTY
+    length = len(address)
+    if length < MIN_ADDRESS_LENGTH or length > MAX_ADDRESS_LENGTH:
+        return REJECT_LENGTH, REASON_LENGTH
+    if not _VALID_CHARS.match(address):
+        match = _INVALID_CHAR.search(address)
+        return REJECT_CHARACTER, f"{REASON_CHARACTER} {match.group()!r} at position {match.start()}"
+
+    body = address.lstrip("1")
+    leading_zeros = length - len(body)
+    if leading_zeros >= PUBLIC_KEY_LENGTH:
+        if leading_zeros > PUBLIC_KEY_LENGTH or body:
+            return REJECT_DECODED_LENGTH, REASON_DECODED_LENGTH
+    else:
+        low, high = _BODY_BOUNDS[leading_zeros]
+        size = len(body)
+        if (size, body) < (len(low), low) or (size, body) > (len(high), high):
+            return REJECT_DECODED_LENGTH, REASON_DECODED_LENGTH
+    if check_on_curve and not is_on_curve(_decode_int(body).to_bytes(PUBLIC_KEY_LENGTH, "big")):
+        return REJECT_OFF_CURVE, REASON_OFF_CURVE
+    return None
+
+
+def validate_address(address: Optional[str], check_on_curve: bool = False) -> ValidationResult:
+    """
+    Validate a Solana address.
+
+    Args:
+        address: Base58 address to validate
+        check_on_curve: Also require the key to be an ed25519 curve point
+
+    Returns:
+        ValidationResult with the rejection reason and code for invalid addresses
+    """
+    if not isinstance(address, str):
+        if not address:
+            return ValidationResult(str(address), False, REASON_EMPTY, REJECT_EMPTY)
+        return ValidationResult(str(address), False, REASON_TYPE, REJECT_TYPE)
+    rejection = _check(address, check_on_curve)
+    if rejection is None:
+        return ValidationResult(address, True)
+    return ValidationResult(address, False, rejection[1], rejection[0])
+
+
+def iter_validate(addresses: Iterable[str], check_on_curve: bool = False) -> Iterator[ValidationResult]:
+    """
+    Lazily validate a stream of addresses.
+
+    Args:
+        addresses: Addresses to validate
+        check_on_curve: Also require each key to be an ed25519 curve point
+
+    Yields:
+        ValidationResult for each address, in input order
+    """
+    check = _check
+    for address in addresses:
+        if isinstance(address, str):
+            rejection = check(address, check_on_curve)
+            if rejection is None:
+                yield ValidationResult(address, True)
+            else:
+                yield ValidationResult(address, False, rejection[1], rejection[0])
+        else:
+            yield validate_address(address, check_on_curve)
+
+
+def validate_batch(addresses: Iterable[str], check_on_curve: bool = False) -> List[ValidationResult]:
+    """
+    Validate many addresses at once.
+
+    Args:
+        addresses: Addresses to validate
+        check_on_curve: Also require each key to be an ed25519 curve point
+
+    Returns:
+        ValidationResult for each address, in input order
+    """
+    return list(iter_validate(addresses, check_on_curve))
@@ -6,40 +6,137 @@ form submission, and retry logic.
 """
 
 import logging
+import math
 import random
-import time
-from threading import Thread
-from typing import Callable, Optional
+from contextlib import ExitStack, contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-from DrissionPage import ChromiumPage, ChromiumOptions
-from plyer import notification
-
-from .cloudflare_bypasser import CloudflareBypasser
+from ..utils.config import AppConfig, get_config
+from ..utils.lazy_import import lazy_import
+from .attempt_ledger import AttemptLedger, AttemptRecord
+from .browser_pool import BrowserPool
+from .browser_profile import apply_page_settings, build_options, get_profile
 from .browser_utils import BrowserUtils
+from .cancellation import CANCELLED_MESSAGE, CancellationToken, OperationCancelled
+from .clock import SYSTEM_CLOCK, Clock
+from .cloudflare_bypasser import CloudflareBypasser
+from .driver import Driver, DriverFactory
+from .faucet_page import RESULT_XPATH, FaucetPage, MissingElementsError
+from .metrics import create_metrics
+from .notifier import create_notifier
+from .outcome import TRANSIENT_OUTCOMES, Outcome, classify
+from .process_watchdog import create_watchdog
+from .rpc_backend import BulkAirdropResult, RpcAirdropBackend
+from .scheduler import CooldownScheduler
+from .tracing import create_tracer
+from .wallet_import import iter_chunks
+
+# Wallets read from a bulk run's input at a time. Spanning several RPC batches
+# means confirmations are awaited once per window rather than once per batch.
+BULK_WINDOW_SIZE = 1000
+
+# Imported on first use so entry points that never open a browser skip the cost.
+ChromiumPage = lazy_import("DrissionPage", "ChromiumPage")
+ChromiumOptions = lazy_import("DrissionPage", "ChromiumOptions")
 
 
 class AirdropManager:
     """Manages airdrop operations and browser automation."""
     
-    def __init__(self):
+    def __init__(
+        self,
+        app_config: Optional[AppConfig] = None,
+        driver_factory: Optional[DriverFactory] = None,
+        clock: Optional[Clock] = None,
+    ):
+        """
+        Initialize the manager.
+        
+        Args:
+            app_config: Configuration, defaults to the global config
+            driver_factory: Opens the browser page for each attempt, defaults
+                to launching Chromium (or leasing from the browser pool)
+            clock: Time source for attempt timing, cooldowns and waits,
+                defaults to the real clock
+        """
+        self.config = app_config or get_config()
+        self.driver_factory = driver_factory
+        self.tracer = create_tracer(self.config, clock)
+        # Sleeps show up in traces; with tracing off this is the clock itself.
+        self.clock = self.tracer.wrap_clock(clock or SYSTEM_CLOCK)
         self.last_attempt_time = 0
         self.logger = logging.getLogger(__name__)
         self.browser_utils = BrowserUtils()
+        self.browser_profile = get_profile(self.config.browser_profile)
+        self.rpc_backend = self._create_rpc_backend()
+        self.watchdog = create_watchdog(self.config) if self.rpc_backend is None else None
+        self.browser_pool = self._create_browser_pool()
+        ledger_path = self.config.data_path(self.config.ledger_path)
+        self.ledger = AttemptLedger(ledger_path) if ledger_path else None
+        self.next_eligible: Dict[str, float] = (
+            self.ledger.next_eligible_times() if self.ledger is not None else {}
+        )
+        self.attempt_numbers: Dict[str, int] = {}
+        # Called with every finished attempt, from the thread that ran it.
+        self.attempt_listeners: List[Callable[[AttemptRecord], None]] = []
+        self.scheduler: Optional[CooldownScheduler] = None
+        self.cancel_token = CancellationToken()
+        # Tokens of bulk runs in progress; stop() cancels them too.
+        self.bulk_tokens: Set[CancellationToken] = set()
+        self.metrics = create_metrics(self.config)
+        self.notifier = create_notifier(self.config)
+    
+    def _create_rpc_backend(self) -> Optional[RpcAirdropBackend]:
+        """Create the RPC backend if it is the configured airdrop backend."""
+        backend = self.config.airdrop_backend
+        if backend == "rpc":
+            return RpcAirdropBackend(self.config, self.clock)
+        if backend != "browser":
+            raise ValueError(f"Unknown airdrop backend: {backend}")
+        return None
+    
+    def _create_browser_pool(self) -> Optional[BrowserPool]:
+        """
+        Create the warm browser pool if it is enabled for the browser backend
+        and no custom driver factory was given.
+        """
+        if self.rpc_backend is not None or not self.config.browser_pool_enabled:
+            return None
+        if self.driver_factory is not None:
+            return None
+        return BrowserPool(
+            self.get_chromium_options,
+            max_uses=self.config.browser_pool_max_uses,
+            idle_timeout=self.config.browser_pool_idle_timeout,
+            watchdog=self.watchdog,
+        )
+        
+    def get_chromium_options(self, arguments: Optional[list] = None) -> ChromiumOptions:
+        """
+        Configure and return Chromium options for the configured browser profile.
         
-    def get_chromium_options(self, arguments: list) -> ChromiumOptions:
-        """Configure and return Chromium options."""
-        options = ChromiumOptions()
-        for argument in arguments:
-            options.set_argument(argument)
-        return options
+        Args:
+            arguments: Extra command-line arguments, defaults to
+                ``AppConfig.browser_arguments``
+        """
+        if arguments is None:
+            arguments = self.config.browser_arguments
+        return build_options(self.browser_profile, arguments)
     
-    def _human_type(self, element, text: str) -> None:
+    def _human_type(self, element, text: str, cancel_token: CancellationToken) -> None:
         """Simulate human typing by inputting text with random delays."""
         for char in text:
             element.input(char)
-            time.sleep(random.uniform(0.05, 0.1))
+            delay = random.uniform(self.config.typing_min_delay, self.config.typing_max_delay)
+            self.clock.sleep(delay, cancel_token)
     
-    def perform_airdrop(self, wallet_address: str, progress_callback: Callable[[str], None], attempt: int) -> bool:
+    def perform_airdrop(
+        self,
+        wallet_address: str,
+        progress_callback: Callable[[str], None],
+        attempt: int,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> bool:
         """
         Perform the airdrop process with error handling and progress updates.
         
@@ -47,131 +144,525 @@ class AirdropManager:
             wallet_address: The Solana wallet address
             progress_callback: Function to call with progress updates
             attempt: Current attempt number
+            cancel_token: Token that aborts the attempt, defaults to the
+                manager's current token (cancelled by stop())
             
         Returns:
             bool: True if airdrop was successful, False otherwise
         """
+        token = cancel_token or self.cancel_token
+        started_at = self.clock.time()
+        phases: Dict[str, float] = {}
+        messages: List[str] = []
+        
+        def report(message: str) -> None:
+            messages.append(message)
+            progress_callback(message)
+        
+        with self.tracer.attempt(wallet_address, attempt) as span:
+            if self.rpc_backend is not None:
+                success = self.rpc_backend.perform_airdrop(wallet_address, report, attempt, token)
+            else:
+                success = self._perform_browser_airdrop(wallet_address, report, attempt, phases, token)
+            
+            duration = self.clock.time() - started_at
+            if token.is_cancelled:
+                # An aborted attempt says nothing about the faucet; keep the cooldown as it was.
+                outcome = "cancelled"
+                self.metrics.record_attempt(self.config.airdrop_backend, outcome, duration, phases)
+            else:
+                self.last_attempt_time = self.clock.time()
+                outcome = self._record_attempt(
+                    wallet_address, started_at, success, messages[-1] if messages else "", phases
+                ).kind
+            span.set(outcome=outcome)
+        
+        self.logger.info(
+            f"Attempt {attempt} for {wallet_address} ended: {outcome} in {duration:.1f}s",
+            extra={
+                "wallet": wallet_address,
+                "attempt": attempt,
+                "outcome": outcome,
+                "duration": round(duration, 6),
+            },
+        )
+        return success and not token.is_cancelled
+    
+    def _perform_browser_airdrop(
+        self,
+        wallet_address: str,
+        progress_callback: Callable[[str], None],
+        attempt: int,
+        phases: Dict[str, float],
+        cancel_token: CancellationToken,
+    ) -> bool:
+        """Drive the faucet website in a browser, recording phase durations."""
+        pages = ExitStack()
+        unregister = None
         try:
             progress_callback(f"Status: Starting airdrop attempt {attempt}...")
             
-            options = self.get_chromium_options(["-no-first-run"])
-            url = "https://faucet.solana.com/"
-            page = ChromiumPage(addr_or_opts=options)
+            with self._timed(phases, "browser_launch"):
+                page, abort = pages.enter_context(self._open_page())
+            # Closing from the stopping thread also unblocks any pending CDP call.
+            unregister = cancel_token.register(abort)
             
             self.logger.info("Navigating to the Solana Faucet page.")
-            page.get(url)
+            with self._timed(phases, "page_load"):
+                page.get(self.config.solana_faucet_url, timeout=self.config.page_load_timeout)
             
-            notification.notify(
-                title="Airdrop Tool",
-                message="Navigated to Solana Faucet page.",
-                timeout=3
-            )
+            self.notifier.notify("Airdrop Tool", "Navigated to Solana Faucet page.")
             
-            if not self._interact_with_page(page, wallet_address):
-                return False
+            with self._timed(phases, "interact"):
+                if not self._interact_with_page(page, wallet_address, cancel_token):
+                    progress_callback("Status: An error occurred while filling in the faucet form.")
+                    return False
             
             self.logger.info("Attempting to bypass Cloudflare protection...")
-            cf_bypasser = CloudflareBypasser(page)
-            cf_bypasser.bypass()
+            with self._timed(phases, "challenge"):
+                cf_bypasser = CloudflareBypasser(
+                    page,
+                    max_retries=self.config.challenge_max_retries,
+                    retry_interval=self.config.challenge_retry_interval,
+                    cancel_token=cancel_token,
+                    clock=self.clock,
+                    tracer=self.tracer,
+                )
+                cf_bypasser.bypass()
             
             progress_callback("Status: Submitted form. Waiting for response...")
-            time.sleep(10)
+            with self._timed(phases, "response_wait"):
+                self.clock.sleep(self.config.response_wait_seconds, cancel_token)
             
-            success = self._check_airdrop_result(page, progress_callback, attempt)
-            self.last_attempt_time = time.time()
-            
-            return success
+            with self._timed(phases, "result_check"):
+                return self._check_airdrop_result(page, progress_callback, attempt, cancel_token)
             
+        except MissingElementsError as e:
+            self.logger.error(str(e))
+            progress_callback(f"Status: {e}")
+            return False
         except Exception as e:
+            if cancel_token.is_cancelled:
+                self.logger.info("Airdrop attempt cancelled.")
+                progress_callback("Status: Stopped.")
+                return False
             self.logger.error("Error during the airdrop process", exc_info=True)
             error_message = f"An error occurred: {str(e)}"
             progress_callback(f"Status: {error_message}")
             return False
         finally:
-            try:
-                page.quit()
-            except:
-                pass
+            if unregister is not None:
+                unregister()
+            pages.close()
     
-    def _interact_with_page(self, page: ChromiumPage, wallet_address: str) -> bool:
-        """Handle page interactions for the airdrop form."""
+    @contextmanager
+    def _open_page(self) -> Iterator[Tuple[Driver, Callable[[], None]]]:
+        """
+        Open a page for one attempt and close it afterwards.
+        
+        With the browser pool enabled the page is a tab in a fresh context of
+        the warm browser; otherwise the driver factory opens a page, by
+        default by launching a new browser, and it is quit afterwards.
+        
+        Yields:
+            The page and a function that aborts it from another thread
+        """
+        if self.browser_pool is not None:
+            with self.browser_pool.lease() as tab:
+                apply_page_settings(tab, self.browser_profile)
+                yield tab, lambda: self.browser_pool.release(tab)
+            return
+        
+        page = self.driver_factory() if self.driver_factory is not None else self._launch_browser()
+        pid = self._track_browser(page)
         try:
-            submit_button = page.ele('xpath://*[@type="button"]')
-            if not submit_button:
-                raise ValueError("Submit button not found.")
-            submit_button.click()
-            time.sleep(0.2)
-            
-            price_button = page.ele('xpath://*[@type="button" and text()="5"]')
-            if not price_button:
-                raise ValueError("Price button not found.")
-            price_button.click()
-            
-            wallet_input = page.ele('xpath://*[@placeholder="Wallet Address"]')
-            if not wallet_input:
-                raise ValueError("Wallet input field not found.")
-            wallet_input.click()
-            time.sleep(0.1)
+            apply_page_settings(page, self.browser_profile)
+            yield page, lambda: self._quit_page(page)
+        finally:
+            if pid is not None:
+                # Renderers orphaned if the browser exits mid-quit are only known from here.
+                self.watchdog.snapshot(pid)
+            self._quit_page(page)
+            if pid is not None:
+                # Kills whatever a failed or partial quit left running.
+                self.watchdog.release(pid)
+    
+    def _launch_browser(self) -> ChromiumPage:
+        """Launch a new Chromium with the configured options."""
+        return ChromiumPage(addr_or_opts=self.get_chromium_options())
+    
+    def _track_browser(self, page: Driver) -> Optional[int]:
+        """Hand the page's browser process to the watchdog; returns its pid if tracked."""
+        pid = getattr(page, "process_id", None)
+        if self.watchdog is None or not isinstance(pid, int):
+            return None
+        self.watchdog.track(pid)
+        return pid
+    
+    def _quit_page(self, page: Driver) -> None:
+        """Quit the browser, logging instead of raising on failure."""
+        try:
+            page.quit()
+        except Exception as e:
+            self.logger.warning(f"Failed to quit browser: {e}")
+    
+    @contextmanager
+    def _timed(self, phases: Dict[str, float], name: str) -> Iterator[None]:
+        """Record how long the enclosed block takes under ``phases[name]``."""
+        start = self.clock.monotonic()
+        try:
+            with self.tracer.span(name, cat="phase"):
+                yield
+        finally:
+            phases[name] = self.clock.monotonic() - start
+            self.logger.debug(
+                f"Phase {name} took {phases[name]:.3f}s",
+                extra={"phase": name, "duration": round(phases[name], 6)},
+            )
+    
+    def _record_attempt(
+        self,
+        wallet_address: str,
+        started_at: float,
+        success: bool,
+        message: str,
+        phases: Optional[Dict[str, float]] = None,
+    ) -> Outcome:
+        """
+        Classify a finished attempt, remember when the wallet may be tried
+        again and store the attempt in the ledger.
+        
+        Returns:
+            The classified outcome
+        """
+        ended_at = self.clock.time()
+        outcome = classify(message, succeeded=success)
+        next_eligible_at = self._next_eligible_at(outcome, ended_at)
+        self.next_eligible[wallet_address] = next_eligible_at
+        self.metrics.record_attempt(self.config.airdrop_backend, outcome.kind, ended_at - started_at, phases)
+        record = AttemptRecord(
+            wallet=wallet_address,
+            started_at=started_at,
+            ended_at=ended_at,
+            outcome=outcome.kind,
+            message=message,
+            next_eligible_at=next_eligible_at,
+            phases=phases or {},
+        )
+        if self.ledger is not None:
+            self.ledger.record(record)
+        # Keyed by outcome so a burst of attempts becomes one notification per outcome.
+        self.notifier.notify(
+            "Airdrop Tool",
+            f"Airdrop {outcome.kind} for {wallet_address}: {message}",
+            key=f"attempt-{outcome.kind}",
+        )
+        for listener in self.attempt_listeners:
+            try:
+                listener(record)
+            except Exception:
+                self.logger.warning("Attempt listener failed", exc_info=True)
+        return outcome
+    
+    def _next_eligible_at(self, outcome: Outcome, ended_at: float) -> float:
+        """
+        Work out when a wallet may be tried again after an attempt.
+        
+        A wait given by the server is followed exactly. Transient errors are
+        retried after ``transient_retry_seconds``, other outcomes after
+        ``retry_cooldown_seconds``, and an invalid address never.
+        """
+        if not outcome.is_retryable:
+            return math.inf
+        if outcome.retry_after is not None:
+            return ended_at + outcome.retry_after
+        if outcome.kind in TRANSIENT_OUTCOMES:
+            return ended_at + self.config.transient_retry_seconds
+        return ended_at + self.config.retry_cooldown_seconds
+    
+    def next_eligible_time(self, wallet_address: str) -> float:
+        """
+        Get the earliest time the wallet may be tried again.
+        
+        Args:
+            wallet_address: The Solana wallet address
             
-            self._human_type(wallet_input, wallet_address)
-            time.sleep(0.2)
+        Returns:
+            Unix timestamp, or 0 if the wallet has never been tried
+        """
+        return self.next_eligible.get(wallet_address, 0.0)
+    
+    def _interact_with_page(
+        self, page: Driver, wallet_address: str, cancel_token: CancellationToken
+    ) -> bool:
+        """
+        Fill in and submit the faucet form.
+        
+        Raises:
+            MissingElementsError: If form elements do not appear in time
+        """
+        form = FaucetPage(page, timeout=self.config.element_wait_timeout, cancel_token=cancel_token)
+        try:
+            form.resolve("amount_toggle", "wallet_input")
+            form.element("amount_toggle").click()
+            form.ready("amount_button").click()
             
-            submit_button = page.ele('xpath://*[@type="submit"]')
-            if not submit_button:
-                raise ValueError("Submit button not found during submission.")
-            submit_button.click()
+            wallet_input = form.element("wallet_input")
+            wallet_input.click()
+            self._human_type(wallet_input, wallet_address, cancel_token)
             
+            form.ready("submit_button").click()
             return True
             
+        except (OperationCancelled, MissingElementsError):
+            raise
         except Exception as e:
             self.logger.error(f"Error interacting with page: {e}")
             return False
     
-    def _check_airdrop_result(self, page: ChromiumPage, progress_callback: Callable[[str], None], attempt: int) -> bool:
+    def _check_airdrop_result(
+        self,
+        page: Driver,
+        progress_callback: Callable[[str], None],
+        attempt: int,
+        cancel_token: CancellationToken,
+    ) -> bool:
         """Check the result of the airdrop attempt."""
-        notification_element = None
-        for _ in range(10):
-            notification_element = page.ele('xpath:/html/body/section/main/form/div/ol/li/div')
-            if notification_element:
-                break
-            time.sleep(2)
-        
-        if notification_element:
-            message = notification_element.text
+        match = self.browser_utils.wait_for_any(
+            page,
+            [RESULT_XPATH],
+            timeout=self.config.result_check_timeout,
+            poll_interval=self.config.element_poll_interval,
+            cancel_token=cancel_token,
+            clock=self.clock,
+            tracer=self.tracer,
+        )
+        
+        if match:
+            message = match[1].text
         else:
             message = "Notification not found. Check manually."
         
         progress_callback(f"Status: {message}")
         self.logger.info(f"Attempt {attempt} completed: {message}")
         
-        return "success" in message.lower()
+        return classify(message).is_success
+    
+    def perform_bulk_airdrop(
+        self,
+        wallet_addresses: Iterable[str],
+        progress_callback: Optional[Callable[[str], None]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> List[BulkAirdropResult]:
+        """
+        Fund many wallets at once.
+        
+        With the RPC backend the requests are sent as JSON-RPC batches of
+        ``chunk_size`` calls; with the browser backend each wallet gets one
+        regular attempt in turn. The addresses are read lazily, a window at
+        a time, so a WalletImporter can be passed without loading the file.
+        
+        Args:
+            wallet_addresses: Wallet addresses to fund, e.g. a WalletImporter
+            progress_callback: Optional function to call with progress updates
+            chunk_size: Calls per batch, defaults to ``AppConfig.rpc_batch_size``
+            
+        Returns:
+            One result per address, in input order
+        """
+        # A token of its own, so a scheduled run's token stays attached to stop().
+        token = CancellationToken()
+        self.bulk_tokens.add(token)
+        try:
+            return self._perform_bulk_airdrop(wallet_addresses, progress_callback, chunk_size, token)
+        finally:
+            self.bulk_tokens.discard(token)
+    
+    def _perform_bulk_airdrop(
+        self,
+        wallet_addresses: Iterable[str],
+        progress_callback: Optional[Callable[[str], None]],
+        chunk_size: Optional[int],
+        token: CancellationToken,
+    ) -> List[BulkAirdropResult]:
+        """Fund many wallets under the given cancel token."""
+        report = progress_callback or (lambda message: None)
+        size = chunk_size or self.config.rpc_batch_size
+        results: List[BulkAirdropResult] = []
+        
+        # Read a window at a time so a streamed wallet list is never held whole.
+        for window in iter_chunks(wallet_addresses, max(size, BULK_WINDOW_SIZE)):
+            window_results: List[Optional[BulkAirdropResult]] = [None] * len(window)
+            valid_indexes = []
+            for index, address in enumerate(window):
+                if self.browser_utils.validate_wallet_address(address):
+                    valid_indexes.append(index)
+                else:
+                    window_results[index] = BulkAirdropResult(
+                        address, error="Invalid wallet address format."
+                    )
+            
+            valid_addresses = [window[index] for index in valid_indexes]
+            report(f"Status: Requesting airdrops for {len(valid_addresses)} wallets...")
+            funded = self._fund_wallets(valid_addresses, size, report, token)
+            for index, result in zip(valid_indexes, funded):
+                window_results[index] = result
+            results.extend(window_results)
+        
+        succeeded = sum(1 for result in results if result.success)
+        report(f"Status: Bulk airdrop finished: {succeeded}/{len(results)} successful.")
+        self.logger.info(f"Bulk airdrop finished: {succeeded}/{len(results)} successful.")
+        return results
+    
+    def _fund_wallets(
+        self,
+        addresses: List[str],
+        chunk_size: int,
+        report: Callable[[str], None],
+        token: CancellationToken,
+    ) -> List[BulkAirdropResult]:
+        """Fund valid wallets through the configured backend, one result per address."""
+        if self.rpc_backend is not None:
+            started_at = self.clock.time()
+            funded = self.rpc_backend.request_airdrops(addresses, chunk_size, token)
+            self.last_attempt_time = self.clock.time()
+            for result in funded:
+                if result.error == CANCELLED_MESSAGE:
+                    # Never tried, or abandoned before the outcome was known.
+                    continue
+                message = f"Signature: {result.signature}" if result.success else result.error
+                self._record_attempt(result.address, started_at, result.success, message or "")
+            return funded
+        
+        funded = []
+        for address in addresses:
+            if token.is_cancelled:
+                funded.append(BulkAirdropResult(address, error=CANCELLED_MESSAGE))
+            elif self.perform_airdrop(address, report, 1, token):
+                funded.append(BulkAirdropResult(address, signature=""))
+            else:
+                funded.append(BulkAirdropResult(address, error="Airdrop failed."))
+        return funded
+    
+    def create_scheduler(
+        self, progress_callback: Callable[[str], None], workers: Optional[int] = None
+    ) -> CooldownScheduler:
+        """
+        Create a scheduler that runs attempts for its wallets as their cooldowns expire.
+        
+        Args:
+            progress_callback: Function to call with progress updates
+            workers: Number of worker threads, defaults to ``AppConfig.scheduler_workers``
+            
+        Returns:
+            A CooldownScheduler that has not been started yet
+        """
+        def job(wallet_address: str) -> Optional[float]:
+            return self._run_scheduled_attempt(wallet_address, progress_callback)
+        
+        return CooldownScheduler(job, workers or self.config.scheduler_workers, clock=self.clock)
+    
+    def _run_scheduled_attempt(
+        self, wallet_address: str, progress_callback: Callable[[str], None]
+    ) -> Optional[float]:
+        """Run one attempt and return when the wallet is next due, or None once stopped."""
+        token = self.cancel_token
+        if token.is_cancelled:
+            return None
+        attempt = self.attempt_numbers.get(wallet_address, 0) + 1
+        self.attempt_numbers[wallet_address] = attempt
+        
+        success = self.perform_airdrop(wallet_address, progress_callback, attempt, token)
+        if token.is_cancelled:
+            return None
+        next_due = self.next_eligible_time(wallet_address)
+        if math.isinf(next_due):
+            progress_callback(f"Status: Attempt {attempt} failed. Not retrying this wallet.")
+            self.logger.info(f"Attempt {attempt} for {wallet_address} cannot succeed; not retrying.")
+            return None
+        wait_minutes = int(max(0.0, next_due - self.clock.time()) / 60)
+        
+        if success:
+            progress_callback(f"Status: Attempt {attempt} successful. Retrying...")
+            self.logger.info(f"Attempt {attempt} successful, proceeding to next attempt.")
+            next_due = max(next_due, self.clock.time() + self.config.success_wait_seconds)
+        else:
+            progress_callback(f"Status: Attempt {attempt} failed. Retrying in {wait_minutes} minutes.")
+            self.logger.info(f"Attempt {attempt} failed, retrying in {wait_minutes} minutes.")
+        return next_due
     
     def perform_airdrop_attempts(self, wallet_address: str, progress_callback: Callable[[str], None]) -> None:
         """
         Attempt the airdrop continuously with proper timing.
         
+        Blocks until stop() is called or the wallet can never succeed. Waiting
+        for the cooldown happens on a condition variable, and a running
+        attempt is cancelled, so stopping takes effect immediately.
+        
         Args:
             wallet_address: The Solana wallet address
             progress_callback: Function to call with progress updates
         """
-        attempt = 1
+        self.cancel_token = CancellationToken()
         
-        while True:
-            time_since_last_attempt = time.time() - self.last_attempt_time
-            if time_since_last_attempt < 3600:  # 1 hour cooldown
-                wait_minutes = int((3600 - time_since_last_attempt) / 60)
-                progress_callback(f"Status: Too soon to retry. Wait {wait_minutes} minutes.")
-                self.logger.info(f"Waiting for {wait_minutes} minutes before retrying.")
-                time.sleep(3600 - time_since_last_attempt)
-            
-            success = self.perform_airdrop(wallet_address, progress_callback, attempt)
-            
-            if success:
-                progress_callback(f"Status: Attempt {attempt} successful. Retrying...")
-                attempt += 1
-                self.logger.info(f"Attempt {attempt} successful, proceeding to next attempt.")
-                time.sleep(3)
-            else:
-                progress_callback(f"Status: Attempt {attempt} failed. Retrying after an hour.")
-                self.logger.info(f"Attempt {attempt} failed, retrying after an hour.")
-                time.sleep(3600)
\ No newline at end of file
+        def job(wallet: str) -> Optional[float]:
+            next_due = None
+            try:
+                next_due = self._run_scheduled_attempt(wallet, progress_callback)
+                return next_due
+            finally:
+                if next_due is None:
+                    # The only wallet was dropped, so nothing will ever come due again.
+                    scheduler.shutdown(wait=False)
+        
+        scheduler = CooldownScheduler(job, 1, clock=self.clock)
+        self.scheduler = scheduler
+        
+        next_due = self.next_eligible_time(wallet_address)
+        if math.isinf(next_due):
+            progress_callback("Status: The faucet rejected this wallet address. Not retrying.")
+            self.logger.info(f"Not retrying {wallet_address}: the faucet rejected the address.")
+            return
+        wait_seconds = next_due - self.clock.time()
+        if wait_seconds > 0:
+            wait_minutes = int(wait_seconds / 60)
+            progress_callback(f"Status: Too soon to retry. Wait {wait_minutes} minutes.")
+            self.logger.info(f"Waiting for {wait_minutes} minutes before retrying.")
+        
+        scheduler.schedule(wallet_address, next_due)
+        scheduler.start()
+        scheduler.join()
+    
+    def stop(self) -> None:
+        """
+        Stop all airdrop work.
+        
+        Cancels the current token and those of bulk runs, which interrupts
+        waits and quits any open browser, and shuts down the scheduler.
+        Returns without waiting; the worker threads exit within a few seconds.
+        """
+        self.cancel_token.cancel()
+        for token in list(self.bulk_tokens):
+            token.cancel()
+        if self.scheduler is not None:
+            self.scheduler.shutdown(wait=False)
+            self.scheduler = None
+    
+    def close(self) -> None:
+        """
+        Stop all work and release the browser pool, process watchdog, RPC
+        connections, ledger, metrics, notifier and tracer.
+        """
+        self.stop()
+        self.metrics.close()
+        self.notifier.close()
+        self.tracer.close()
+        if self.browser_pool is not None:
+            self.browser_pool.close()
+        if self.watchdog is not None:
+            self.watchdog.close()
+        if self.rpc_backend is not None:
+            self.rpc_backend.close()
+        if self.ledger is not None:
+            self.ledger.close()
+
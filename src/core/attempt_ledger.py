@@ -0,0 +1,195 @@
+"""
+Attempt Ledger - Persistent record of airdrop attempts.
+
+This module stores every attempt in a WAL-mode SQLite database so the tool
+knows, across restarts, when each wallet was last tried and when it may be
+tried again. Writes are queued and committed in batches by a background
+thread, so recording an attempt never blocks the caller on disk I/O.
+"""
+
+import json
+import logging
+import queue
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Union
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY,
+    wallet TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    ended_at REAL NOT NULL,
+    outcome TEXT NOT NULL,
+    message TEXT,
+    phases TEXT,
+    next_eligible_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_attempts_wallet_started ON attempts (wallet, started_at);
+CREATE INDEX IF NOT EXISTS idx_attempts_started ON attempts (started_at);
+"""
+
+_INSERT = """
+INSERT INTO attempts (wallet, started_at, ended_at, outcome, message, phases, next_eligible_at)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# SQLite returns the other columns from the row holding MAX(), so this is one
+# pass over the (wallet, started_at) index.
+_NEXT_ELIGIBLE = """
+SELECT wallet, next_eligible_at, MAX(started_at) FROM attempts GROUP BY wallet
+"""
+
+_STOP = object()
+
+
+@dataclass
+class AttemptRecord:
+    """One airdrop attempt."""
+
+    wallet: str
+    started_at: float
+    ended_at: float
+    outcome: str
+    message: str = ""
+    next_eligible_at: float = 0.0
+    phases: Dict[str, float] = field(default_factory=dict)
+
+
+class AttemptLedger:
+    """SQLite-backed attempt history with batched background writes."""
+
+    def __init__(self, path: Union[str, Path], batch_size: int = 100, flush_interval: float = 0.5):
+        """
+        Open (or create) the ledger database.
+
+        Args:
+            path: SQLite database file
+            batch_size: Maximum number of records committed per transaction
+            flush_interval: Maximum time in seconds a record waits before commit
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.logger = logging.getLogger(__name__)
+
+        self._reader = self._connect(check_same_thread=False)
+        self._reader.executescript(_SCHEMA)
+        self._reader_lock = threading.Lock()
+
+        self._queue: "queue.Queue[object]" = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="attempt-ledger", daemon=True)
+        self._writer.start()
+
+    def _connect(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        """Open a connection configured for WAL mode."""
+        connection = sqlite3.connect(str(self.path), check_same_thread=check_same_thread)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def record(self, record: AttemptRecord) -> None:
+        """
+        Queue an attempt for writing.
+
+        Args:
+            record: Attempt to store
+        """
+        self._queue.put(record)
+
+    def _write_loop(self) -> None:
+        """Commit queued records in batches until stopped."""
+        connection = self._connect()
+        try:
+            while True:
+                item = self._queue.get()
+                batch: List[AttemptRecord] = []
+                stop = item is _STOP
+                if not stop:
+                    batch.append(item)
+                while not stop and len(batch) < self.batch_size:
+                    try:
+                        item = self._queue.get(timeout=self.flush_interval)
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stop = True
+                    else:
+                        batch.append(item)
+
+                if batch:
+                    self._write_batch(connection, batch)
+                for _ in range(len(batch) + (1 if stop else 0)):
+                    self._queue.task_done()
+                if stop:
+                    return
+        finally:
+            connection.close()
+
+    def _write_batch(self, connection: sqlite3.Connection, batch: List[AttemptRecord]) -> None:
+        """Insert a batch of records in one transaction."""
+        rows = [
+            (
+                record.wallet,
+                record.started_at,
+                record.ended_at,
+                record.outcome,
+                record.message,
+                json.dumps(record.phases),
+                record.next_eligible_at,
+            )
+            for record in batch
+        ]
+        try:
+            with connection:
+                connection.executemany(_INSERT, rows)
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to write {len(rows)} attempt records: {e}")
+
+    def flush(self) -> None:
+        """Block until every queued record has been written."""
+        self._queue.join()
+
+    def next_eligible_times(self) -> Dict[str, float]:
+        """
+        Get the next eligible attempt time of every known wallet.
+
+        Returns:
+            Mapping of wallet address to Unix timestamp
+        """
+        with self._reader_lock:
+            rows = self._reader.execute(_NEXT_ELIGIBLE).fetchall()
+        return {wallet: next_eligible_at for wallet, next_eligible_at, _ in rows}
+
+    def history(self, wallet: str, limit: int = 50) -> List[AttemptRecord]:
+        """
+        Get the most recent attempts for a wallet.
+
+        Args:
+            wallet: Wallet address
+            limit: Maximum number of attempts to return
+
+        Returns:
+            Attempts, newest first
+        """
+        with self._reader_lock:
+            rows = self._reader.execute(
+                "SELECT wallet, started_at, ended_at, outcome, message, next_eligible_at, phases "
+                "FROM attempts WHERE wallet = ? ORDER BY started_at DESC LIMIT ?",
+                (wallet, limit),
+            ).fetchall()
+        return [
+            AttemptRecord(*row[:6], phases=json.loads(row[6]) if row[6] else {})
+            for row in rows
+        ]
+
+    def close(self) -> None:
+        """Write any queued records and close the database."""
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        with self._reader_lock:
+            self._reader.close()
@@ -0,0 +1,196 @@
+"""
+Browser Pool - Warm Chromium process shared across airdrop attempts.
+
+This module keeps one Chromium process running between attempts and hands
+each attempt a tab in its own fresh browser context, so attempts skip the
+cold start but never share cookies, storage or cache. The process is
+health-checked before every lease, recycled after a number of uses and shut
+down after sitting idle.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from ..utils.lazy_import import lazy_import
+from .process_watchdog import ProcessWatchdog
+
+ChromiumPage = lazy_import("DrissionPage", "ChromiumPage")
+ChromiumOptions = lazy_import("DrissionPage", "ChromiumOptions")
+
+
+class BrowserPool:
+    """Single warm Chromium process leasing one isolated tab per attempt."""
+
+    def __init__(
+        self,
+        options_factory: Callable[[], "ChromiumOptions"],
+        max_uses: int = 50,
+        idle_timeout: float = 300.0,
+        watchdog: Optional[ProcessWatchdog] = None,
+    ):
+        """
+        Initialize the pool. The browser is launched on first lease.
+
+        Args:
+            options_factory: Function that builds the options for a new browser
+            max_uses: Number of leases after which the browser is restarted,
+                bounding memory growth in a long-lived process
+            idle_timeout: Seconds without a lease after which the browser is
+                shut down; 0 keeps it running until close()
+            watchdog: Optional watchdog that accounts for the browser's
+                processes and kills any left running after it is quit
+        """
+        if max_uses < 1:
+            raise ValueError("max_uses must be at least 1")
+
+        self.options_factory = options_factory
+        self.max_uses = max_uses
+        self.idle_timeout = idle_timeout
+        self.watchdog = watchdog
+        self.logger = logging.getLogger(__name__)
+
+        self._browser: Optional["ChromiumPage"] = None
+        self._browser_pid: Optional[int] = None
+        self._uses = 0
+        self._active = 0
+        self._last_release = time.monotonic()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._reaper: Optional[threading.Thread] = None
+
+    @property
+    def uses(self) -> int:
+        """Number of leases served by the current browser process."""
+        with self._condition:
+            return self._uses
+
+    @contextmanager
+    def lease(self) -> Iterator[object]:
+        """
+        Lease a blank tab in a new, isolated browser context.
+
+        The context and everything in it is disposed when the block exits.
+
+        Yields:
+            A DrissionPage tab
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Browser pool is closed.")
+            browser = self._acquire_browser()
+            self._uses += 1
+            self._active += 1
+
+        tab = None
+        try:
+            tab = browser.new_tab(new_context=True)
+            yield tab
+        finally:
+            if tab is not None:
+                self.release(tab)
+            with self._condition:
+                self._active -= 1
+                self._last_release = time.monotonic()
+                self._condition.notify_all()
+
+    def release(self, tab) -> None:
+        """
+        Close a leased tab and dispose of its browser context.
+
+        Safe to call more than once and from another thread, e.g. to abort a
+        pending page operation on cancellation.
+        """
+        try:
+            context_id = tab.run_cdp("Target.getTargetInfo")["targetInfo"]["browserContextId"]
+        except Exception:
+            context_id = None
+        try:
+            tab.close()
+        except Exception:
+            pass
+        if context_id is None:
+            return
+        try:
+            tab.browser._run_cdp("Target.disposeBrowserContext", browserContextId=context_id)
+        except Exception as e:
+            self.logger.debug(f"Failed to dispose browser context: {e}")
+
+    def _acquire_browser(self) -> ChromiumPage:
+        """Return a healthy browser, restarting it when needed; the caller holds the lock."""
+        if self._browser is not None:
+            if self._uses >= self.max_uses and self._active == 0:
+                self.logger.info(f"Recycling browser after {self._uses} uses.")
+                self._quit_browser()
+            elif not self._is_healthy(self._browser):
+                self.logger.warning("Pooled browser is unresponsive; restarting it.")
+                self._quit_browser()
+
+        if self._browser is None:
+            self._browser = ChromiumPage(addr_or_opts=self.options_factory())
+            self._uses = 0
+            self._track(self._browser)
+            self._start_reaper()
+        return self._browser
+
+    def _is_healthy(self, browser: ChromiumPage) -> bool:
+        """Whether the browser process is alive and answering CDP calls."""
+        try:
+            if not browser.browser.states.is_alive:
+                return False
+            browser.browser._run_cdp("Browser.getVersion")
+            return True
+        except Exception:
+            return False
+
+    def _quit_browser(self) -> None:
+        """Quit the current browser; the caller holds the lock."""
+        browser, self._browser = self._browser, None
+        pid, self._browser_pid = self._browser_pid, None
+        self._uses = 0
+        if browser is None:
+            return
+        if pid is not None:
+            self.watchdog.snapshot(pid)
+        try:
+            browser.quit()
+        except Exception as e:
+            self.logger.warning(f"Failed to quit pooled browser: {e}")
+        if pid is not None:
+            self.watchdog.release(pid)
+
+    def _track(self, browser: ChromiumPage) -> None:
+        """Hand a new browser to the watchdog; the caller holds the lock."""
+        pid = getattr(browser, "process_id", None)
+        if self.watchdog is None or not isinstance(pid, int):
+            return
+        # The pool decides when the browser is restarted, not the lifetime limit.
+        self.watchdog.track(pid, label="pooled browser", lifetime=0)
+        self._browser_pid = pid
+
+    def _start_reaper(self) -> None:
+        """Start the idle-timeout thread if it is not running; the caller holds the lock."""
+        if self.idle_timeout <= 0 or (self._reaper is not None and self._reaper.is_alive()):
+            return
+        self._reaper = threading.Thread(target=self._reap_idle, name="browser-pool-reaper", daemon=True)
+        self._reaper.start()
+
+    def _reap_idle(self) -> None:
+        """Shut the browser down once it has been idle for ``idle_timeout`` seconds."""
+        with self._condition:
+            while not self._closed and self._browser is not None:
+                idle_for = time.monotonic() - self._last_release
+                if self._active == 0 and idle_for >= self.idle_timeout:
+                    self.logger.info("Shutting down idle pooled browser.")
+                    self._quit_browser()
+                    return
+                self._condition.wait(max(0.05, self.idle_timeout - idle_for))
+
+    def close(self) -> None:
+        """Quit the browser and refuse further leases."""
+        with self._condition:
+            self._closed = True
+            self._quit_browser()
+            self._condition.notify_all()
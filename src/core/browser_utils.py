@@ -7,16 +7,54 @@ including element interaction and validation.
 
 import random
 import time
-from typing import Optional
+from typing import Optional, Sequence, Tuple
 
-from DrissionPage import ChromiumPage
+from ..utils.config import get_config
+from .address_validator import validate_address
+from .cancellation import CancellationToken
+from .clock import SYSTEM_CLOCK, Clock
+from .driver import Driver
+from .tracing import NULL_TRACER, AnyTracer
+
+# Resolves with [index, element] for the first XPath that matches, re-checking
+# on every DOM mutation, or with null once the timeout expires.
+_MUTATION_WAIT_JS = """
+function(selectors, timeoutMs) {
+    const find = () => {
+        for (let i = 0; i < selectors.length; i++) {
+            const node = document.evaluate(
+                selectors[i], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+            ).singleNodeValue;
+            if (node) return [i, node];
+        }
+        return null;
+    };
+    return new Promise(resolve => {
+        const hit = find();
+        if (hit) { resolve(hit); return; }
+        let timer = null;
+        const observer = new MutationObserver(() => {
+            const match = find();
+            if (match) { observer.disconnect(); clearTimeout(timer); resolve(match); }
+        });
+        observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+        timer = setTimeout(() => { observer.disconnect(); resolve(null); }, timeoutMs);
+    });
+}
+"""
 
 
 class BrowserUtils:
     """Utility class for browser automation tasks."""
     
     @staticmethod
-    def human_type(element, text: str, min_delay: float = 0.05, max_delay: float = 0.1) -> None:
+    def human_type(
+        element,
+        text: str,
+        min_delay: float = 0.05,
+        max_delay: float = 0.1,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> None:
         """
         Simulate human typing by inputting text with random delays.
         
@@ -25,31 +63,104 @@ class BrowserUtils:
             text: Text to type
             min_delay: Minimum delay between keystrokes
             max_delay: Maximum delay between keystrokes
+            cancel_token: Optional token that aborts typing when cancelled
         """
         for char in text:
             element.input(char)
-            time.sleep(random.uniform(min_delay, max_delay))
+            SYSTEM_CLOCK.sleep(random.uniform(min_delay, max_delay), cancel_token)
     
     @staticmethod
-    def wait_for_element(page: ChromiumPage, xpath: str, timeout: int = 10) -> Optional[object]:
+    def wait_for_element(
+        page: Driver,
+        xpath: str,
+        timeout: int = 10,
+        cancel_token: Optional[CancellationToken] = None,
+        clock: Optional[Clock] = None,
+    ) -> Optional[object]:
         """
         Wait for an element to appear on the page.
         
+        Uses the MutationObserver wait of wait_for_any().
+        
         Args:
-            page: ChromiumPage instance
+            page: Browser page, usually a ChromiumPage
             xpath: XPath selector for the element
             timeout: Maximum time to wait in seconds
+            cancel_token: Optional token that aborts the wait when cancelled
+            clock: Time source for the polling fallback, defaults to the real clock
             
         Returns:
             Element if found, None otherwise
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            element = page.ele(f'xpath:{xpath}')
-            if element:
-                return element
-            time.sleep(0.5)
-        return None
+        match = BrowserUtils.wait_for_any(page, [xpath], timeout, cancel_token, clock=clock)
+        return match[1] if match else None
+    
+    @staticmethod
+    def wait_for_any(
+        page: Driver,
+        xpaths: Sequence[str],
+        timeout: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        poll_interval: Optional[float] = None,
+        clock: Optional[Clock] = None,
+        tracer: Optional[AnyTracer] = None,
+    ) -> Optional[Tuple[int, object]]:
+        """
+        Wait for the first of several elements to appear on the page.
+        
+        Installs a MutationObserver in the page so the wait resolves as soon
+        as the DOM changes, instead of polling with one round trip per check.
+        Falls back to polling if the script cannot run, e.g. when the page
+        navigates while waiting.
+        
+        Args:
+            page: Browser page, usually a ChromiumPage
+            xpaths: XPath selectors to wait for, in priority order
+            timeout: Maximum time to wait in seconds, defaults to
+                ``AppConfig.element_wait_timeout``
+            cancel_token: Optional token that aborts the wait when cancelled;
+                the in-page wait ends when the browser is quit on cancel
+            poll_interval: Seconds between checks when polling, defaults to
+                ``AppConfig.element_poll_interval``
+            clock: Time source for the polling fallback, defaults to the real clock
+            tracer: Optional tracer that records the wait and each poll as spans
+            
+        Returns:
+            Tuple of the matching selector's index and the element, or None
+        """
+        if timeout is None:
+            timeout = get_config().element_wait_timeout
+        if poll_interval is None:
+            poll_interval = get_config().element_poll_interval
+        clock = clock or SYSTEM_CLOCK
+        tracer = tracer or NULL_TRACER
+        deadline = clock.time() + timeout
+        
+        try:
+            with tracer.span("wait_for_any", cat="wait", selectors=len(xpaths), timeout=timeout) as span:
+                match = page.run_js(
+                    _MUTATION_WAIT_JS, list(xpaths), int(timeout * 1000), timeout=timeout + 5
+                )
+                span.set(found=bool(match))
+            if match:
+                return int(match[0]), match[1]
+            return None
+        except Exception:
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+        
+        poll = 0
+        while True:
+            poll += 1
+            with tracer.span("poll", cat="wait", poll=poll) as span:
+                for index, xpath in enumerate(xpaths):
+                    element = page.ele(f'xpath:{xpath}', timeout=0)
+                    if element:
+                        span.set(found=index)
+                        return index, element
+            if clock.time() >= deadline:
+                return None
+            clock.sleep(poll_interval, cancel_token)
     
     @staticmethod
     def safe_click(element, delay: float = 0.1) -> bool:
@@ -73,19 +184,14 @@ class BrowserUtils:
     @staticmethod
     def validate_wallet_address(address: str) -> bool:
         """
-        Validate a Solana wallet address format.
+        Validate a Solana wallet address.
+        
+        The address must be base58 and decode to an exact 32-byte public key.
         
         Args:
             address: Wallet address to validate
             
         Returns:
-            True if valid format, False otherwise
+            True if valid, False otherwise
         """
-        if not address:
-            return False
-        
-        if len(address) < 32 or len(address) > 44:
-            return False
-        
-        valid_chars = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
-        return all(c in valid_chars for c in address) 
\ No newline at end of file
+        return validate_address(address).valid
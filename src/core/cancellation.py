@@ -0,0 +1,99 @@
+"""
+Cancellation - Cooperative cancellation of running airdrop work.
+
+This module provides a token that long-running loops check and sleep on,
+so a stop request interrupts waits immediately and runs cleanup callbacks
+such as quitting the browser.
+"""
+
+import logging
+import threading
+from typing import Callable, List, Optional
+
+# Error reported for work that was never done or finished because its token was cancelled.
+CANCELLED_MESSAGE = "Cancelled."
+
+
+class OperationCancelled(Exception):
+    """Raised when work is abandoned because its token was cancelled."""
+
+
+class CancellationToken:
+    """Thread-safe flag with interruptible sleeps and cancel callbacks."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Whether cancel() has been called."""
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Cancel the token and run the registered callbacks once."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            self._run(callback)
+
+    def _run(self, callback: Callable[[], None]) -> None:
+        """Run a cancel callback, logging rather than raising its errors."""
+        try:
+            callback()
+        except Exception:
+            self.logger.warning("Cancel callback failed", exc_info=True)
+
+    def register(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        Run a callback when the token is cancelled.
+
+        The callback runs on the cancelling thread, or immediately if the
+        token is already cancelled.
+
+        Args:
+            callback: Function to call on cancellation
+
+        Returns:
+            Function that unregisters the callback
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._unregister(callback)
+        self._run(callback)
+        return lambda: None
+
+    def _unregister(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the token is cancelled or the timeout expires.
+
+        Returns:
+            True if the token was cancelled
+        """
+        return self._event.wait(timeout)
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Sleep for the given time unless cancelled first.
+
+        Raises:
+            OperationCancelled: If the token is or becomes cancelled
+        """
+        if self._event.wait(max(0.0, seconds)):
+            raise OperationCancelled()
+
+    def raise_if_cancelled(self) -> None:
+        """Raise OperationCancelled if the token has been cancelled."""
+        if self._event.is_set():
+            raise OperationCancelled()
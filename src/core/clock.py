@@ -0,0 +1,54 @@
+"""
+Clock - Time source for attempt timing, cooldowns and waits.
+
+Everything that reads the time or sleeps during an attempt goes through a
+``Clock``, so tests can substitute a virtual clock and run hours of retry
+schedule in milliseconds.
+"""
+
+import threading
+import time
+from typing import Optional
+
+from .cancellation import CancellationToken
+
+
+class Clock:
+    """The real clock: wall time, monotonic time and cancellable sleeps."""
+
+    def time(self) -> float:
+        """Current Unix timestamp."""
+        return time.time()
+
+    def monotonic(self) -> float:
+        """Seconds from an arbitrary start, for measuring durations."""
+        return time.monotonic()
+
+    def sleep(self, seconds: float, cancel_token: Optional[CancellationToken] = None) -> None:
+        """
+        Sleep for the given time.
+
+        Args:
+            seconds: Time to sleep
+            cancel_token: Optional token that ends the sleep when cancelled
+
+        Raises:
+            OperationCancelled: If the token is or becomes cancelled
+        """
+        if cancel_token is not None:
+            cancel_token.sleep(seconds)
+        else:
+            time.sleep(max(0.0, seconds))
+
+    def wait(self, condition: threading.Condition, timeout: Optional[float]) -> bool:
+        """
+        Wait on a condition the caller holds until notified or the timeout expires.
+
+        Returns:
+            False if the timeout expired, True otherwise
+        """
+        return condition.wait(timeout)
+
+
+# Shared default; the real clock has no state.
+SYSTEM_CLOCK = Clock()
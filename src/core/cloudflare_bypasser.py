@@ -5,27 +5,46 @@ This module provides functionality to automatically bypass Cloudflare
 verification challenges using browser automation.
 """
 
-import time
 from typing import Optional
 
-from DrissionPage import ChromiumPage
+from .cancellation import CancellationToken
+from .clock import SYSTEM_CLOCK, Clock
+from .driver import Driver
+from .tracing import NULL_TRACER, AnyTracer
 
 
 class CloudflareBypasser:
     """Handles bypassing Cloudflare verification challenges."""
     
-    def __init__(self, driver: ChromiumPage, max_retries: int = -1, log: bool = True):
+    def __init__(
+        self,
+        driver: Driver,
+        max_retries: int = -1,
+        retry_interval: float = 2.0,
+        log: bool = True,
+        cancel_token: Optional[CancellationToken] = None,
+        clock: Optional[Clock] = None,
+        tracer: Optional[AnyTracer] = None,
+    ):
         """
         Initialize the Cloudflare bypasser.
         
         Args:
-            driver: ChromiumPage instance
+            driver: Browser page, usually a ChromiumPage
             max_retries: Maximum number of retry attempts (-1 for unlimited)
+            retry_interval: Seconds to wait after each verification click
             log: Whether to enable logging
+            cancel_token: Optional token that aborts the bypass loop when cancelled
+            clock: Time source for the waits between clicks, defaults to the real clock
+            tracer: Optional tracer that records each bypass iteration as a span
         """
         self.driver = driver
         self.max_retries = max_retries
+        self.retry_interval = retry_interval
         self.log = log
+        self.cancel_token = cancel_token or CancellationToken()
+        self.clock = clock or SYSTEM_CLOCK
+        self.tracer = tracer or NULL_TRACER
 
     def search_recursively_shadow_root_with_iframe(self, ele) -> Optional[object]:
         """
@@ -138,19 +157,24 @@ class CloudflareBypasser:
         
         Returns:
             True if successful, False otherwise
+            
+        Raises:
+            OperationCancelled: If the cancel token is cancelled while waiting
         """
         try_count = 0
 
         while not self.is_bypassed():
+            self.cancel_token.raise_if_cancelled()
             if 0 < self.max_retries + 1 <= try_count:
                 self.log_message("Exceeded maximum retries. Bypass failed.")
                 return False
 
-            self.log_message(f"Attempt {try_count + 1}: Verification page detected. Trying to bypass...")
-            self.click_verification_button()
+            with self.tracer.span("bypass_iteration", iteration=try_count + 1):
+                self.log_message(f"Attempt {try_count + 1}: Verification page detected. Trying to bypass...")
+                self.click_verification_button()
 
-            try_count += 1
-            time.sleep(2)
+                try_count += 1
+                self.clock.sleep(self.retry_interval, self.cancel_token)
 
         if self.is_bypassed():
             self.log_message("Bypass successful.")
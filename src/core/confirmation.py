@@ -0,0 +1,327 @@
+"""
+Confirmation Tracker - Event-driven transaction confirmation.
+
+This module waits for airdrop transactions to reach a commitment level.
+It subscribes to ``signatureSubscribe`` notifications over the validator's
+websocket and falls back to batched ``getSignatureStatuses`` polling with
+adaptive backoff when the websocket is unavailable or quiet.
+"""
+
+import json
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from .cancellation import CANCELLED_MESSAGE, CancellationToken, OperationCancelled
+from .clock import SYSTEM_CLOCK, Clock
+from .rpc_client import RpcError, SolanaRpcClient
+
+COMMITMENT_LEVELS = ("processed", "confirmed", "finalized")
+
+_COMMITMENT_RANK = {level: rank for rank, level in enumerate(COMMITMENT_LEVELS)}
+
+# getSignatureStatuses accepts at most this many signatures per call.
+MAX_STATUS_BATCH = 256
+
+# Set once the missing websocket-client package has been reported.
+_warned_no_websocket = False
+
+
+@dataclass
+class ConfirmationResult:
+    """Final state of a tracked signature."""
+
+    signature: str
+    confirmed: bool = False
+    commitment: Optional[str] = None
+    error: Optional[str] = None
+    elapsed: Optional[float] = None
+
+
+def derive_websocket_url(rpc_url: str) -> str:
+    """
+    Derive the websocket endpoint from an HTTP RPC URL.
+
+    Solana validators serve the websocket API on the RPC port plus one.
+
+    Args:
+        rpc_url: HTTP(S) JSON-RPC endpoint
+
+    Returns:
+        The matching ws:// or wss:// URL
+    """
+    parts = urlsplit(rpc_url)
+    scheme = "wss" if parts.scheme == "https" else "ws"
+    netloc = parts.hostname or ""
+    if parts.port:
+        netloc = f"{netloc}:{parts.port + 1}"
+    return urlunsplit((scheme, netloc, parts.path, parts.query, ""))
+
+
+class ConfirmationTracker:
+    """Tracks signatures until they reach the requested commitment level."""
+
+    def __init__(
+        self,
+        client: SolanaRpcClient,
+        ws_url: Optional[str] = None,
+        commitment: str = "confirmed",
+        timeout: float = 30.0,
+        min_poll_interval: float = 0.05,
+        max_poll_interval: float = 2.0,
+        history_size: int = 1000,
+        clock: Optional[Clock] = None,
+    ):
+        """
+        Initialize the confirmation tracker.
+
+        Args:
+            client: RPC client used for status polling
+            ws_url: Websocket endpoint, or None to poll only
+            commitment: Commitment level that resolves a signature
+            timeout: Default time to wait for confirmation in seconds
+            min_poll_interval: First and smallest polling interval in seconds
+            max_poll_interval: Largest polling interval in seconds
+            history_size: Number of recent time-to-confirm samples kept
+            clock: Time source for deadlines and poll waits, defaults to the real clock
+        """
+        if commitment not in COMMITMENT_LEVELS:
+            raise ValueError(f"Unknown commitment level: {commitment}")
+
+        self.client = client
+        self.ws_url = ws_url
+        self.commitment = commitment
+        self.timeout = timeout
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.clock = clock or SYSTEM_CLOCK
+        self.logger = logging.getLogger(__name__)
+        self._latencies: Deque[float] = deque(maxlen=history_size)
+        self._latency_lock = threading.Lock()
+
+    def wait_for(
+        self,
+        signatures: Iterable[str],
+        timeout: Optional[float] = None,
+        submitted_at: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Dict[str, ConfirmationResult]:
+        """
+        Wait until every signature is confirmed, has failed, or times out.
+
+        Args:
+            signatures: Transaction signatures to track
+            timeout: Time to wait in seconds, defaults to the tracker timeout
+            submitted_at: The tracker clock's ``monotonic()`` when the transactions
+                were sent, used as the start of time-to-confirm; defaults to now
+            cancel_token: Optional token that ends the wait early; signatures
+                still pending are reported as cancelled
+
+        Returns:
+            Result for each signature
+        """
+        now = self.clock.monotonic()
+        start = submitted_at if submitted_at is not None else now
+        deadline = now + (self.timeout if timeout is None else timeout)
+        results = {signature: ConfirmationResult(signature) for signature in signatures}
+        pending = set(results)
+        token = cancel_token or CancellationToken()
+
+        if pending and self.ws_url:
+            try:
+                self._wait_websocket(results, pending, start, deadline, token)
+            except ImportError:
+                self._warn_no_websocket()
+            except Exception as e:
+                self.logger.warning(f"Signature subscription failed, polling instead: {e}")
+
+        if pending and not token.is_cancelled:
+            self._wait_polling(results, pending, start, deadline, token)
+
+        error = CANCELLED_MESSAGE if token.is_cancelled else "Timed out waiting for confirmation."
+        for signature in pending:
+            results[signature].error = error
+        return results
+
+    def _resolve(
+        self,
+        result: ConfirmationResult,
+        pending: set,
+        start: float,
+        commitment: Optional[str],
+        error: Optional[Any] = None,
+    ) -> None:
+        """Mark a signature as resolved and record its time-to-confirm."""
+        result.elapsed = self.clock.monotonic() - start
+        result.commitment = commitment
+        if error is not None:
+            result.error = f"Transaction failed: {error}"
+        else:
+            result.confirmed = True
+            with self._latency_lock:
+                self._latencies.append(result.elapsed)
+        pending.discard(result.signature)
+
+    def _reached(self, status: Dict[str, Any]) -> Optional[str]:
+        """
+        Return the status's commitment level if it meets the target, else None.
+
+        A level this tracker does not know counts as not reached, so the
+        signature stays pending until a known level or the deadline.
+        """
+        level = status.get("confirmationStatus")
+        if level is None:
+            # Nodes that omit confirmationStatus report finalized as null confirmations.
+            level = "finalized" if status.get("confirmations") is None else "processed"
+        if _COMMITMENT_RANK.get(level, -1) >= _COMMITMENT_RANK[self.commitment]:
+            return level
+        return None
+
+    def _poll_once(self, results: Dict[str, ConfirmationResult], pending: set, start: float) -> bool:
+        """
+        Query the status of all pending signatures.
+
+        Returns:
+            True if at least one signature was resolved
+        """
+        resolved = False
+        ordered = sorted(pending)
+        for offset in range(0, len(ordered), MAX_STATUS_BATCH):
+            chunk = ordered[offset:offset + MAX_STATUS_BATCH]
+            response = self.client.call("getSignatureStatuses", [chunk])
+            statuses = (response or {}).get("value") or []
+            for signature, status in zip(chunk, statuses):
+                if not status:
+                    continue
+                if status.get("err") is not None:
+                    level = status.get("confirmationStatus")
+                    self._resolve(results[signature], pending, start, level, status["err"])
+                    resolved = True
+                    continue
+                level = self._reached(status)
+                if level:
+                    self._resolve(results[signature], pending, start, level)
+                    resolved = True
+        return resolved
+
+    def _wait_polling(
+        self,
+        results: Dict[str, ConfirmationResult],
+        pending: set,
+        start: float,
+        deadline: float,
+        cancel_token: CancellationToken,
+    ) -> None:
+        """Poll with an interval that grows while nothing changes and resets on progress."""
+        interval = self.min_poll_interval
+        while pending:
+            try:
+                progressed = self._poll_once(results, pending, start)
+            except RpcError as e:
+                self.logger.warning(f"Status poll failed: {e}")
+                progressed = False
+            if not pending:
+                return
+
+            interval = self.min_poll_interval if progressed else min(interval * 2, self.max_poll_interval)
+            remaining = deadline - self.clock.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                self.clock.sleep(min(interval, remaining), cancel_token)
+            except OperationCancelled:
+                return
+
+    def _warn_no_websocket(self) -> None:
+        """Report once per process that confirmations fall back to polling."""
+        global _warned_no_websocket
+        if not _warned_no_websocket:
+            _warned_no_websocket = True
+            self.logger.warning(
+                "websocket-client is not installed; confirmations are polled instead of "
+                "subscribed. Install it with: pip install websocket-client"
+            )
+
+    def _wait_websocket(
+        self,
+        results: Dict[str, ConfirmationResult],
+        pending: set,
+        start: float,
+        deadline: float,
+        cancel_token: CancellationToken,
+    ) -> None:
+        """Subscribe to every pending signature and resolve them from notifications."""
+        import websocket
+
+        connect_timeout = max(0.1, min(self.max_poll_interval, deadline - self.clock.monotonic()))
+        ws = websocket.create_connection(self.ws_url, timeout=connect_timeout)
+        unregister = cancel_token.register(ws.abort)
+        try:
+            requests: Dict[int, str] = {}
+            for request_id, signature in enumerate(sorted(pending), start=1):
+                requests[request_id] = signature
+                ws.send(json.dumps({
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "method": "signatureSubscribe",
+                    "params": [signature, {"commitment": self.commitment}],
+                }))
+
+            subscriptions: Dict[int, str] = {}
+            acknowledged = False
+            while pending and not cancel_token.is_cancelled:
+                remaining = deadline - self.clock.monotonic()
+                if remaining <= 0:
+                    return
+                ws.settimeout(min(remaining, self.max_poll_interval))
+                try:
+                    message = json.loads(ws.recv())
+                except websocket.WebSocketTimeoutException:
+                    # Quiet socket: poll in case a notification was missed.
+                    self._poll_once(results, pending, start)
+                    continue
+
+                if "id" in message and message["id"] in requests:
+                    signature = requests.pop(message["id"])
+                    if "error" in message:
+                        raise RpcError(message["error"].get("message", "Subscription failed"))
+                    subscriptions[message["result"]] = signature
+                    if not requests and not acknowledged:
+                        # Catch signatures that confirmed before the subscriptions existed.
+                        acknowledged = True
+                        self._poll_once(results, pending, start)
+                elif message.get("method") == "signatureNotification":
+                    params = message.get("params") or {}
+                    signature = subscriptions.get(params.get("subscription"))
+                    value = (params.get("result") or {}).get("value")
+                    if signature not in pending or not isinstance(value, dict):
+                        continue
+                    self._resolve(results[signature], pending, start, self.commitment, value.get("err"))
+        finally:
+            unregister()
+            ws.close()
+
+    def _percentile(self, samples: List[float], percentile: float) -> Optional[float]:
+        """Return the nearest-rank percentile of sorted samples."""
+        if not samples:
+            return None
+        rank = max(1, int(round(percentile / 100 * len(samples))))
+        return samples[min(rank, len(samples)) - 1]
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """
+        Summarize recent time-to-confirm samples.
+
+        Returns:
+            Dictionary with the sample count and p50/p99 latency in seconds
+        """
+        with self._latency_lock:
+            samples = sorted(self._latencies)
+        return {
+            "count": len(samples),
+            "p50": self._percentile(samples, 50),
+            "p99": self._percentile(samples, 99),
+        }
@@ -0,0 +1,79 @@
+"""
+Driver - The browser interface the airdrop code depends on.
+
+``AirdropManager``, ``CloudflareBypasser``, ``BrowserUtils`` and
+``FaucetPage`` only use the small part of DrissionPage's ``ChromiumPage``
+described here, so anything with the same methods can drive an attempt:
+a real browser, a pooled tab, or an in-memory fake in the tests.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from typing import Protocol
+except ImportError:  # Python < 3.8
+    from typing_extensions import Protocol
+
+
+class Element(Protocol):
+    """A page element as returned by ``Driver.ele``."""
+
+    @property
+    def text(self) -> str:
+        """Visible text of the element."""
+
+    @property
+    def attrs(self) -> Dict[str, str]:
+        """Attributes of the element."""
+
+    @property
+    def shadow_root(self) -> Optional[Any]:
+        """The element's shadow root, or None if it has none."""
+
+    def click(self) -> Any:
+        """Click the element."""
+
+    def input(self, text: str) -> Any:
+        """Type text into the element."""
+
+    def children(self) -> List["Element"]:
+        """Child elements."""
+
+    def parent(self) -> "Element":
+        """Parent element."""
+
+    def ele(self, locator: str, timeout: Optional[float] = None) -> Optional["Element"]:
+        """First descendant matching a locator."""
+
+    def __call__(self, locator: str) -> Optional["Element"]:
+        """Shorthand for ``ele(locator)``."""
+
+
+class Driver(Protocol):
+    """A browser page: navigation, element lookup and script evaluation."""
+
+    @property
+    def title(self) -> str:
+        """Title of the current document."""
+
+    def get(self, url: str, timeout: Optional[float] = None) -> Any:
+        """Navigate to a URL."""
+
+    def ele(self, locator: str, timeout: Optional[float] = None) -> Optional[Element]:
+        """
+        First element matching a DrissionPage locator such as
+        ``xpath://input`` or ``tag:body``, or a falsy value if none does.
+        """
+
+    def eles(self, locator: str) -> List[Element]:
+        """All elements matching a locator."""
+
+    def run_js(self, script: str, *args: Any, timeout: Optional[float] = None) -> Any:
+        """Call a JavaScript function with the arguments and return its result."""
+
+    def quit(self) -> None:
+        """Close the browser."""
+
+
+# Opens a new driver for one attempt; the caller quits it afterwards.
+DriverFactory = Callable[[], Driver]
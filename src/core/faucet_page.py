@@ -0,0 +1,168 @@
+"""
+Faucet Page - Page object for the faucet form.
+
+This module declares the selectors of the faucet form in one place and
+resolves them together: a single in-page script evaluates every XPath,
+waits on a MutationObserver until the elements an action needs are present,
+visible and enabled, and returns all handles at once. Handles are cached for
+the lifetime of the page, and a failed lookup names exactly the selectors
+that are missing.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+from .cancellation import CancellationToken
+from .driver import Driver
+
+# Selectors of the faucet form, in the order the form is filled in.
+FORM_SELECTORS: Dict[str, str] = {
+    "amount_toggle": '//*[@type="button"]',
+    "amount_button": '//*[@type="button" and text()="5"]',
+    "wallet_input": '//*[@placeholder="Wallet Address"]',
+    "submit_button": '//*[@type="submit"]',
+}
+
+# The notification the faucet shows after a request.
+RESULT_XPATH = "/html/body/section/main/form/div/ol/li/div"
+
+# Resolves with [nodes, ready]: the first match of every XPath (or null) and
+# whether it is visible and enabled. Waits, re-checking on every DOM
+# mutation, until the elements at the ``required`` indexes are ready or the
+# timeout expires.
+_RESOLVE_JS = """
+function(selectors, required, timeoutMs) {
+    const find = () => selectors.map(xpath => document.evaluate(
+        xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue);
+    const isReady = node => node !== null && node.getClientRects().length > 0 && !node.disabled;
+    const report = nodes => [nodes, nodes.map(isReady)];
+    const done = nodes => required.every(i => isReady(nodes[i]));
+    return new Promise(resolve => {
+        const nodes = find();
+        if (done(nodes) || timeoutMs <= 0) { resolve(report(nodes)); return; }
+        let timer = null;
+        const observer = new MutationObserver(() => {
+            const current = find();
+            if (done(current)) { observer.disconnect(); clearTimeout(timer); resolve(report(current)); }
+        });
+        observer.observe(document, {childList: true, subtree: true, attributes: true});
+        timer = setTimeout(() => { observer.disconnect(); resolve(report(find())); }, timeoutMs);
+    });
+}
+"""
+
+
+class MissingElementsError(LookupError):
+    """Raised when form elements are not found or not ready in time."""
+
+    def __init__(self, missing: Sequence[str]):
+        super().__init__(f"Faucet form elements not found: {', '.join(missing)}")
+        self.missing = list(missing)
+
+
+class FaucetPage:
+    """Page object for the faucet form with batched, cached element lookups."""
+
+    def __init__(
+        self,
+        page: Driver,
+        timeout: float = 10.0,
+        cancel_token: Optional[CancellationToken] = None,
+        selectors: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize the page object. Nothing is looked up until first use.
+
+        Args:
+            page: Browser page or tab showing the faucet
+            timeout: Seconds to wait for elements to become ready
+            cancel_token: Optional token checked after every in-page wait;
+                the wait itself ends when the browser is quit on cancel
+            selectors: Element names to XPaths, defaults to ``FORM_SELECTORS``
+        """
+        self.page = page
+        self.timeout = timeout
+        self.cancel_token = cancel_token
+        self.selectors = dict(FORM_SELECTORS if selectors is None else selectors)
+        self.round_trips = 0
+        self._handles: Dict[str, object] = {}
+
+    def resolve(self, *required: str, timeout: Optional[float] = None) -> List[str]:
+        """
+        Look up every selector in one script evaluation and cache the handles.
+
+        Args:
+            *required: Names of elements to wait for until they are visible
+                and enabled; with none, returns after a single lookup
+            timeout: Seconds to wait, defaults to the page object's timeout
+
+        Returns:
+            Names of the selectors that matched nothing
+        """
+        unknown = [name for name in required if name not in self.selectors]
+        if unknown:
+            raise KeyError(f"Unknown form elements: {', '.join(unknown)}")
+
+        names = list(self.selectors)
+        wait = self.timeout if timeout is None else timeout
+        self.round_trips += 1
+        try:
+            nodes, ready = self.page.run_js(
+                _RESOLVE_JS,
+                [self.selectors[name] for name in names],
+                [names.index(name) for name in required],
+                int(wait * 1000) if required else 0,
+                timeout=wait + 5,
+            )
+        finally:
+            # A cancelled attempt quits the browser, which fails the pending call.
+            if self.cancel_token is not None:
+                self.cancel_token.raise_if_cancelled()
+
+        self._handles = {name: node for name, node in zip(names, nodes) if node}
+        not_ready = [name for name in required if not ready[names.index(name)]]
+        if not_ready:
+            raise MissingElementsError(not_ready)
+        return [name for name in names if name not in self._handles]
+
+    def element(self, name: str) -> object:
+        """
+        Get a form element, from the cache when it has been resolved before.
+
+        Args:
+            name: Element name from the selectors
+
+        Returns:
+            The element handle
+
+        Raises:
+            MissingElementsError: If the element does not become ready in time
+        """
+        handle = self._handles.get(name)
+        if handle is None:
+            self.resolve(name)
+            handle = self._handles[name]
+        return handle
+
+    def ready(self, name: str) -> object:
+        """
+        Wait until an element is visible and enabled, then return it.
+
+        Use this after an action that changes the form, such as opening the
+        amount menu, instead of sleeping for a fixed time.
+
+        Args:
+            name: Element name from the selectors
+
+        Returns:
+            The element handle
+
+        Raises:
+            MissingElementsError: If the element does not become ready in time
+        """
+        self.resolve(name)
+        return self._handles[name]
+
+    def invalidate(self) -> None:
+        """Forget cached handles, e.g. after the page navigated."""
+        self._handles.clear()
@@ -0,0 +1,196 @@
+"""
+HTTP Client - Pooled keep-alive HTTP client.
+
+This module provides a small thread-safe HTTP client that keeps a pool of
+persistent connections to a single host, so repeated JSON requests skip the
+TCP (and TLS) handshake.
+"""
+
+import http.client
+import json
+import queue
+import select
+import threading
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+
+class HttpError(Exception):
+    """Raised when a request fails or the server returns an error status."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+def _is_dropped(connection: http.client.HTTPConnection) -> bool:
+    """Whether an idle connection was closed by the server (its socket reads EOF)."""
+    if connection.sock is None:
+        return False
+    try:
+        readable, _, _ = select.select([connection.sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    # An idle keep-alive socket has nothing to read unless the server hung up.
+    return bool(readable)
+
+
+class HttpClient:
+    """Thread-safe HTTP client with a pool of keep-alive connections to one host."""
+
+    _STALE_ERRORS = (
+        http.client.RemoteDisconnected,
+        http.client.CannotSendRequest,
+        BrokenPipeError,
+        ConnectionResetError,
+        ConnectionAbortedError,
+    )
+
+    def __init__(self, base_url: str, timeout: float = 10.0, pool_size: int = 4):
+        """
+        Initialize the HTTP client.
+
+        Args:
+            base_url: Base URL of the server (scheme, host, port and optional path)
+            timeout: Socket timeout in seconds for each request
+            pool_size: Maximum number of idle connections kept open
+        """
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported URL: {base_url}")
+
+        self.base_url = base_url
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._scheme = parts.scheme
+        self._host = parts.hostname
+        self._port = parts.port
+        # The query string carries credentials on many hosted RPC endpoints (?api-key=...).
+        self._path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        self._pool: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        """Open a new connection to the configured host."""
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(self._host, self._port, timeout=self.timeout)
+        return http.client.HTTPConnection(self._host, self._port, timeout=self.timeout)
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        """Take an idle connection from the pool, or open a new one."""
+        while True:
+            try:
+                connection = self._pool.get_nowait()
+            except queue.Empty:
+                return self._new_connection()
+            if not _is_dropped(connection):
+                return connection
+            connection.close()
+
+    def _release(self, connection: http.client.HTTPConnection) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        with self._lock:
+            if not self._closed and self._pool.qsize() < self.pool_size:
+                self._pool.put_nowait(connection)
+                return
+        connection.close()
+
+    def request(
+        self,
+        method: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        path: Optional[str] = None,
+    ) -> bytes:
+        """
+        Send a request and return the response body.
+
+        Idle connections the server has closed are discarded before use. A
+        request that still fails to send on a reused connection is retried
+        once on a fresh one; once it has been sent it is never resent, since
+        the server may already have acted on it.
+
+        Args:
+            method: HTTP method
+            body: Request body
+            headers: Extra request headers
+            path: Request path, defaults to the path of the base URL
+
+        Returns:
+            Raw response body
+
+        Raises:
+            HttpError: If the request fails or the server returns a 4xx/5xx status
+        """
+        if self._closed:
+            raise HttpError("Client is closed.")
+
+        request_headers = {"Connection": "keep-alive"}
+        if headers:
+            request_headers.update(headers)
+
+        for retry in (True, False):
+            connection = self._acquire()
+            reused = connection.sock is not None
+            try:
+                connection.request(method, path or self._path, body=body, headers=request_headers)
+            except self._STALE_ERRORS as e:
+                connection.close()
+                if retry and reused:
+                    continue
+                raise HttpError(f"Connection error: {e}") from e
+            except (OSError, http.client.HTTPException) as e:
+                connection.close()
+                raise HttpError(f"Request failed: {e}") from e
+
+            try:
+                response = connection.getresponse()
+                data = response.read()
+            except self._STALE_ERRORS as e:
+                connection.close()
+                raise HttpError(f"Connection error: {e}") from e
+            except (OSError, http.client.HTTPException) as e:
+                connection.close()
+                raise HttpError(f"Request failed: {e}") from e
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(connection)
+
+            if response.status >= 400:
+                raise HttpError(f"HTTP {response.status}: {response.reason}", response.status)
+            return data
+
+        raise HttpError("Request failed after retry.")
+
+    def post_json(self, payload: Any, path: Optional[str] = None) -> Any:
+        """
+        POST a JSON payload and decode the JSON response.
+
+        Args:
+            payload: JSON-serializable request body
+            path: Request path, defaults to the path of the base URL
+
+        Returns:
+            Decoded JSON response
+        """
+        body = json.dumps(payload).encode("utf-8")
+        data = self.request(
+            "POST", body=body, headers={"Content-Type": "application/json"}, path=path
+        )
+        try:
+            return json.loads(data) if data else None
+        except ValueError as e:
+            raise HttpError(f"Invalid JSON response: {e}") from e
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
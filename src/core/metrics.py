@@ -0,0 +1,359 @@
+"""
+Metrics - Attempt counters and per-phase latency histograms.
+
+This module records how many attempts ran, how they ended and how long each
+phase took. Metrics can be scraped in the Prometheus text format from a
+local ``/metrics`` endpoint and written periodically to a JSON snapshot
+file. When metrics are disabled the manager gets a no-op implementation, so
+instrumented code pays for one empty method call per attempt.
+"""
+
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from ..utils.config import AppConfig
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    """Render a Prometheus label set such as ``{phase="interact",le="0.5"}``."""
+    parts = [f'{name}="{value}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Counter:
+    """Monotonically increasing count per label set."""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Add to the count of a label set."""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        """Return the current count of a label set."""
+        with self._lock:
+            return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        """Render the counter in the Prometheus text format."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+    def snapshot(self) -> List[Dict[str, object]]:
+        """Return the counter as JSON-serializable samples."""
+        with self._lock:
+            return [
+                {"labels": dict(zip(self.labelnames, labels)), "value": value}
+                for labels, value in sorted(self._values.items())
+            ]
+
+
+class Histogram:
+    """Bucketed distribution of observed values per label set."""
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [non-cumulative bucket counts..., +Inf count], sum.
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record one value for a label set."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def count(self, *labels: str) -> int:
+        """Return the number of observations of a label set."""
+        with self._lock:
+            series = self._series.get(labels)
+            return sum(series[0]) if series else 0
+
+    def render(self) -> List[str]:
+        """Render the histogram in the Prometheus text format."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labels, (counts, total) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else _format_value(bound)
+                    label_text = _format_labels(self.labelnames, labels, f'le="{le}"')
+                    lines.append(f"{self.name}_bucket{label_text} {cumulative}")
+                label_text = _format_labels(self.labelnames, labels)
+                lines.append(f"{self.name}_sum{label_text} {_format_value(total[0])}")
+                lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+    def snapshot(self) -> List[Dict[str, object]]:
+        """Return the histogram as JSON-serializable samples."""
+        with self._lock:
+            return [
+                {
+                    "labels": dict(zip(self.labelnames, labels)),
+                    "buckets": dict(zip([str(b) for b in self.buckets] + ["+Inf"], counts)),
+                    "sum": total[0],
+                    "count": sum(counts),
+                }
+                for labels, (counts, total) in sorted(self._series.items())
+            ]
+
+
+class MetricsRegistry:
+    """Named collection of counters and histograms."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Union[Counter, Histogram]] = {}
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Create and register a counter."""
+        metric = Counter(name, help_text, labelnames)
+        self._metrics[name] = metric
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        metric = Histogram(name, help_text, labelnames, buckets)
+        self._metrics[name] = metric
+        return metric
+
+    def render_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, object]:
+        """Return every metric as a JSON-serializable dictionary."""
+        return {
+            "timestamp": time.time(),
+            "metrics": {
+                name: {
+                    "type": "counter" if isinstance(metric, Counter) else "histogram",
+                    "samples": metric.snapshot(),
+                }
+                for name, metric in self._metrics.items()
+            },
+        }
+
+
+class MetricsServer:
+    """Serves a registry on ``/metrics`` from a background thread."""
+
+    def __init__(self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 9464):
+        """
+        Start serving.
+
+        Args:
+            registry: Metrics to expose
+            host: Interface to bind; keep the default to stay local-only
+            port: TCP port, or 0 to pick a free one
+        """
+        # Imported here: http.server is only needed when the endpoint is enabled.
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-server", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        """URL of the metrics endpoint."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def close(self) -> None:
+        """Stop serving."""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class SnapshotWriter:
+    """Periodically writes a registry snapshot to a JSON file."""
+
+    def __init__(self, registry: MetricsRegistry, path: Union[str, Path], interval: float = 15.0):
+        """
+        Start writing snapshots.
+
+        Args:
+            registry: Metrics to write
+            path: JSON file, replaced atomically on each write
+            interval: Seconds between snapshots
+        """
+        self.registry = registry
+        self.path = Path(path)
+        self.interval = interval
+        self.logger = logging.getLogger(__name__)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-snapshot", daemon=True)
+        self._thread.start()
+
+    def write(self) -> None:
+        """Write a snapshot now."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.path.with_name(self.path.name + ".tmp")
+            temporary.write_text(json.dumps(self.registry.snapshot(), indent=2), encoding="utf-8")
+            os.replace(temporary, self.path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write metrics snapshot: {e}")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.write()
+
+    def close(self) -> None:
+        """Stop the writer after a final snapshot."""
+        self._stop.set()
+        self._thread.join()
+        self.write()
+
+
+class AirdropMetrics:
+    """Attempt and phase metrics recorded by the airdrop manager."""
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry or MetricsRegistry()
+        self.attempts = self.registry.counter(
+            "airdrop_attempts_total", "Airdrop attempts by backend and outcome.", ("backend", "outcome")
+        )
+        self.attempt_duration = self.registry.histogram(
+            "airdrop_attempt_duration_seconds", "Duration of whole airdrop attempts.", ("backend",)
+        )
+        self.phase_duration = self.registry.histogram(
+            "airdrop_phase_duration_seconds", "Duration of each browser attempt phase.", ("phase",)
+        )
+        self._closers: List[object] = []
+
+    def record_attempt(
+        self, backend: str, outcome: str, duration: float, phases: Optional[Dict[str, float]] = None
+    ) -> None:
+        """
+        Record a finished attempt.
+
+        Args:
+            backend: Airdrop backend name
+            outcome: An outcome kind from ``src.core.outcome`` (``success``,
+                ``rate_limited``, ``invalid_address``, ``service_error``,
+                ``not_found`` or ``failure``), or ``cancelled`` for an
+                attempt stopped before it finished
+            duration: Attempt duration in seconds
+            phases: Phase name to duration in seconds
+        """
+        self.attempts.inc(backend, outcome)
+        self.attempt_duration.observe(duration, backend)
+        for phase, seconds in (phases or {}).items():
+            self.phase_duration.observe(seconds, phase)
+
+    def serve(self, host: str, port: int) -> MetricsServer:
+        """Expose the metrics on a local ``/metrics`` endpoint."""
+        server = MetricsServer(self.registry, host, port)
+        self._closers.append(server)
+        return server
+
+    def write_snapshots(self, path: Union[str, Path], interval: float) -> SnapshotWriter:
+        """Write the metrics to a JSON file every ``interval`` seconds."""
+        writer = SnapshotWriter(self.registry, path, interval)
+        self._closers.append(writer)
+        return writer
+
+    def close(self) -> None:
+        """Stop the endpoint and snapshot writer."""
+        while self._closers:
+            self._closers.pop().close()
+
+
+class NullMetrics:
+    """Metrics implementation used when metrics are disabled."""
+
+    def record_attempt(self, backend, outcome, duration, phases=None) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def create_metrics(app_config: AppConfig) -> Union[AirdropMetrics, NullMetrics]:
+    """
+    Create the metrics implementation selected by the configuration.
+
+    Args:
+        app_config: Application configuration
+
+    Returns:
+        AirdropMetrics with its endpoint and snapshot writer started, or
+        NullMetrics when ``metrics_enabled`` is off
+    """
+    if not app_config.metrics_enabled:
+        return NullMetrics()
+
+    metrics = AirdropMetrics()
+    if app_config.metrics_port:
+        server = metrics.serve(app_config.metrics_host, app_config.metrics_port)
+        logging.getLogger(__name__).info(f"Serving metrics on {server.url}")
+    if app_config.metrics_snapshot_path:
+        metrics.write_snapshots(app_config.metrics_snapshot_path, app_config.metrics_snapshot_interval)
+    return metrics
@@ -0,0 +1,254 @@
+"""
+Notifier - Background, rate-limited user notifications.
+
+This module takes notifications off the airdrop hot path. ``notify`` only
+enqueues; a background thread merges similar messages, limits how often
+notifications go out and hands them to pluggable sinks (desktop pop-ups,
+a webhook, a file). A slow or broken sink delays other notifications but
+never an attempt.
+"""
+
+import json
+import logging
+import queue
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+from ..utils.config import AppConfig
+from ..utils.lazy_import import lazy_import
+from .http_client import HttpClient
+
+notification = lazy_import("plyer", "notification")
+
+NOTIFICATION_SINKS = ("desktop", "webhook", "file")
+
+_NUMBERS = re.compile(r"\d+")
+
+_STOP = object()
+
+
+@dataclass
+class Notification:
+    """A notification, possibly standing for several merged ones."""
+
+    title: str
+    message: str
+    key: str = ""
+    count: int = 1
+    created_at: float = field(default_factory=time.time)
+
+    @property
+    def text(self) -> str:
+        """Message text including how many notifications were merged."""
+        return self.message if self.count == 1 else f"{self.message} (x{self.count})"
+
+
+def coalesce_key(title: str, message: str) -> str:
+    """
+    Key under which similar notifications are merged.
+
+    Numbers are ignored, so "Attempt 3 failed" and "Attempt 4 failed" merge.
+    """
+    return f"{title}\n{_NUMBERS.sub('#', message)}"
+
+
+class DesktopSink:
+    """Shows notifications as desktop pop-ups through plyer."""
+
+    def __init__(self, app_name: str = "Airdrop Tool", timeout: int = 3):
+        self.app_name = app_name
+        self.timeout = timeout
+
+    def send(self, item: Notification) -> None:
+        notification.notify(title=item.title, message=item.text, app_name=self.app_name, timeout=self.timeout)
+
+    def close(self) -> None:
+        pass
+
+
+class WebhookSink:
+    """POSTs notifications as JSON to a webhook over pooled keep-alive connections."""
+
+    def __init__(self, url: str, timeout: float = 5.0):
+        self.client = HttpClient(url, timeout=timeout, pool_size=1)
+
+    def send(self, item: Notification) -> None:
+        payload = {
+            "title": item.title,
+            "message": item.text,
+            "count": item.count,
+            "time": item.created_at,
+        }
+        self.client.request(
+            "POST",
+            body=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class FileSink:
+    """Appends notifications to a file as JSON lines."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def send(self, item: Notification) -> None:
+        entry = {"time": item.created_at, "title": item.title, "message": item.message, "count": item.count}
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def close(self) -> None:
+        pass
+
+
+class Notifier:
+    """Queues notifications and dispatches them to sinks from a background thread."""
+
+    def __init__(self, sinks: Sequence[object], min_interval: float = 5.0, max_queue: int = 1000):
+        """
+        Initialize the notifier. The dispatch thread starts on first notify().
+
+        Args:
+            sinks: Objects with ``send(Notification)`` and ``close()``
+            min_interval: Minimum seconds between dispatch rounds; notifications
+                arriving in between are merged by ``coalesce_key``
+            max_queue: Maximum queued notifications; further ones are dropped
+        """
+        self.sinks = list(sinks)
+        self.min_interval = min_interval
+        self.logger = logging.getLogger(__name__)
+        self.dropped = 0
+        self.sent = 0
+
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def notify(self, title: str, message: str, key: Optional[str] = None) -> None:
+        """
+        Queue a notification without blocking.
+
+        Args:
+            title: Notification title
+            message: Notification text
+            key: Merge key, defaults to ``coalesce_key(title, message)``
+        """
+        if self._closed:
+            return
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(Notification(title, message, key or coalesce_key(title, message)))
+        except queue.Full:
+            self.dropped += 1
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="notifier", daemon=True)
+                self._thread.start()
+
+    def _merge(self, pending: Dict[str, Notification], item: Notification) -> None:
+        """Merge a notification into the pending set, keeping the latest text."""
+        existing = pending.get(item.key)
+        if existing is None:
+            pending[item.key] = item
+        else:
+            existing.message = item.message
+            existing.count += item.count
+            existing.created_at = item.created_at
+
+    def _run(self) -> None:
+        """Dispatch loop: send, then merge arrivals until the next round is due."""
+        pending: Dict[str, Notification] = {}
+        next_round = 0.0
+        stop = False
+        while not stop:
+            timeout = None if not pending else max(0.0, next_round - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                stop = True
+            elif item is not None:
+                self._merge(pending, item)
+
+            if pending and (stop or time.monotonic() >= next_round):
+                self._dispatch(list(pending.values()))
+                pending.clear()
+                next_round = time.monotonic() + self.min_interval
+
+    def _dispatch(self, items: List[Notification]) -> None:
+        """Send notifications to every sink, logging sink failures."""
+        for item in items:
+            for sink in self.sinks:
+                try:
+                    sink.send(item)
+                except Exception as e:
+                    self.logger.warning(f"{type(sink).__name__} failed to send notification: {e}")
+            self.sent += 1
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Send what is pending, stop the dispatch thread and close the sinks.
+
+        Args:
+            timeout: Maximum time to wait for the dispatch thread
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join(timeout)
+        for sink in self.sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                self.logger.warning(f"Failed to close {type(sink).__name__}: {e}")
+
+
+class NullNotifier:
+    """Notifier used when notifications are disabled."""
+
+    def notify(self, title: str, message: str, key: Optional[str] = None) -> None:
+        pass
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        pass
+
+
+def create_notifier(app_config: AppConfig) -> Union[Notifier, NullNotifier]:
+    """
+    Create the notifier selected by the configuration.
+
+    Args:
+        app_config: Application configuration
+
+    Returns:
+        A Notifier with the configured sinks, or NullNotifier when there are none
+    """
+    sinks: List[object] = []
+    for name in app_config.notification_sinks:
+        if name == "desktop":
+            sinks.append(DesktopSink(app_config.app_name))
+        elif name == "webhook" and app_config.notification_webhook_url:
+            sinks.append(WebhookSink(app_config.notification_webhook_url))
+        elif name == "file" and app_config.notification_file:
+            sinks.append(FileSink(app_config.notification_file))
+        elif name not in NOTIFICATION_SINKS:
+            raise ValueError(f"Unknown notification sink: {name}")
+    if not sinks:
+        return NullNotifier()
+    return Notifier(sinks, min_interval=app_config.notification_min_interval)
@@ -0,0 +1,122 @@
+"""
+Attempt Outcomes - Classify faucet and RPC responses.
+
+This module maps the text an attempt ends with to a typed outcome using a
+table of precompiled patterns, and extracts the wait the server asks for
+("Try again in 8 hours", "Retry-After: 120"). The manager uses it to decide
+when a wallet may be tried again: exactly when the server allows it after a
+rate limit, soon after a transient error and never for an invalid address.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Pattern, Tuple
+
+SUCCESS = "success"
+RATE_LIMITED = "rate_limited"
+INVALID_ADDRESS = "invalid_address"
+SERVICE_ERROR = "service_error"
+NOT_FOUND = "not_found"
+FAILURE = "failure"
+
+# Outcomes worth retrying soon because the next attempt may well succeed.
+TRANSIENT_OUTCOMES = frozenset({SERVICE_ERROR, NOT_FOUND})
+
+# Checked in order; the first match wins. Rate limits come before service
+# errors so "try again in 8 hours" is not mistaken for "try again later".
+OUTCOME_PATTERNS: List[Tuple[str, Pattern[str]]] = [
+    (RATE_LIMITED, re.compile(
+        r"rate.?limit|limit (?:reached|exceeded)|airdrop limit|daily limit|too many"
+        r"|try again (?:in|after)|retry.?after|once (?:every|per)|\b429\b",
+        re.IGNORECASE,
+    )),
+    (INVALID_ADDRESS, re.compile(
+        r"invalid (?:wallet |solana |public |)(?:address|key|pubkey|param)"
+        r"|not a valid (?:address|public key)|wrong size|failed to parse (?:address|pubkey)",
+        re.IGNORECASE,
+    )),
+    (SERVICE_ERROR, re.compile(
+        r"internal (?:server )?error|service unavailable|bad gateway|gateway timeout|\b5\d\d\b"
+        r"|timed? ?out|connection error|network error|an error occurred|something went wrong"
+        r"|try again later|temporarily|faucet\b.{0,12}\b(?:dry|empty)|insufficient (?:funds|balance)",
+        re.IGNORECASE,
+    )),
+    (NOT_FOUND, re.compile(r"not found|check manually", re.IGNORECASE)),
+]
+
+SUCCESS_PATTERN = re.compile(r"(?<!un)success|airdropped|\bsent to\b", re.IGNORECASE)
+
+_UNIT_SECONDS = {"d": 86400.0, "h": 3600.0, "m": 60.0, "s": 1.0}
+
+# A run of durations such as "8 hours", "1h 30m" or "2 hours and 15 minutes"
+# following a phrase that asks the user to wait.
+_RETRY_AFTER = re.compile(
+    r"(?:try again|retry|wait|available again|come back|request again)\D{0,20}?"
+    r"((?:\d+(?:\.\d+)?\s*(?:days?|d|hours?|hrs?|h|minutes?|mins?|m|seconds?|secs?|s)\b[\s,]*(?:and\s+)?)+)",
+    re.IGNORECASE,
+)
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)\s*([dhms])", re.IGNORECASE)
+_RETRY_AFTER_HEADER = re.compile(r"retry-after:?\s*(\d+(?:\.\d+)?)(?!\s*[a-z])", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class Outcome:
+    """Classified result of an airdrop attempt."""
+
+    kind: str
+    message: str = ""
+    retry_after: Optional[float] = None
+
+    @property
+    def is_success(self) -> bool:
+        """Whether the airdrop was granted."""
+        return self.kind == SUCCESS
+
+    @property
+    def is_retryable(self) -> bool:
+        """Whether another attempt for the wallet can ever succeed."""
+        return self.kind != INVALID_ADDRESS
+
+
+def parse_retry_after(message: str) -> Optional[float]:
+    """
+    Extract how long the server asks to wait before the next request.
+
+    Args:
+        message: Response or notification text
+
+    Returns:
+        The wait in seconds, or None if the text gives none
+    """
+    match = _RETRY_AFTER_HEADER.search(message)
+    if match:
+        return float(match.group(1))
+    match = _RETRY_AFTER.search(message)
+    if not match:
+        return None
+    return sum(
+        float(amount) * _UNIT_SECONDS[unit.lower()]
+        for amount, unit in _DURATION_PART.findall(match.group(1))
+    )
+
+
+def classify(message: str, succeeded: Optional[bool] = None) -> Outcome:
+    """
+    Classify the text an attempt ended with.
+
+    Args:
+        message: Response or notification text
+        succeeded: Whether the backend already knows the attempt succeeded;
+            None to decide from the text alone
+
+    Returns:
+        The typed outcome with any retry-after the text contains
+    """
+    retry_after = parse_retry_after(message)
+    if succeeded or (succeeded is None and SUCCESS_PATTERN.search(message)):
+        return Outcome(SUCCESS, message, retry_after)
+    for kind, pattern in OUTCOME_PATTERNS:
+        if pattern.search(message):
+            return Outcome(kind, message, retry_after)
+    # Being told when to come back is a rate limit, however it is worded.
+    return Outcome(FAILURE if retry_after is None else RATE_LIMITED, message, retry_after)
@@ -0,0 +1,532 @@
+"""
+Process Watchdog - Resource accounting and cleanup for browser processes.
+
+This module tracks the process tree of every browser the tool launches,
+samples its resident memory and CPU time from /proc, and kills trees that
+exceed the configured limits or outlive their attempt. The members of each
+tracked tree are written to a state file per running instance, so browsers
+left behind by an instance that crashed are reaped when the next one starts.
+"""
+
+import json
+import logging
+import os
+import signal
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from ..utils.config import AppConfig
+
+PROC = Path("/proc")
+
+
+@dataclass(frozen=True)
+class ProcStat:
+    """The fields of /proc/<pid>/stat the watchdog uses."""
+
+    pid: int
+    ppid: int
+    state: str
+    cpu_ticks: int
+    start_ticks: int
+    rss_pages: int
+
+
+@dataclass(frozen=True)
+class TreeSample:
+    """Resource usage of one tracked process tree."""
+
+    pid: int
+    label: str
+    processes: int
+    rss_bytes: int
+    cpu_percent: float
+    age: float
+
+    @property
+    def rss_mb(self) -> float:
+        return self.rss_bytes / (1024 * 1024)
+
+
+def proc_available() -> bool:
+    """Whether this system exposes processes under /proc."""
+    return (PROC / "self" / "stat").exists()
+
+
+def read_stat(pid: int) -> Optional[ProcStat]:
+    """
+    Read a process's stat line.
+
+    Returns:
+        The parsed fields, or None if the process does not exist
+    """
+    try:
+        with open(PROC / str(pid) / "stat") as f:
+            data = f.read()
+    except OSError:
+        return None
+    # The command name may contain spaces and parentheses; fields resume after the last ")".
+    fields = data.rsplit(")", 1)[1].split()
+    try:
+        return ProcStat(
+            pid=pid,
+            ppid=int(fields[1]),
+            state=fields[0],
+            cpu_ticks=int(fields[11]) + int(fields[12]),
+            start_ticks=int(fields[19]),
+            rss_pages=int(fields[21]),
+        )
+    except (IndexError, ValueError):
+        return None
+
+
+def list_processes() -> Dict[int, ProcStat]:
+    """Read the stat line of every process."""
+    processes = {}
+    for entry in os.listdir(PROC):
+        if entry.isdigit():
+            stat = read_stat(int(entry))
+            if stat is not None:
+                processes[stat.pid] = stat
+    return processes
+
+
+def process_tree(root: int, processes: Optional[Dict[int, ProcStat]] = None) -> Dict[int, ProcStat]:
+    """
+    Find a process and all of its descendants.
+
+    Args:
+        root: Process id at the top of the tree
+        processes: Snapshot from list_processes(), read now if omitted
+
+    Returns:
+        The tree's processes by pid; empty if ``root`` does not exist
+    """
+    if processes is None:
+        processes = list_processes()
+    if root not in processes:
+        return {}
+    children: Dict[int, List[int]] = {}
+    for stat in processes.values():
+        children.setdefault(stat.ppid, []).append(stat.pid)
+    tree, stack = {}, [root]
+    while stack:
+        pid = stack.pop()
+        if pid not in tree:
+            tree[pid] = processes[pid]
+            stack.extend(children.get(pid, []))
+    return tree
+
+
+def tree_rss_bytes(tree: Dict[int, ProcStat]) -> int:
+    """
+    Sum the resident memory of a set of processes.
+
+    Args:
+        tree: Processes by pid, e.g. from process_tree()
+
+    Returns:
+        Resident set size in bytes
+    """
+    return sum(stat.rss_pages for stat in tree.values()) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _is_running(pid: int, start_ticks: int) -> bool:
+    """Whether the process still runs and is the same one, not a reused pid."""
+    stat = read_stat(pid)
+    return stat is not None and stat.start_ticks == start_ticks and stat.state != "Z"
+
+
+def _reap(pid: int) -> None:
+    """Collect the exit status if the process is our child, so it does not linger as a zombie."""
+    try:
+        os.waitpid(pid, os.WNOHANG)
+    except (ChildProcessError, OSError):
+        pass
+
+
+def kill_processes(members: Dict[int, int], grace: float = 3.0) -> int:
+    """
+    Terminate processes, then kill the ones that do not exit in time.
+
+    Args:
+        members: Start time in clock ticks by pid; processes whose start time
+            differs have exited and their pid was reused, and are left alone
+        grace: Seconds to wait after SIGTERM before sending SIGKILL
+
+    Returns:
+        Number of processes that were still running
+    """
+    running = [pid for pid, start in members.items() if _is_running(pid, start)]
+    for pid in running:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError:
+            pass
+
+    deadline = time.monotonic() + grace
+    remaining = running
+    while remaining:
+        for pid in remaining:
+            _reap(pid)
+        remaining = [pid for pid in remaining if _is_running(pid, members[pid])]
+        if not remaining or time.monotonic() >= deadline:
+            break
+        time.sleep(0.05)
+
+    for pid in remaining:
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except OSError:
+            pass
+    for pid in remaining:
+        for _ in range(20):
+            _reap(pid)
+            if not _is_running(pid, members[pid]):
+                break
+            time.sleep(0.05)
+    return len(running)
+
+
+class _Tree:
+    """Bookkeeping for one tracked process tree."""
+
+    def __init__(self, pid: int, start_ticks: int, label: str, deadline: Optional[float]):
+        self.pid = pid
+        self.label = label
+        self.deadline = deadline
+        self.started = time.monotonic()
+        self.members: Dict[int, int] = {pid: start_ticks}
+        self.cpu_ticks: Optional[int] = None
+        self.sampled_at = self.started
+        self.cpu_strikes = 0
+        self.peak_rss = 0
+
+
+class ProcessWatchdog:
+    """Samples tracked browser process trees and kills runaway or leftover ones."""
+
+    def __init__(
+        self,
+        max_rss_mb: float = 0.0,
+        max_cpu_percent: float = 0.0,
+        max_lifetime: float = 0.0,
+        interval: float = 5.0,
+        state_dir: str = "",
+        cpu_samples: int = 3,
+        kill_grace: float = 3.0,
+    ):
+        """
+        Initialize the watchdog. The sampling thread starts with the first track().
+
+        Args:
+            max_rss_mb: Resident memory of a whole tree above which it is
+                killed; 0 disables the limit
+            max_cpu_percent: CPU use of a whole tree (100 is one core) above
+                which it is killed after ``cpu_samples`` samples in a row;
+                0 disables the limit
+            max_lifetime: Default seconds a tracked tree may live; 0 disables
+            interval: Seconds between samples
+            state_dir: Directory for the state files used to reap orphans;
+                empty disables them
+            cpu_samples: Consecutive samples over the CPU limit before a kill
+            kill_grace: Seconds between SIGTERM and SIGKILL
+        """
+        self.max_rss_mb = max_rss_mb
+        self.max_cpu_percent = max_cpu_percent
+        self.max_lifetime = max_lifetime
+        self.interval = interval
+        self.state_dir = Path(state_dir) if state_dir else None
+        self.cpu_samples = cpu_samples
+        self.kill_grace = kill_grace
+        self.logger = logging.getLogger(__name__)
+
+        self._ticks_per_second = os.sysconf("SC_CLK_TCK")
+        self._trees: Dict[int, _Tree] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._written: Optional[list] = None
+
+    @property
+    def state_file(self) -> Optional[Path]:
+        """This instance's state file, named after its pid."""
+        return self.state_dir / f"{os.getpid()}.json" if self.state_dir else None
+
+    def track(self, pid: int, label: str = "browser", lifetime: Optional[float] = None) -> None:
+        """
+        Start watching a process and its descendants.
+
+        Args:
+            pid: Process id of the browser
+            label: Name used in log messages
+            lifetime: Seconds the tree may live, defaults to ``max_lifetime``;
+                0 means no limit
+        """
+        stat = read_stat(pid)
+        if stat is None:
+            self.logger.debug(f"Not tracking {label} {pid}: the process has already exited.")
+            return
+        if lifetime is None:
+            lifetime = self.max_lifetime
+        deadline = time.monotonic() + lifetime if lifetime > 0 else None
+        with self._lock:
+            self._trees[pid] = _Tree(pid, stat.start_ticks, label, deadline)
+            self._save()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="process-watchdog", daemon=True)
+                self._thread.start()
+
+    def snapshot(self, pid: int) -> int:
+        """
+        Record the current members of a tracked tree.
+
+        Call this just before quitting the browser. If the browser process
+        exits during the quit, its children are reparented and can no longer
+        be found from it; release() still kills the ones recorded here.
+
+        Args:
+            pid: Process id passed to track()
+
+        Returns:
+            Number of running members recorded
+        """
+        with self._lock:
+            tree = self._trees.get(pid)
+            if tree is None:
+                return 0
+            alive = self._collect_members(tree, list_processes())
+            self._save()
+        return len(alive)
+
+    def release(self, pid: int) -> int:
+        """
+        Stop watching a tree whose owner has finished with it, killing
+        whatever is left of it.
+
+        Call snapshot() before quitting the browser and this after; processes
+        that survived the quit are killed.
+
+        Args:
+            pid: Process id passed to track()
+
+        Returns:
+            Number of leftover processes that were killed
+        """
+        with self._lock:
+            tree = self._trees.pop(pid, None)
+            if tree is None:
+                return 0
+            self._collect_members(tree, list_processes())
+            self._save()
+        killed = kill_processes(tree.members, self.kill_grace)
+        if killed:
+            self.logger.warning(
+                f"{killed} processes of {tree.label} {pid} were still running after it closed; killed them.",
+                extra={"pid": pid},
+            )
+        self.logger.info(
+            f"Released {tree.label} {pid} after {time.monotonic() - tree.started:.0f}s, "
+            f"peak RSS {tree.peak_rss / (1024 * 1024):.0f} MB",
+            extra={"pid": pid, "rss_bytes": tree.peak_rss},
+        )
+        return killed
+
+    def sample(self) -> List[TreeSample]:
+        """
+        Sample every tracked tree once, logging its usage and killing it if
+        it is over a limit.
+
+        Returns:
+            The samples, including those of trees that were killed
+        """
+        processes = list_processes()
+        now = time.monotonic()
+        samples, doomed = [], []
+        with self._lock:
+            for tree in list(self._trees.values()):
+                alive = self._collect_members(tree, processes)
+                if not alive:
+                    self.logger.debug(f"{tree.label} {tree.pid} has exited.")
+                    del self._trees[tree.pid]
+                    continue
+                sample = self._measure(tree, alive, now)
+                samples.append(sample)
+                reason = self._limit_exceeded(tree, sample, now)
+                if reason:
+                    del self._trees[tree.pid]
+                    doomed.append((tree, sample, reason))
+            self._save()
+
+        for sample in samples:
+            self.logger.debug(
+                f"{sample.label} {sample.pid}: {sample.processes} processes, "
+                f"{sample.rss_mb:.0f} MB RSS, {sample.cpu_percent:.0f}% CPU",
+                extra={"pid": sample.pid, "rss_bytes": sample.rss_bytes, "cpu_percent": round(sample.cpu_percent, 1)},
+            )
+        for tree, sample, reason in doomed:
+            self.logger.warning(
+                f"Killing {tree.label} {tree.pid}: {reason}.",
+                extra={"pid": tree.pid, "rss_bytes": sample.rss_bytes, "cpu_percent": round(sample.cpu_percent, 1)},
+            )
+            kill_processes(tree.members, self.kill_grace)
+        return samples
+
+    def _collect_members(self, tree: _Tree, processes: Dict[int, ProcStat]) -> Dict[int, ProcStat]:
+        """
+        Add new descendants to a tree and drop members that exited.
+
+        Members stay tracked after their parent exits, so processes orphaned
+        by a crashed browser are still accounted for and killed.
+
+        Returns:
+            The members that are running
+        """
+        for member in list(tree.members):
+            if member in processes and processes[member].start_ticks == tree.members[member]:
+                for pid, stat in process_tree(member, processes).items():
+                    tree.members.setdefault(pid, stat.start_ticks)
+        alive = {
+            pid: processes[pid]
+            for pid, start in tree.members.items()
+            if pid in processes and processes[pid].start_ticks == start and processes[pid].state != "Z"
+        }
+        tree.members = {pid: stat.start_ticks for pid, stat in alive.items()}
+        return alive
+
+    def _measure(self, tree: _Tree, alive: Dict[int, ProcStat], now: float) -> TreeSample:
+        """Work out a tree's memory and its CPU use since the previous sample."""
+        rss = tree_rss_bytes(alive)
+        cpu_ticks = sum(stat.cpu_ticks for stat in alive.values())
+        cpu_percent = 0.0
+        elapsed = now - tree.sampled_at
+        if tree.cpu_ticks is not None and elapsed > 0:
+            # Processes that exited take their CPU time with them; never report negative use.
+            used = max(0, cpu_ticks - tree.cpu_ticks) / self._ticks_per_second
+            cpu_percent = 100.0 * used / elapsed
+        tree.cpu_ticks = cpu_ticks
+        tree.sampled_at = now
+        tree.peak_rss = max(tree.peak_rss, rss)
+        return TreeSample(tree.pid, tree.label, len(alive), rss, cpu_percent, now - tree.started)
+
+    def _limit_exceeded(self, tree: _Tree, sample: TreeSample, now: float) -> Optional[str]:
+        """Return why a tree must be killed, or None if it is within its limits."""
+        if self.max_rss_mb and sample.rss_mb > self.max_rss_mb:
+            return f"{sample.rss_mb:.0f} MB RSS is over the {self.max_rss_mb:g} MB limit"
+        if self.max_cpu_percent and sample.cpu_percent > self.max_cpu_percent:
+            tree.cpu_strikes += 1
+            if tree.cpu_strikes >= self.cpu_samples:
+                return (
+                    f"{sample.cpu_percent:.0f}% CPU for {tree.cpu_strikes} samples "
+                    f"is over the {self.max_cpu_percent:g}% limit"
+                )
+        else:
+            tree.cpu_strikes = 0
+        if tree.deadline is not None and now > tree.deadline:
+            return f"alive for {sample.age:.0f}s, past its {tree.deadline - tree.started:.0f}s lifetime"
+        return None
+
+    def _run(self) -> None:
+        """Sampling loop."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception:
+                self.logger.warning("Process watchdog sample failed", exc_info=True)
+
+    def _save(self) -> None:
+        """Write the members of every tracked tree to the state file; the caller holds the lock."""
+        path = self.state_file
+        if path is None:
+            return
+        processes = sorted([pid, start] for tree in self._trees.values() for pid, start in tree.members.items())
+        if processes == self._written:
+            return
+        try:
+            if not processes:
+                if path.exists():
+                    path.unlink()
+            else:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                owner = read_stat(os.getpid())
+                temporary = path.with_suffix(".tmp")
+                temporary.write_text(json.dumps({
+                    "owner": [os.getpid(), owner.start_ticks if owner else 0],
+                    "processes": processes,
+                }))
+                os.replace(temporary, path)
+            self._written = processes
+        except OSError as e:
+            self.logger.warning(f"Could not write watchdog state file {path}: {e}")
+
+    def reap_orphans(self) -> int:
+        """
+        Kill browser processes recorded by instances that are no longer running.
+
+        Returns:
+            Number of processes killed
+        """
+        if self.state_dir is None or not self.state_dir.is_dir():
+            return 0
+        killed = 0
+        for path in self.state_dir.glob("*.json"):
+            try:
+                state = json.loads(path.read_text())
+                owner_pid, owner_start = state["owner"]
+                members = {int(pid): int(start) for pid, start in state["processes"]}
+            except (OSError, ValueError, KeyError, TypeError):
+                self.logger.warning(f"Ignoring unreadable watchdog state file {path}")
+                continue
+            if owner_pid == os.getpid() or _is_running(owner_pid, owner_start):
+                continue
+            count = kill_processes(members, self.kill_grace)
+            if count:
+                self.logger.warning(
+                    f"Killed {count} browser processes left behind by instance {owner_pid}.",
+                    extra={"pid": owner_pid},
+                )
+            killed += count
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        return killed
+
+    def close(self) -> None:
+        """Stop sampling and kill every tree that is still tracked."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(self.interval + 1)
+        for pid in list(self._trees):
+            self.release(pid)
+
+
+def create_watchdog(app_config: "AppConfig") -> Optional[ProcessWatchdog]:
+    """
+    Create the process watchdog selected by the configuration and reap
+    browsers left behind by crashed runs.
+
+    Args:
+        app_config: Application configuration
+
+    Returns:
+        A ProcessWatchdog, or None if it is disabled or /proc is not available
+    """
+    if not app_config.watchdog_enabled:
+        return None
+    if not proc_available():
+        logging.getLogger(__name__).debug("No /proc on this system; the process watchdog is disabled.")
+        return None
+    watchdog = ProcessWatchdog(
+        max_rss_mb=app_config.watchdog_max_rss_mb,
+        max_cpu_percent=app_config.watchdog_max_cpu_percent,
+        max_lifetime=app_config.watchdog_max_lifetime,
+        interval=app_config.watchdog_interval,
+        state_dir=app_config.data_path(app_config.watchdog_state_dir),
+    )
+    watchdog.reap_orphans()
+    return watchdog
@@ -0,0 +1,176 @@
+"""
+RPC Backend - Browserless airdrop backend.
+
+This module requests airdrops directly from a validator's JSON-RPC API,
+which is what local ``solana-test-validator`` instances and devnet expose.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence
+
+from ..utils.config import AppConfig
+from .cancellation import CANCELLED_MESSAGE, CancellationToken
+from .clock import SYSTEM_CLOCK, Clock
+from .confirmation import ConfirmationTracker, derive_websocket_url
+from .rpc_client import RpcError, SolanaRpcClient
+
+
+@dataclass
+class BulkAirdropResult:
+    """Outcome of one address in a bulk airdrop."""
+
+    address: str
+    signature: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        """Whether the airdrop request was accepted."""
+        return self.signature is not None and self.error is None
+
+
+class RpcAirdropBackend:
+    """Performs airdrops through the ``requestAirdrop`` JSON-RPC method."""
+
+    def __init__(self, app_config: AppConfig, clock: Optional[Clock] = None):
+        """
+        Initialize the RPC backend.
+
+        Args:
+            app_config: Application configuration with the RPC settings
+            clock: Time source for submission times and confirmation waits,
+                defaults to the real clock
+        """
+        self.config = app_config
+        self.clock = clock or SYSTEM_CLOCK
+        self.logger = logging.getLogger(__name__)
+        self.client = SolanaRpcClient(
+            app_config.rpc_url,
+            timeout=app_config.rpc_timeout,
+            pool_size=app_config.rpc_pool_size,
+        )
+        self.tracker: Optional[ConfirmationTracker] = None
+        if app_config.confirm_airdrops:
+            self.tracker = ConfirmationTracker(
+                self.client,
+                ws_url=app_config.rpc_ws_url or derive_websocket_url(app_config.rpc_url),
+                commitment=app_config.confirmation_commitment,
+                timeout=app_config.confirmation_timeout,
+                clock=self.clock,
+            )
+
+    def perform_airdrop(
+        self,
+        wallet_address: str,
+        progress_callback: Callable[[str], None],
+        attempt: int,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> bool:
+        """
+        Request an airdrop for a wallet over JSON-RPC.
+
+        Args:
+            wallet_address: The Solana wallet address
+            progress_callback: Function to call with progress updates
+            attempt: Current attempt number
+            cancel_token: Optional token that aborts waiting for confirmation
+
+        Returns:
+            bool: True if the validator accepted the request, False otherwise
+        """
+        progress_callback(f"Status: Starting airdrop attempt {attempt}...")
+        self.logger.info(f"Requesting airdrop from {self.config.rpc_url}.")
+
+        submitted_at = self.clock.monotonic()
+        try:
+            signature = self.client.request_airdrop(wallet_address, self.config.airdrop_lamports)
+        except RpcError as e:
+            self.logger.error(f"Attempt {attempt} failed: {e}")
+            progress_callback(f"Status: Airdrop failed: {e}")
+            return False
+
+        if self.tracker is not None:
+            progress_callback("Status: Submitted airdrop. Waiting for confirmation...")
+            result = self.tracker.wait_for(
+                [signature], submitted_at=submitted_at, cancel_token=cancel_token
+            )[signature]
+            if not result.confirmed:
+                self.logger.error(f"Attempt {attempt} failed: {result.error}")
+                progress_callback(f"Status: Airdrop failed: {result.error}")
+                return False
+            self.logger.info(f"Airdrop {result.commitment} after {result.elapsed:.3f}s.")
+
+        message = f"Airdrop success. Signature: {signature}"
+        progress_callback(f"Status: {message}")
+        self.logger.info(f"Attempt {attempt} completed: {message}")
+        return True
+
+    def request_airdrops(
+        self,
+        addresses: Sequence[str],
+        chunk_size: Optional[int] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> List[BulkAirdropResult]:
+        """
+        Request airdrops for many addresses using JSON-RPC batch requests.
+
+        Args:
+            addresses: Wallet addresses to fund
+            chunk_size: Number of calls per batch, defaults to ``rpc_batch_size``
+            cancel_token: Optional token that stops sending further batches
+
+        Returns:
+            One result per address, in input order
+        """
+        size = chunk_size or self.config.rpc_batch_size
+        if size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        lamports = self.config.airdrop_lamports
+        submitted_at = self.clock.monotonic()
+        results: List[BulkAirdropResult] = []
+        for start in range(0, len(addresses), size):
+            chunk = addresses[start:start + size]
+            if cancel_token is not None and cancel_token.is_cancelled:
+                results.extend(BulkAirdropResult(address, error=CANCELLED_MESSAGE) for address in chunk)
+                continue
+            calls = [("requestAirdrop", [address, lamports]) for address in chunk]
+            try:
+                responses = self.client.batch(calls)
+            except RpcError as e:
+                self.logger.error(f"Batch of {len(chunk)} airdrops failed: {e}")
+                results.extend(BulkAirdropResult(address, error=str(e)) for address in chunk)
+                continue
+
+            for address, response in zip(chunk, responses):
+                if isinstance(response, RpcError):
+                    results.append(BulkAirdropResult(address, error=str(response)))
+                else:
+                    results.append(BulkAirdropResult(address, signature=response))
+
+        if self.tracker is not None:
+            self._confirm_results(results, submitted_at, cancel_token)
+        return results
+
+    def _confirm_results(
+        self,
+        results: List[BulkAirdropResult],
+        submitted_at: float,
+        cancel_token: Optional[CancellationToken],
+    ) -> None:
+        """Wait for all submitted airdrops and mark unconfirmed ones as errors."""
+        submitted = [result for result in results if result.success]
+        confirmations = self.tracker.wait_for(
+            [result.signature for result in submitted],
+            submitted_at=submitted_at,
+            cancel_token=cancel_token,
+        )
+        for result in submitted:
+            confirmation = confirmations[result.signature]
+            if not confirmation.confirmed:
+                result.error = confirmation.error
+
+    def close(self) -> None:
+        """Release pooled connections."""
+        self.client.close()
@@ -0,0 +1,142 @@
+"""
+RPC Client - Solana JSON-RPC client.
+
+This module provides a minimal JSON-RPC 2.0 client for the Solana validator
+API, built on the pooled keep-alive HTTP client.
+"""
+
+import itertools
+import threading
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+from .http_client import HttpClient, HttpError
+
+
+class RpcError(Exception):
+    """Raised when a JSON-RPC call fails or returns an error object."""
+
+    def __init__(self, message: str, code: Optional[int] = None):
+        super().__init__(message)
+        self.code = code
+
+
+class SolanaRpcClient:
+    """JSON-RPC client for a Solana validator."""
+
+    def __init__(self, url: str, timeout: float = 10.0, pool_size: int = 4):
+        """
+        Initialize the RPC client.
+
+        Args:
+            url: JSON-RPC endpoint of the validator
+            timeout: Request timeout in seconds
+            pool_size: Maximum number of idle keep-alive connections
+        """
+        self.url = url
+        self.http = HttpClient(url, timeout=timeout, pool_size=pool_size)
+        self._ids = itertools.count(1)
+        self._id_lock = threading.Lock()
+
+    def _next_id(self) -> int:
+        """Return a unique request id."""
+        with self._id_lock:
+            return next(self._ids)
+
+    def call(self, method: str, params: Optional[List[Any]] = None) -> Any:
+        """
+        Call a JSON-RPC method and return its result.
+
+        Args:
+            method: RPC method name
+            params: Positional method parameters
+
+        Returns:
+            The ``result`` member of the response
+
+        Raises:
+            RpcError: If the request fails or the response carries an error
+        """
+        payload = {"jsonrpc": "2.0", "id": self._next_id(), "method": method}
+        if params is not None:
+            payload["params"] = params
+
+        try:
+            response = self.http.post_json(payload)
+        except HttpError as e:
+            raise RpcError(str(e)) from e
+
+        if not isinstance(response, dict):
+            raise RpcError(f"Malformed response to {method}.")
+        if "error" in response:
+            error = response["error"] or {}
+            raise RpcError(error.get("message", "Unknown RPC error"), error.get("code"))
+        return response.get("result")
+
+    def batch(self, calls: Sequence[Tuple[str, Optional[List[Any]]]]) -> List[Union[Any, RpcError]]:
+        """
+        Send several JSON-RPC calls as one batch request.
+
+        Args:
+            calls: Sequence of ``(method, params)`` pairs
+
+        Returns:
+            One entry per call, in call order: the call's result, or an
+            RpcError instance if that call failed
+
+        Raises:
+            RpcError: If the batch request itself fails
+        """
+        if not calls:
+            return []
+
+        payload = []
+        for method, params in calls:
+            request = {"jsonrpc": "2.0", "id": self._next_id(), "method": method}
+            if params is not None:
+                request["params"] = params
+            payload.append(request)
+
+        try:
+            response = self.http.post_json(payload)
+        except HttpError as e:
+            raise RpcError(str(e)) from e
+
+        if isinstance(response, dict) and "error" in response:
+            error = response["error"] or {}
+            raise RpcError(error.get("message", "Unknown RPC error"), error.get("code"))
+        if not isinstance(response, list):
+            raise RpcError("Malformed batch response.")
+
+        by_id = {item.get("id"): item for item in response if isinstance(item, dict)}
+        results: List[Union[Any, RpcError]] = []
+        for request in payload:
+            item = by_id.get(request["id"])
+            if item is None:
+                results.append(RpcError("Missing response in batch."))
+            elif "error" in item:
+                error = item["error"] or {}
+                results.append(RpcError(error.get("message", "Unknown RPC error"), error.get("code")))
+            else:
+                results.append(item.get("result"))
+        return results
+
+    def request_airdrop(self, address: str, lamports: int, commitment: Optional[str] = None) -> str:
+        """
+        Request an airdrop of lamports to an address.
+
+        Args:
+            address: Base58 wallet address
+            lamports: Amount to airdrop in lamports
+            commitment: Optional commitment level for the request
+
+        Returns:
+            Transaction signature of the airdrop
+        """
+        params: List[Any] = [address, lamports]
+        if commitment:
+            params.append({"commitment": commitment})
+        return self.call("requestAirdrop", params)
+
+    def close(self) -> None:
+        """Close the underlying HTTP connections."""
+        self.http.close()
@@ -0,0 +1,196 @@
+"""
+Cooldown Scheduler - Runs per-wallet jobs when their cooldown expires.
+
+This module keeps a min-heap of next-eligible times keyed by wallet and runs
+due jobs on a small fixed set of worker threads. Idle workers wait on a
+condition variable, so tracking thousands of wallets costs no extra threads
+and any wallet can be woken, rescheduled or dropped immediately.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from .clock import SYSTEM_CLOCK, Clock
+
+# A job runs one attempt for a wallet and returns its next due time as a Unix
+# timestamp, or None to stop tracking the wallet.
+Job = Callable[[str], Optional[float]]
+
+
+class CooldownScheduler:
+    """Min-heap scheduler of per-wallet jobs with interruptible waits."""
+
+    def __init__(
+        self,
+        job: Job,
+        workers: int = 2,
+        name: str = "cooldown-scheduler",
+        clock: Optional[Clock] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            job: Function that runs one attempt for a wallet
+            workers: Number of worker threads
+            name: Thread name prefix
+            clock: Time source for due times and waits, defaults to the real clock
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        self.job = job
+        self.workers = workers
+        self.name = name
+        self.clock = clock or SYSTEM_CLOCK
+        self.logger = logging.getLogger(__name__)
+
+        self._heap: List[Tuple[float, int, str]] = []
+        self._due: Dict[str, Tuple[float, int]] = {}
+        self._running: Set[str] = set()
+        self._cancelled: Set[str] = set()
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._shutdown = False
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        with self._condition:
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(
+                    target=self._work, name=f"{self.name}-{index}", daemon=True
+                )
+                self._threads.append(thread)
+                thread.start()
+
+    def schedule(self, wallet: str, due: Optional[float] = None) -> None:
+        """
+        Schedule or reschedule a wallet.
+
+        Args:
+            wallet: Wallet address
+            due: Unix timestamp to run at, defaults to now
+        """
+        due = self.clock.time() if due is None else due
+        with self._condition:
+            self._cancelled.discard(wallet)
+            self._push(wallet, due)
+            self._condition.notify()
+
+    def _push(self, wallet: str, due: float) -> None:
+        """Record a wallet's due time; the caller holds the condition."""
+        sequence = next(self._counter)
+        self._due[wallet] = (due, sequence)
+        heapq.heappush(self._heap, (due, sequence, wallet))
+
+    def wake(self, wallet: str) -> None:
+        """Run a tracked wallet as soon as a worker is free."""
+        with self._condition:
+            if wallet in self._due:
+                self.schedule(wallet)
+
+    def cancel(self, wallet: str) -> None:
+        """Stop tracking a wallet. An attempt already running is not interrupted."""
+        with self._condition:
+            self._due.pop(wallet, None)
+            if wallet in self._running:
+                self._cancelled.add(wallet)
+            self._condition.notify_all()
+
+    def next_due(self, wallet: str) -> Optional[float]:
+        """Return when a wallet is due, or None if it is not scheduled."""
+        with self._condition:
+            entry = self._due.get(wallet)
+            return entry[0] if entry else None
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._due)
+
+    def _is_stale(self, entry: Tuple[float, int, str]) -> bool:
+        """Whether a heap entry was superseded by a reschedule or cancel."""
+        current = self._due.get(entry[2])
+        return current is None or current[1] != entry[1]
+
+    def _pop_due(self) -> Optional[str]:
+        """Wait for the earliest job to come due and claim it; None on shutdown."""
+        with self._condition:
+            while not self._shutdown:
+                claimed: Optional[str] = None
+                delay: Optional[float] = None
+                # Wallets whose previous job is still running are set aside so
+                # they do not hold up other due wallets.
+                deferred = []
+                while self._heap:
+                    entry = self._heap[0]
+                    if self._is_stale(entry):
+                        heapq.heappop(self._heap)
+                    elif entry[2] in self._running:
+                        deferred.append(heapq.heappop(self._heap))
+                    elif entry[0] > self.clock.time():
+                        delay = entry[0] - self.clock.time()
+                        break
+                    else:
+                        claimed = heapq.heappop(self._heap)[2]
+                        break
+                for entry in deferred:
+                    heapq.heappush(self._heap, entry)
+
+                if claimed is not None:
+                    del self._due[claimed]
+                    self._running.add(claimed)
+                    return claimed
+                self.clock.wait(self._condition, delay)
+            return None
+
+    def _work(self) -> None:
+        """Worker loop: run due jobs until shutdown."""
+        while True:
+            wallet = self._pop_due()
+            if wallet is None:
+                return
+
+            next_due: Optional[float] = None
+            try:
+                next_due = self.job(wallet)
+            except Exception:
+                self.logger.error(f"Scheduled job for {wallet} failed", exc_info=True)
+
+            with self._condition:
+                self._running.discard(wallet)
+                cancelled = wallet in self._cancelled
+                self._cancelled.discard(wallet)
+                # A schedule() made while the job ran takes precedence over its result.
+                if next_due is not None and not cancelled and wallet not in self._due:
+                    self._push(wallet, next_due)
+                self._condition.notify_all()
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Stop the workers.
+
+        Idle workers exit immediately; a worker in the middle of a job exits
+        when the job returns.
+
+        Args:
+            wait: Wait for the worker threads to exit
+            timeout: Maximum time to wait for each thread
+        """
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        if wait:
+            for thread in self._threads:
+                if thread is not threading.current_thread():
+                    thread.join(timeout)
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Block until the scheduler has been shut down and its workers exit."""
+        for thread in list(self._threads):
+            thread.join(timeout)
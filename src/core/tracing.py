@@ -0,0 +1,309 @@
+"""
+Tracing - Chrome trace-event timelines of airdrop attempts.
+
+This module records spans (attempts, phases, challenge iterations, result
+polls and sleeps) and writes them in the Chrome trace-event JSON format,
+which Perfetto (https://ui.perfetto.dev) and ``chrome://tracing`` display as
+a timeline per thread. In ``attempt`` mode each attempt is written to its own
+file when it ends; in ``buffer`` mode the latest events are kept in memory and
+written on close() or dump(). When tracing is off, ``NullTracer`` hands out a
+shared do-nothing span and leaves the clock unwrapped.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional, Union
+
+from ..utils.config import AppConfig
+from .clock import SYSTEM_CLOCK, Clock
+
+
+class Span:
+    """An open span; arguments set on it appear in the trace viewer."""
+
+    __slots__ = ("args",)
+
+    def __init__(self, args: Dict[str, Any]):
+        self.args = args
+
+    def set(self, **args: Any) -> None:
+        """Add or replace arguments of the span."""
+        self.args.update(args)
+
+
+class _NullSpan:
+    """Span that records nothing; one instance is shared."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def set(self, **args: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _TracedClock(Clock):
+    """Clock wrapper that records every sleep as a span."""
+
+    def __init__(self, clock: Clock, tracer: "Tracer"):
+        self.clock = clock
+        self.tracer = tracer
+
+    def time(self) -> float:
+        return self.clock.time()
+
+    def monotonic(self) -> float:
+        return self.clock.monotonic()
+
+    def sleep(self, seconds, cancel_token=None) -> None:
+        with self.tracer.span("sleep", cat="sleep", seconds=round(seconds, 3)):
+            self.clock.sleep(seconds, cancel_token)
+
+    def wait(self, condition, timeout) -> bool:
+        return self.clock.wait(condition, timeout)
+
+
+class Tracer:
+    """Records spans as Chrome trace events and writes them to JSON files."""
+
+    enabled = True
+
+    def __init__(
+        self,
+        mode: str = "attempt",
+        trace_dir: str = "logs/traces",
+        buffer_events: int = 100_000,
+        clock: Optional[Clock] = None,
+    ):
+        """
+        Initialize the tracer.
+
+        Args:
+            mode: "attempt" for one file per attempt, "buffer" for a rolling
+                buffer written on close() or dump()
+            trace_dir: Directory the trace files are written to
+            buffer_events: Number of events the rolling buffer keeps
+            clock: Time source for event timestamps, defaults to the real clock
+        """
+        if mode not in ("attempt", "buffer"):
+            raise ValueError(f"Unknown trace mode: {mode}")
+        self.mode = mode
+        self.trace_dir = Path(trace_dir)
+        self.clock = clock or SYSTEM_CLOCK
+        self.logger = logging.getLogger(__name__)
+        self._pid = os.getpid()
+        self._buffer: Deque[Dict[str, Any]] = deque(maxlen=buffer_events)
+        self._threads: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def wrap_clock(self, clock: Clock) -> Clock:
+        """Return a clock whose sleeps are recorded as spans."""
+        return _TracedClock(clock, self)
+
+    def _now_us(self) -> float:
+        return self.clock.monotonic() * 1_000_000
+
+    def _record(self, event: Dict[str, Any]) -> None:
+        """Add an event to the current attempt and, in buffer mode, to the buffer."""
+        thread = threading.current_thread()
+        event["pid"] = self._pid
+        event["tid"] = thread.ident
+        events: Optional[List[Dict[str, Any]]] = getattr(self._local, "events", None)
+        if events is not None:
+            events.append(event)
+        if self.mode == "buffer":
+            with self._lock:
+                self._threads[thread.ident] = thread.name
+                self._buffer.append(event)
+
+    @contextmanager
+    def span(self, name: str, cat: str = "airdrop", **args: Any) -> Iterator[Span]:
+        """
+        Record the enclosed block as a complete ("X") event.
+
+        Args:
+            name: Span name
+            cat: Category, used for filtering in the viewer
+            **args: Arguments shown with the span
+
+        Yields:
+            The span, to add arguments known only at the end
+        """
+        span = Span(args)
+        start = self._now_us()
+        try:
+            yield span
+        except BaseException as e:
+            span.args.setdefault("error", type(e).__name__)
+            raise
+        finally:
+            self._record({
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": round(start, 3),
+                "dur": round(self._now_us() - start, 3),
+                "args": span.args,
+            })
+
+    def instant(self, name: str, cat: str = "airdrop", **args: Any) -> None:
+        """Record a point-in-time ("i") event."""
+        self._record({
+            "name": name,
+            "cat": cat,
+            "ph": "i",
+            "s": "t",
+            "ts": round(self._now_us(), 3),
+            "args": args,
+        })
+
+    @contextmanager
+    def attempt(self, wallet_address: str, attempt: int) -> Iterator[Span]:
+        """
+        Trace one attempt as a top-level span.
+
+        In attempt mode the attempt's events, including those of nested spans
+        on the same thread, are written to their own file when it ends.
+
+        Args:
+            wallet_address: The Solana wallet address
+            attempt: Attempt number
+
+        Yields:
+            The attempt span
+        """
+        outer = getattr(self._local, "events", None)
+        events: List[Dict[str, Any]] = []
+        self._local.events = events
+        started_at = self.clock.time()
+        try:
+            with self.span("perform_airdrop", cat="attempt", wallet=wallet_address, attempt=attempt) as span:
+                yield span
+        finally:
+            self._local.events = outer
+            if outer is not None:
+                outer.extend(events)
+            if self.mode == "attempt":
+                self._write_attempt(events, wallet_address, attempt, started_at)
+
+    def _write_attempt(
+        self,
+        events: List[Dict[str, Any]],
+        wallet_address: str,
+        attempt: int,
+        started_at: float,
+    ) -> None:
+        """Write one attempt's events to a new file in the trace directory."""
+        thread = threading.current_thread()
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(started_at))
+        millis = int(started_at * 1000) % 1000
+        path = self.trace_dir / f"{stamp}.{millis:03d}-{wallet_address[:8]}-attempt{attempt}.json"
+        metadata = {"wallet": wallet_address, "attempt": attempt}
+        self._write(path, events, {thread.ident: thread.name}, metadata)
+
+    def dump(self, path: Optional[Union[str, Path]] = None) -> Optional[Path]:
+        """
+        Write the rolling buffer.
+
+        Args:
+            path: Output file, defaults to ``trace-buffer.json`` in the trace directory
+
+        Returns:
+            The file written, or None outside buffer mode
+        """
+        if self.mode != "buffer":
+            return None
+        with self._lock:
+            events = list(self._buffer)
+            threads = dict(self._threads)
+        return self._write(Path(path) if path else self.trace_dir / "trace-buffer.json", events, threads, {})
+
+    def _write(
+        self,
+        path: Path,
+        events: List[Dict[str, Any]],
+        threads: Dict[int, str],
+        metadata: Dict[str, Any],
+    ) -> Optional[Path]:
+        """Write events as a trace file with process and thread names."""
+        names = [
+            {"name": "process_name", "ph": "M", "pid": self._pid, "args": {"name": "airdrop-tool"}},
+        ] + [
+            {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}}
+            for tid, name in threads.items()
+        ]
+        trace = {"traceEvents": names + events, "displayTimeUnit": "ms", "otherData": metadata}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_suffix(".tmp")
+            temporary.write_text(json.dumps(trace, default=str), encoding="utf-8")
+            os.replace(temporary, path)
+        except OSError as e:
+            self.logger.warning(f"Could not write trace file {path}: {e}")
+            return None
+        self.logger.debug(f"Wrote trace to {path}")
+        return path
+
+    def close(self) -> None:
+        """Write the rolling buffer in buffer mode."""
+        self.dump()
+
+
+class NullTracer:
+    """Tracer used when tracing is off; records nothing."""
+
+    enabled = False
+
+    def wrap_clock(self, clock: Clock) -> Clock:
+        return clock
+
+    def span(self, name: str, cat: str = "airdrop", **args: Any) -> _NullSpan:
+        return _NULL_SPAN
+
+    def instant(self, name: str, cat: str = "airdrop", **args: Any) -> None:
+        pass
+
+    def attempt(self, wallet_address: str, attempt: int) -> _NullSpan:
+        return _NULL_SPAN
+
+    def dump(self, path=None) -> None:
+        return None
+
+    def close(self) -> None:
+        pass
+
+
+NULL_TRACER = NullTracer()
+
+# What the airdrop code accepts as a tracer.
+AnyTracer = Union[Tracer, NullTracer]
+
+
+def create_tracer(app_config: AppConfig, clock: Optional[Clock] = None) -> AnyTracer:
+    """
+    Create the tracer selected by the configuration.
+
+    Args:
+        app_config: Application configuration
+        clock: Time source for event timestamps
+
+    Returns:
+        A Tracer, or the shared NullTracer when ``trace_mode`` is "off"
+    """
+    if app_config.trace_mode == "off":
+        return NULL_TRACER
+    return Tracer(app_config.trace_mode, app_config.trace_dir, app_config.trace_buffer_events, clock)
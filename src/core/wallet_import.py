@@ -0,0 +1,218 @@
+"""
+Wallet Import - Streaming wallet-list import pipeline.
+
+This module reads large text or CSV wallet lists lazily, normalizes and
+validates each entry, drops duplicates and reports progress as it goes,
+without ever holding the whole file in memory.
+"""
+
+import csv
+from collections import Counter
+from itertools import islice
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Set, Union
+
+from .address_validator import b58decode, iter_validate
+
+ADDRESS_COLUMNS = ("address", "wallet", "wallet_address", "pubkey", "public_key")
+
+
+@dataclass
+class ImportStats:
+    """Running counts for a wallet import."""
+
+    lines_read: int = 0
+    imported: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    truncated: bool = False
+    rejections: Counter = field(default_factory=Counter)
+
+    def summary(self) -> str:
+        """Return a one-line human-readable summary."""
+        text = (
+            f"Read {self.lines_read} lines: {self.imported} imported, "
+            f"{self.duplicates} duplicates, {self.invalid} invalid"
+        )
+        if self.truncated:
+            text += " (stopped at wallet limit)"
+        return text
+
+
+class Deduplicator:
+    """
+    Tracks seen addresses by their decoded 32-byte public key.
+
+    Keys are compared exactly, so distinct wallets are never merged. Each
+    entry costs about 100 bytes (a 32-byte ``bytes`` object and its set
+    slot), so memory grows with the number of unique addresses added; the
+    importer's ``max_wallets`` bounds it, and the GUI and CLI pass
+    ``AppConfig.import_max_wallets``.
+    """
+
+    def __init__(self):
+        self._seen: Set[bytes] = set()
+
+    def add(self, address: str) -> bool:
+        """
+        Record a valid address.
+
+        Returns:
+            True if the address had not been seen before
+        """
+        key = b58decode(address)
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+
+def _normalize(value: str) -> str:
+    """Strip surrounding whitespace, quotes and a UTF-8 byte order mark."""
+    return value.strip().lstrip("\ufeff").strip().strip("\"'").strip()
+
+
+def iter_text_entries(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield one candidate address per non-blank, non-comment line.
+
+    Only the first whitespace-separated token of each line is used, so lists
+    annotated with trailing labels still import.
+    """
+    for line in lines:
+        value = _normalize(line)
+        if not value or value.startswith("#"):
+            yield ""
+            continue
+        yield value.split(None, 1)[0]
+
+
+def iter_csv_entries(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield the address column of each CSV row.
+
+    The address column is found from a header row naming one of
+    ``ADDRESS_COLUMNS``; without a header the first column is used.
+    """
+    reader = csv.reader(lines)
+    column = 0
+    for row_number, row in enumerate(reader):
+        cells = [_normalize(cell) for cell in row]
+        if row_number == 0:
+            header = [cell.lower() for cell in cells]
+            matches = [index for index, name in enumerate(header) if name in ADDRESS_COLUMNS]
+            if matches:
+                column = matches[0]
+                yield ""
+                continue
+        yield cells[column] if column < len(cells) else ""
+
+
+class WalletImporter:
+    """Lazily imports valid, unique wallet addresses from a file."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        progress_callback: Optional[Callable[[ImportStats], None]] = None,
+        progress_every: int = 10000,
+        max_wallets: Optional[int] = None,
+        check_on_curve: bool = False,
+    ):
+        """
+        Initialize the importer.
+
+        Args:
+            path: Text (one address per line) or ``.csv`` file
+            progress_callback: Called with the running stats every
+                ``progress_every`` lines and once at the end
+            progress_every: Number of lines between progress reports
+            max_wallets: Stop after importing this many wallets, bounding the
+                memory used for duplicate detection
+            check_on_curve: Also require each key to be an ed25519 curve point
+        """
+        self.path = Path(path)
+        self.progress_callback = progress_callback
+        self.progress_every = max(1, progress_every)
+        self.max_wallets = max_wallets
+        self.check_on_curve = check_on_curve
+        self.stats = ImportStats()
+
+    def _entries(self, lines: Iterable[str]) -> Iterator[str]:
+        """Pick the entry parser for the file type."""
+        if self.path.suffix.lower() == ".csv":
+            return iter_csv_entries(lines)
+        return iter_text_entries(lines)
+
+    def _report(self) -> None:
+        """Send the running stats to the progress callback."""
+        if self.progress_callback:
+            self.progress_callback(self.stats)
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield each valid, previously unseen address in file order."""
+        self.stats = stats = ImportStats()
+        seen = Deduplicator()
+
+        with open(self.path, encoding="utf-8", errors="replace", newline="") as f:
+            entries = self._entries(f)
+            for result in iter_validate(entries, self.check_on_curve):
+                stats.lines_read += 1
+                if stats.lines_read % self.progress_every == 0:
+                    self._report()
+
+                if not result.address:
+                    continue
+                if not result.valid:
+                    stats.invalid += 1
+                    stats.rejections[result.code] += 1
+                    continue
+                if not seen.add(result.address):
+                    stats.duplicates += 1
+                    continue
+                if self.max_wallets is not None and stats.imported >= self.max_wallets:
+                    # Only a new wallet past the limit means the list was cut short.
+                    stats.truncated = True
+                    break
+
+                stats.imported += 1
+                yield result.address
+
+        self._report()
+
+
+def iter_chunks(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    """
+    Group a stream into lists of at most ``size`` items, reading it lazily.
+
+    Args:
+        items: Items to group
+        size: Maximum items per list
+
+    Yields:
+        Consecutive, non-empty lists of items
+    """
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def import_wallets(path: Union[str, Path], **kwargs) -> Iterator[str]:
+    """
+    Lazily import valid, unique wallet addresses from a file.
+
+    Args:
+        path: Text or ``.csv`` wallet list
+        **kwargs: Options passed to WalletImporter
+
+    Returns:
+        Iterator over the imported addresses
+    """
+    return iter(WalletImporter(path, **kwargs))
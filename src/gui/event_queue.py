@@ -0,0 +1,73 @@
+"""
+UI Event Queue - Thread-safe hand-off of updates to the Tk main loop.
+
+Worker threads post updates here instead of touching widgets. The main loop
+drains the queue on a fixed ``after()`` cadence and applies only the latest
+value of each field, so a burst of thousands of status messages costs one
+widget update per frame.
+"""
+
+import threading
+from typing import Any, Dict
+
+STATUS_ERROR_COLOR = "#ff4444"
+STATUS_SUCCESS_COLOR = "#00ff88"
+STATUS_WAITING_COLOR = "#ffaa00"
+STATUS_INFO_COLOR = "#00d4ff"
+
+
+def classify_status(message: str) -> str:
+    """
+    Pick the status label color for a message.
+
+    Args:
+        message: Status message
+
+    Returns:
+        Foreground color as a hex string
+    """
+    text = message.lower()
+    if "error" in text or "failed" in text:
+        return STATUS_ERROR_COLOR
+    if "success" in text:
+        return STATUS_SUCCESS_COLOR
+    if "waiting" in text or "retry" in text:
+        return STATUS_WAITING_COLOR
+    return STATUS_INFO_COLOR
+
+
+class UiEventQueue:
+    """Coalescing queue of per-field UI updates."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Any] = {}
+        self.posted = 0
+        self.coalesced = 0
+
+    def post(self, field: str, value: Any = None) -> None:
+        """
+        Queue an update, replacing any pending update of the same field.
+
+        Safe to call from any thread.
+
+        Args:
+            field: What to update, e.g. ``status``
+            value: New value
+        """
+        with self._lock:
+            self.posted += 1
+            if field in self._pending:
+                self.coalesced += 1
+            self._pending[field] = value
+
+    def drain(self) -> Dict[str, Any]:
+        """
+        Take every pending update.
+
+        Returns:
+            Latest value of each field posted since the last drain
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
@@ -7,11 +7,19 @@ and event handlers.
 
 import tkinter as tk
 from threading import Thread
-from typing import Optional
+from tkinter import filedialog
+from typing import Callable, Optional
 
 from ..core.airdrop_manager import AirdropManager
 from ..core.browser_utils import BrowserUtils
+from ..core.wallet_import import ImportStats, WalletImporter, iter_chunks
 from ..utils.logger import setup_logger
+from .event_queue import UiEventQueue, classify_status
+from .wallet_dashboard import WalletDashboard, WalletDashboardModel
+
+
+# Wallets added to the dashboard at a time while an import streams in.
+IMPORT_CHUNK_SIZE = 1000
 
 
 class MainWindow:
@@ -27,12 +35,19 @@ class MainWindow:
         self.progress_label: Optional[tk.Label] = None
         self.confirm_button: Optional[tk.Button] = None
         self.stop_button: Optional[tk.Button] = None
+        self.import_button: Optional[tk.Button] = None
+        self.dashboard: Optional[WalletDashboard] = None
         
+        self.import_path: Optional[str] = None
         self.is_running = False
         self.current_thread: Optional[Thread] = None
+        self.events = UiEventQueue()
+        self.dashboard_model = WalletDashboardModel()
+        self.airdrop_manager.attempt_listeners.append(self.dashboard_model.record_attempt)
         
         self._setup_window()
         self._create_widgets()
+        self.root.after(self.airdrop_manager.config.ui_refresh_ms, self._pump_events)
         
     def _setup_window(self) -> None:
         """Configure the main window properties."""
@@ -118,6 +133,31 @@ class MainWindow:
         )
         hint_label.pack(anchor="w")
         
+        buttons_frame = tk.Frame(inner_frame, bg="#2a2a2a")
+        buttons_frame.pack(anchor="w", pady=(8, 0))
+        
+        self.import_button = tk.Button(
+            buttons_frame,
+            text="📂 Import Wallet List",
+            font=("Helvetica", 9),
+            bg="#3a3a3a",
+            fg="#ffffff",
+            relief="flat",
+            command=self._on_import
+        )
+        self.import_button.pack(side="left")
+        
+        dashboard_button = tk.Button(
+            buttons_frame,
+            text="📊 Dashboard",
+            font=("Helvetica", 9),
+            bg="#3a3a3a",
+            fg="#ffffff",
+            relief="flat",
+            command=self._on_dashboard
+        )
+        dashboard_button.pack(side="left", padx=(8, 0))
+        
     def _create_control_section(self) -> None:
         """Create the control buttons section."""
         control_frame = tk.Frame(self.root, bg="#1a1a1a")
@@ -191,30 +231,57 @@ class MainWindow:
         
     def _update_progress(self, message: str) -> None:
         """
-        Update the progress label with a new message.
+        Queue a new message for the progress label.
+        
+        Safe to call from worker threads; the label is updated by the main
+        loop on its next frame.
         
         Args:
             message: Status message to display
         """
-        if self.progress_label:
-            self.progress_label.config(text=message)
-            
-            if "error" in message.lower() or "failed" in message.lower():
-                self.progress_label.config(fg="#ff4444")
-            elif "successful" in message.lower() or "success" in message.lower():
-                self.progress_label.config(fg="#00ff88")
-            elif "waiting" in message.lower() or "retry" in message.lower():
-                self.progress_label.config(fg="#ffaa00")
-            else:
-                self.progress_label.config(fg="#00d4ff")
+        self.events.post("status", message)
+    
+    def _pump_events(self) -> None:
+        """Apply queued updates on the Tk thread and schedule the next frame."""
+        try:
+            events = self.events.drain()
+            if "status" in events and self.progress_label:
+                message = events["status"]
+                self.progress_label.config(text=message, fg=classify_status(message))
+            if "import_path" in events:
+                self.import_path = events["import_path"]
+            if "import_finished" in events:
+                self.import_button.config(state="disabled" if self.is_running else "normal")
+            if "worker_finished" in events and events["worker_finished"] is self.current_thread:
+                self._reset_controls()
+            if self.dashboard is not None:
+                self.dashboard.refresh()
+        finally:
+            self.root.after(self.airdrop_manager.config.ui_refresh_ms, self._pump_events)
+    
+    def _reset_controls(self) -> None:
+        """Re-enable the inputs after a run ends."""
+        self.is_running = False
+        self.confirm_button.config(state="normal")
+        self.stop_button.config(state="disabled")
+        self.wallet_entry.config(state="normal")
+        self.import_button.config(state="normal")
                 
     def _on_confirm(self) -> None:
         """Handle the confirm button click event."""
         if self.is_running:
             return
+        
+        if self.current_thread is not None and self.current_thread.is_alive():
+            self._update_progress("Still stopping the previous run. Try again in a moment.")
+            return
             
         wallet_address = self.wallet_entry.get().strip()
         
+        if not wallet_address and self.import_path:
+            self._start_worker(self._fund_imported_wallets, (self.import_path,))
+            return
+        
         if not wallet_address:
             self._update_progress("Error: Please enter a wallet address.")
             return
@@ -222,30 +289,131 @@ class MainWindow:
         if not self.browser_utils.validate_wallet_address(wallet_address):
             self._update_progress("Error: Invalid wallet address format.")
             return
-            
+        
+        self.dashboard_model.add_wallets([wallet_address])
+        self._start_worker(
+            self.airdrop_manager.perform_airdrop_attempts,
+            (wallet_address, self._update_progress)
+        )
+    
+    def _start_worker(self, target, args: tuple) -> None:
+        """
+        Disable the inputs and run an airdrop job on a background thread.
+        
+        Args:
+            target: Airdrop manager method to run
+            args: Arguments for the method
+        """
         self.is_running = True
         self.confirm_button.config(state="disabled")
         self.stop_button.config(state="normal")
         self.wallet_entry.config(state="disabled")
+        self.import_button.config(state="disabled")
         
         self._update_progress("Starting airdrop process...")
         
-        self.current_thread = Thread(
-            target=self.airdrop_manager.perform_airdrop_attempts,
-            args=(wallet_address, self._update_progress),
-            daemon=True
+        def run() -> None:
+            try:
+                target(*args)
+            finally:
+                self.events.post("worker_finished", thread)
+        
+        thread = Thread(target=run, daemon=True)
+        self.current_thread = thread
+        thread.start()
+    
+    def _on_dashboard(self) -> None:
+        """Open the per-wallet dashboard, or raise it if already open."""
+        if self.dashboard is not None:
+            self.dashboard.winfo_toplevel().lift()
+            return
+        
+        window = tk.Toplevel(self.root)
+        window.title("Wallet Dashboard")
+        window.geometry("760x440")
+        self.dashboard = WalletDashboard(window, self.dashboard_model)
+        self.dashboard.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        def on_close() -> None:
+            self.dashboard = None
+            window.destroy()
+        
+        window.protocol("WM_DELETE_WINDOW", on_close)
+    
+    def _on_import(self) -> None:
+        """Handle the import button click event."""
+        if self.is_running:
+            return
+        
+        path = filedialog.askopenfilename(
+            title="Import Wallet List",
+            filetypes=[("Wallet lists", "*.txt *.csv"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        
+        self.import_button.config(state="disabled")
+        self._update_progress("Importing wallet list...")
+        Thread(target=self._import_wallets, args=(path,), daemon=True).start()
+    
+    def _wallet_importer(
+        self, path: str, progress_callback: Optional[Callable[[ImportStats], None]] = None
+    ) -> WalletImporter:
+        """Create an importer for a wallet list, capped at ``import_max_wallets``."""
+        return WalletImporter(
+            path,
+            progress_callback=progress_callback,
+            max_wallets=self.airdrop_manager.config.import_max_wallets,
         )
-        self.current_thread.start()
+    
+    def _fund_imported_wallets(self, path: str) -> None:
+        """
+        Stream the imported wallet list from disk into a bulk airdrop run.
+        
+        Args:
+            path: Wallet list file
+        """
+        try:
+            self.airdrop_manager.perform_bulk_airdrop(
+                self._wallet_importer(path), self._update_progress
+            )
+        except OSError as e:
+            self.logger.error(f"Failed to read wallet list: {e}")
+            self._update_progress(f"Error: Could not read wallet list: {e}")
+    
+    def _import_wallets(self, path: str) -> None:
+        """
+        Stream a wallet list from disk on a background thread.
+        
+        Args:
+            path: Wallet list file
+        """
+        def report(stats: ImportStats) -> None:
+            self._update_progress(f"Importing... {stats.summary()}")
+        
+        try:
+            importer = self._wallet_importer(path, report)
+            for chunk in iter_chunks(importer, IMPORT_CHUNK_SIZE):
+                self.dashboard_model.add_wallets(chunk)
+        except OSError as e:
+            self.logger.error(f"Failed to import wallet list: {e}")
+            self._update_progress(f"Error: Could not read wallet list: {e}")
+        else:
+            self.events.post("import_path", path if importer.stats.imported else None)
+            self.logger.info(f"Imported {path}: {importer.stats.summary()}")
+            self._update_progress(
+                f"{importer.stats.summary()}. Leave the address empty and start to fund them."
+            )
+        finally:
+            self.events.post("import_finished")
         
     def _on_stop(self) -> None:
         """Handle the stop button click event."""
         if not self.is_running:
             return
             
-        self.is_running = False
-        self.confirm_button.config(state="normal")
-        self.stop_button.config(state="disabled")
-        self.wallet_entry.config(state="normal")
+        self.airdrop_manager.stop()
+        self._reset_controls()
         
         self._update_progress("Stopped by user. Ready to start again.")
         
@@ -257,4 +425,5 @@ class MainWindow:
     def destroy(self) -> None:
         """Clean up and destroy the window."""
         self.is_running = False
+        self.airdrop_manager.close()
         self.root.destroy() 
\ No newline at end of file
@@ -0,0 +1,330 @@
+"""
+Wallet Dashboard - Per-wallet status table for large wallet sets.
+
+This module contains a thread-safe model of per-wallet attempt state and a
+Treeview pane that shows it. The pane is virtualized: the Treeview only ever
+holds the rows that fit on screen, and scrolling re-fills those rows from
+the model, so tens of thousands of wallets cost no more Tk work than a
+screenful.
+"""
+
+import math
+import threading
+import time
+import tkinter as tk
+from dataclasses import dataclass
+from tkinter import ttk
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..core.attempt_ledger import AttemptRecord
+
+COLUMNS = ("wallet", "outcome", "next_eligible_at", "latency")
+HEADINGS = {
+    "wallet": "Wallet",
+    "outcome": "Last Outcome",
+    "next_eligible_at": "Next Eligible",
+    "latency": "Latency",
+}
+# "failure" matches every unsuccessful outcome; the rest match one outcome.
+OUTCOME_FILTERS = (
+    "all", "pending", "success", "failure",
+    "rate_limited", "service_error", "not_found", "invalid_address",
+)
+
+
+@dataclass
+class WalletRow:
+    """Dashboard state of one wallet."""
+
+    wallet: str
+    outcome: str = "pending"
+    next_eligible_at: float = 0.0
+    latency: Optional[float] = None
+
+    def display_values(self) -> Tuple[str, str, str, str]:
+        """Return the row formatted for the table."""
+        if self.next_eligible_at <= 0:
+            next_eligible = "now"
+        elif math.isinf(self.next_eligible_at):
+            next_eligible = "never"
+        else:
+            next_eligible = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.next_eligible_at))
+        latency = "" if self.latency is None else f"{self.latency:.1f}s"
+        return self.wallet, self.outcome, next_eligible, latency
+
+
+_SORT_KEYS: Dict[str, Callable[[WalletRow], object]] = {
+    "wallet": lambda row: row.wallet,
+    "outcome": lambda row: row.outcome,
+    "next_eligible_at": lambda row: row.next_eligible_at,
+    "latency": lambda row: -1.0 if row.latency is None else row.latency,
+}
+
+
+class WalletDashboardModel:
+    """Thread-safe per-wallet state with a sorted, filtered view."""
+
+    def __init__(self, min_resort_interval: float = 0.2):
+        """
+        Initialize an empty model.
+
+        Args:
+            min_resort_interval: Minimum seconds between rebuilds of the sorted
+                view while rows keep changing, bounding sort cost under load
+        """
+        self.min_resort_interval = min_resort_interval
+        self.sort_column = "wallet"
+        self.sort_descending = False
+        self.filter_text = ""
+        self.outcome_filter = "all"
+        self.version = 0
+
+        self._rows: Dict[str, WalletRow] = {}
+        self._view: List[str] = []
+        self._order_dirty = False
+        self._last_resort = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._rows)
+
+    @property
+    def resort_pending(self) -> bool:
+        """Whether the view is waiting for a throttled rebuild."""
+        return self._order_dirty
+
+    def add_wallets(self, wallets) -> None:
+        """Add wallets that have not been attempted yet."""
+        with self._lock:
+            for wallet in wallets:
+                if wallet not in self._rows:
+                    self._rows[wallet] = WalletRow(wallet)
+            self._order_dirty = True
+            self.version += 1
+
+    def update(self, wallet: str, **fields) -> None:
+        """
+        Create or update a wallet's row.
+
+        Args:
+            wallet: Wallet address
+            **fields: WalletRow fields to set
+        """
+        with self._lock:
+            row = self._rows.get(wallet)
+            if row is None:
+                row = self._rows[wallet] = WalletRow(wallet)
+                self._order_dirty = True
+            changes_order = self.sort_column in fields or (
+                "outcome" in fields and self.outcome_filter != "all"
+            )
+            for name, value in fields.items():
+                setattr(row, name, value)
+            if changes_order:
+                self._order_dirty = True
+            self.version += 1
+
+    def record_attempt(self, record: AttemptRecord) -> None:
+        """Update a wallet's row from a finished attempt."""
+        self.update(
+            record.wallet,
+            outcome=record.outcome,
+            next_eligible_at=record.next_eligible_at,
+            latency=record.ended_at - record.started_at,
+        )
+
+    def set_sort(self, column: str, descending: Optional[bool] = None) -> None:
+        """
+        Sort the view by a column.
+
+        Args:
+            column: One of ``COLUMNS``
+            descending: Sort order; None toggles it when the column is
+                already the sort column
+        """
+        if column not in _SORT_KEYS:
+            raise ValueError(f"Unknown column: {column}")
+        with self._lock:
+            if descending is None:
+                descending = not self.sort_descending if column == self.sort_column else False
+            self.sort_column = column
+            self.sort_descending = descending
+            self._invalidate()
+
+    def set_filter(self, text: str = "", outcome: str = "all") -> None:
+        """
+        Show only matching wallets.
+
+        Args:
+            text: Substring the wallet address must contain
+            outcome: Last outcome to show, or ``all``
+        """
+        with self._lock:
+            self.filter_text = text.strip()
+            self.outcome_filter = outcome
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Force a rebuild of the view on next access; the caller holds the lock."""
+        self._order_dirty = True
+        self._last_resort = 0.0
+        self.version += 1
+
+    def _matches_outcome(self, outcome: str) -> bool:
+        """Whether an outcome passes the outcome filter."""
+        if self.outcome_filter == "failure":
+            return outcome not in ("pending", "success")
+        return outcome == self.outcome_filter
+
+    def _rebuild(self) -> None:
+        """Filter and sort the rows; the caller holds the lock."""
+        rows = self._rows.values()
+        if self.filter_text:
+            rows = [row for row in rows if self.filter_text in row.wallet]
+        if self.outcome_filter != "all":
+            rows = [row for row in rows if self._matches_outcome(row.outcome)]
+        key = _SORT_KEYS[self.sort_column]
+        ordered = sorted(rows, key=key, reverse=self.sort_descending)
+        self._view = [row.wallet for row in ordered]
+        self._order_dirty = False
+        self._last_resort = time.monotonic()
+
+    def _current_view(self) -> List[str]:
+        """Return the view, rebuilding it when due; the caller holds the lock."""
+        if self._order_dirty and time.monotonic() - self._last_resort >= self.min_resort_interval:
+            self._rebuild()
+        return self._view
+
+    def visible_count(self) -> int:
+        """Number of wallets in the filtered view."""
+        with self._lock:
+            return len(self._current_view())
+
+    def window(self, offset: int, count: int) -> List[Tuple[str, str, str, str]]:
+        """
+        Get display values for a slice of the view.
+
+        Args:
+            offset: Index of the first row
+            count: Maximum number of rows
+
+        Returns:
+            Formatted rows, in view order
+        """
+        with self._lock:
+            wallets = self._current_view()[offset:offset + count]
+            return [self._rows[wallet].display_values() for wallet in wallets]
+
+
+class WalletDashboard(ttk.Frame):
+    """Virtualized Treeview pane over a WalletDashboardModel."""
+
+    def __init__(self, parent, model: WalletDashboardModel, visible_rows: int = 15):
+        """
+        Create the pane.
+
+        Args:
+            parent: Parent widget
+            model: Model to display
+            visible_rows: Number of table rows shown at once
+        """
+        super().__init__(parent)
+        self.model = model
+        self.visible_rows = visible_rows
+        self.offset = 0
+        self._shown_version = -1
+
+        self._create_filter_bar()
+
+        table = ttk.Frame(self)
+        table.pack(fill="both", expand=True)
+        self.tree = ttk.Treeview(table, columns=COLUMNS, show="headings", height=visible_rows)
+        for column in COLUMNS:
+            self.tree.heading(column, text=HEADINGS[column], command=lambda c=column: self._on_sort(c))
+            self.tree.column(column, width=320 if column == "wallet" else 110, stretch=column == "wallet")
+        self.scrollbar = ttk.Scrollbar(table, orient="vertical", command=self._on_scrollbar)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.summary = ttk.Label(self, text="")
+        self.summary.pack(anchor="w", pady=(4, 0))
+
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequence, self._on_wheel)
+        self.refresh(force=True)
+
+    def _create_filter_bar(self) -> None:
+        """Create the wallet search box and outcome filter."""
+        bar = ttk.Frame(self)
+        bar.pack(fill="x", pady=(0, 4))
+        ttk.Label(bar, text="Filter:").pack(side="left")
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add("write", lambda *_: self._on_filter())
+        ttk.Entry(bar, textvariable=self.filter_var, width=30).pack(side="left", padx=4)
+        self.outcome_var = tk.StringVar(value="all")
+        outcome = ttk.Combobox(
+            bar, textvariable=self.outcome_var, values=OUTCOME_FILTERS, state="readonly", width=16
+        )
+        outcome.bind("<<ComboboxSelected>>", lambda _: self._on_filter())
+        outcome.pack(side="left")
+
+    def _on_filter(self) -> None:
+        self.model.set_filter(self.filter_var.get(), self.outcome_var.get())
+        self.offset = 0
+        self.refresh(force=True)
+
+    def _on_sort(self, column: str) -> None:
+        self.model.set_sort(column)
+        self.refresh(force=True)
+
+    def _on_scrollbar(self, action: str, value: str, unit: Optional[str] = None) -> None:
+        """Handle ``moveto`` and ``scroll`` commands from the scrollbar."""
+        if action == "moveto":
+            self._scroll_to(int(float(value) * self.model.visible_count()))
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self._scroll_to(self.offset + int(value) * step)
+
+    def _on_wheel(self, event) -> str:
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self._scroll_to(self.offset - 3)
+        else:
+            self._scroll_to(self.offset + 3)
+        return "break"
+
+    def _scroll_to(self, offset: int) -> None:
+        total = self.model.visible_count()
+        self.offset = max(0, min(offset, total - self.visible_rows))
+        self.refresh(force=True)
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        Re-fill the visible rows from the model if it changed.
+
+        Cheap to call every frame: it does nothing when the model is
+        unchanged, and otherwise touches at most ``visible_rows`` items.
+        """
+        if not force and self.model.version == self._shown_version and not self.model.resort_pending:
+            return
+        self._shown_version = self.model.version
+
+        total = self.model.visible_count()
+        self.offset = max(0, min(self.offset, total - self.visible_rows))
+        rows = self.model.window(self.offset, self.visible_rows)
+
+        items = self.tree.get_children()
+        for index, values in enumerate(rows):
+            if index < len(items):
+                if self.tree.item(items[index], "values") != values:
+                    self.tree.item(items[index], values=values)
+            else:
+                self.tree.insert("", "end", values=values)
+        if len(items) > len(rows):
+            self.tree.delete(*items[len(rows):])
+
+        if total:
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + len(rows)) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        self.summary.config(text=f"{total} of {len(self.model)} wallets")
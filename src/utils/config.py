@@ -2,13 +2,52 @@
 Configuration Management - Application settings and constants.
 
 This module contains configuration settings, constants, and environment
-variable management for the application.
+variable management for the application. Settings are layered: dataclass
+defaults, then an optional TOML file, then environment variables, then
+overrides from the caller (e.g. command-line options). Timing and polling
+knobs can be reloaded from the TOML file while the application runs.
 """
 
+import dataclasses
+import logging
 import os
+import sys
+import threading
+import typing
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Union
+
+DEFAULT_CONFIG_FILE = "config.toml"
+DATA_DIR_NAME = "solana-airdrop-tool"
+
+
+class ConfigError(ValueError):
+    """Raised when a configuration file or value is invalid."""
+
+
+def default_data_dir() -> Path:
+    """
+    Get the per-user directory for the tool's data files.
+    
+    ``$AIRDROP_DATA_DIR`` takes precedence; otherwise the platform's user
+    data directory is used (``%LOCALAPPDATA%`` on Windows,
+    ``~/Library/Application Support`` on macOS, ``$XDG_DATA_HOME`` or
+    ``~/.local/share`` elsewhere).
+    
+    Returns:
+        Path to the data directory, which may not exist yet
+    """
+    explicit = os.getenv("AIRDROP_DATA_DIR")
+    if explicit:
+        return Path(explicit).expanduser()
+    if sys.platform == "win32":
+        base = Path(os.getenv("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Application Support"
+    else:
+        base = Path(os.getenv("XDG_DATA_HOME") or Path.home() / ".local" / "share")
+    return base / DATA_DIR_NAME
 
 
 @dataclass
@@ -21,58 +60,415 @@ class AppConfig:
        
     solana_faucet_url: str = "https://faucet.solana.com/"
     
+    airdrop_backend: str = "browser"
+    rpc_url: str = "http://127.0.0.1:8899"
+    rpc_timeout: float = 10.0
+    rpc_pool_size: int = 4
+    rpc_batch_size: int = 100
+    rpc_ws_url: str = ""
+    confirm_airdrops: bool = True
+    confirmation_commitment: str = "confirmed"
+    confirmation_timeout: float = 30.0
+    airdrop_lamports: int = 1_000_000_000
+    
+    browser_profile: str = "default"
     browser_arguments: List[str] = None
-    page_load_timeout: int = 30
-    element_wait_timeout: int = 10
+    page_load_timeout: float = 30.0
+    element_wait_timeout: float = 10.0
+    element_poll_interval: float = 0.5
+    browser_pool_enabled: bool = False
+    browser_pool_max_uses: int = 50
+    browser_pool_idle_timeout: float = 300.0
+    watchdog_enabled: bool = True
+    watchdog_interval: float = 5.0
+    watchdog_max_rss_mb: float = 2048.0
+    watchdog_max_cpu_percent: float = 0.0
+    watchdog_max_lifetime: float = 900.0
+    watchdog_state_dir: str = "browsers"
     
     retry_cooldown_seconds: int = 3600
+    transient_retry_seconds: float = 60.0
     success_wait_seconds: int = 3
+    scheduler_workers: int = 2
     typing_min_delay: float = 0.05
     typing_max_delay: float = 0.1
+    challenge_retry_interval: float = 2.0
+    challenge_max_retries: int = -1
+    response_wait_seconds: float = 10.0
+    result_check_timeout: float = 20.0
+    config_reload_interval: float = 2.0
     
     window_width: int = 450
     window_height: int = 500
     window_resizable: bool = False
+    ui_refresh_ms: int = 50
+    
+    metrics_enabled: bool = False
+    metrics_host: str = "127.0.0.1"
+    metrics_port: int = 0
+    metrics_snapshot_path: str = ""
+    metrics_snapshot_interval: float = 15.0
+    
+    trace_mode: str = "off"
+    trace_dir: str = "logs/traces"
+    trace_buffer_events: int = 100_000
+    
+    notification_sinks: List[str] = None
+    notification_webhook_url: str = ""
+    notification_file: str = ""
+    notification_min_interval: float = 5.0
     
     log_level: str = "INFO"
     log_to_file: bool = True
     log_to_console: bool = True
+    log_format: str = "text"
+    log_max_bytes: int = 10 * 1024 * 1024
+    log_backup_count: int = 5
+    
+    # Caps a wallet-list import, bounding the memory its duplicate check uses
+    # (about 100 bytes per wallet).
+    import_max_wallets: int = 100_000
     
     logs_dir: str = "logs"
+    # Relative ledger and watchdog paths are resolved against this; empty
+    # means default_data_dir().
+    data_dir: str = ""
+    ledger_path: str = "attempts.db"
     assets_dir: str = "assets"
     
     def __post_init__(self):
         """Initialize default values after dataclass creation."""
         if self.browser_arguments is None:
             self.browser_arguments = ["-no-first-run"]
+        if self.notification_sinks is None:
+            self.notification_sinks = ["desktop"]
+    
+    def data_path(self, path: str) -> str:
+        """
+        Resolve a data file setting against the data directory.
+        
+        Args:
+            path: Setting value; absolute paths are returned unchanged
+            
+        Returns:
+            The resolved path, or "" if the setting is empty (disabled)
+        """
+        if not path:
+            return ""
+        base = Path(self.data_dir).expanduser() if self.data_dir else default_data_dir()
+        return str(base / Path(path).expanduser())
+    
+    def validate(self) -> None:
+        """
+        Check that the settings are usable.
+        
+        Raises:
+            ConfigError: If a value is out of range or inconsistent
+        """
+        positive = (
+            "page_load_timeout", "element_wait_timeout", "element_poll_interval",
+            "result_check_timeout", "rpc_timeout", "confirmation_timeout",
+            "config_reload_interval", "ui_refresh_ms", "scheduler_workers",
+            "rpc_pool_size", "rpc_batch_size", "browser_pool_max_uses", "watchdog_interval",
+            "trace_buffer_events", "import_max_wallets",
+        )
+        for name in positive:
+            if getattr(self, name) <= 0:
+                raise ConfigError(f"{name} must be greater than 0, got {getattr(self, name)}")
+        non_negative = (
+            "retry_cooldown_seconds", "transient_retry_seconds", "success_wait_seconds",
+            "typing_min_delay", "typing_max_delay",
+            "challenge_retry_interval", "response_wait_seconds", "notification_min_interval",
+            "browser_pool_idle_timeout", "metrics_snapshot_interval",
+            "watchdog_max_rss_mb", "watchdog_max_cpu_percent", "watchdog_max_lifetime",
+        )
+        for name in non_negative:
+            if getattr(self, name) < 0:
+                raise ConfigError(f"{name} must not be negative, got {getattr(self, name)}")
+        if self.typing_min_delay > self.typing_max_delay:
+            raise ConfigError("typing_min_delay must not exceed typing_max_delay")
+        if self.challenge_max_retries < -1:
+            raise ConfigError("challenge_max_retries must be -1 (unlimited) or more")
+        if not self.solana_faucet_url.startswith(("http://", "https://")):
+            raise ConfigError(f"solana_faucet_url must be an http(s) URL, got {self.solana_faucet_url!r}")
+        if self.airdrop_backend not in ("browser", "rpc"):
+            raise ConfigError(f"Unknown airdrop backend: {self.airdrop_backend}")
+        if self.log_format not in ("text", "json"):
+            raise ConfigError(f"log_format must be 'text' or 'json', got {self.log_format!r}")
+        if self.trace_mode not in ("off", "attempt", "buffer"):
+            raise ConfigError(f"trace_mode must be 'off', 'attempt' or 'buffer', got {self.trace_mode!r}")
+        
+        # Imported here because these modules import this one.
+        from ..core.browser_profile import PROFILES
+        from ..core.confirmation import COMMITMENT_LEVELS
+        from ..core.notifier import NOTIFICATION_SINKS
+        
+        if self.browser_profile not in PROFILES:
+            raise ConfigError(
+                f"browser_profile must be one of {', '.join(PROFILES)}, "
+                f"got {self.browser_profile!r}"
+            )
+        if self.confirmation_commitment not in COMMITMENT_LEVELS:
+            raise ConfigError(
+                f"confirmation_commitment must be one of {', '.join(COMMITMENT_LEVELS)}, "
+                f"got {self.confirmation_commitment!r}"
+            )
+        for sink in self.notification_sinks:
+            if sink not in NOTIFICATION_SINKS:
+                raise ConfigError(
+                    f"notification_sinks entries must be one of {', '.join(NOTIFICATION_SINKS)}, "
+                    f"got {sink!r}"
+                )
+
+
+# Settings that take effect on the next use when the config file changes.
+# Everything else is read once at startup and needs a restart.
+RELOADABLE_FIELDS = frozenset({
+    "solana_faucet_url",
+    "page_load_timeout",
+    "element_wait_timeout",
+    "element_poll_interval",
+    "retry_cooldown_seconds",
+    "transient_retry_seconds",
+    "success_wait_seconds",
+    "typing_min_delay",
+    "typing_max_delay",
+    "challenge_retry_interval",
+    "challenge_max_retries",
+    "response_wait_seconds",
+    "result_check_timeout",
+    "ui_refresh_ms",
+})
+
+_FIELD_TYPES = typing.get_type_hints(AppConfig)
+
+
+def _check_type(name: str, value: Any) -> Any:
+    """Check a value against the type of the AppConfig field it sets."""
+    expected = _FIELD_TYPES[name]
+    if expected is bool:
+        valid = isinstance(value, bool)
+    elif expected is int:
+        valid = isinstance(value, int) and not isinstance(value, bool)
+    elif expected is float:
+        valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+        value = float(value) if valid else value
+    elif expected is str:
+        valid = isinstance(value, str)
+    else:  # List[str]
+        valid = isinstance(value, list) and all(isinstance(item, str) for item in value)
+    if not valid:
+        raise ConfigError(f"{name} must be of type {getattr(expected, '__name__', expected)}, got {value!r}")
+    return value
+
+
+def apply_settings(app_config: AppConfig, settings: Mapping[str, Any], source: str = "settings") -> None:
+    """
+    Set AppConfig fields from a mapping, checking names and types.
+    
+    Tables (nested mappings) are flattened, so ``[browser] page_load_timeout``
+    and a top-level ``page_load_timeout`` are equivalent.
+    
+    Args:
+        app_config: Configuration to update in place
+        settings: Field names to values
+        source: Where the settings came from, used in error messages
+        
+    Raises:
+        ConfigError: If a name is unknown or a value has the wrong type
+    """
+    for name, value in settings.items():
+        if isinstance(value, dict):
+            apply_settings(app_config, value, source)
+            continue
+        if name not in _FIELD_TYPES:
+            raise ConfigError(f"Unknown setting {name!r} in {source}")
+        setattr(app_config, name, _check_type(name, value))
+
+
+def load_toml(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Read a TOML configuration file.
+    
+    Args:
+        path: Path of the file
+        
+    Returns:
+        The parsed document
+        
+    Raises:
+        ConfigError: If the file cannot be read or parsed
+    """
+    try:
+        import tomllib
+    except ModuleNotFoundError:  # Python < 3.11
+        import tomli as tomllib
+    
+    try:
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    except OSError as e:
+        raise ConfigError(f"Cannot read config file {path}: {e}") from e
+    except tomllib.TOMLDecodeError as e:
+        raise ConfigError(f"Invalid TOML in {path}: {e}") from e
 
 
 class ConfigManager:
     """Manages application configuration and environment variables."""
     
-    def __init__(self):
-        self.config = AppConfig()
-        self._load_from_env()
+    def __init__(
+        self,
+        config_path: Optional[Union[str, Path]] = None,
+        overrides: Optional[Mapping[str, Any]] = None,
+    ):
+        """
+        Load the configuration.
+        
+        Args:
+            config_path: TOML file, defaults to ``$AIRDROP_CONFIG`` or
+                ``config.toml`` in the working directory; only an explicitly
+                given file must exist
+            overrides: Settings applied last, above the environment
+            
+        Raises:
+            ConfigError: If the file or a setting is invalid
+        """
+        explicit = config_path or os.getenv("AIRDROP_CONFIG")
+        self.config_path = Path(explicit or DEFAULT_CONFIG_FILE)
+        if explicit and not self.config_path.is_file():
+            raise ConfigError(f"Config file not found: {self.config_path}")
+        self.overrides = dict(overrides or {})
+        self.logger = logging.getLogger(__name__)
+        # Called with the config and the names of reloaded settings.
+        self.listeners: List[Callable[[AppConfig, Set[str]], None]] = []
+        self._loaded = self._build()
+        self.config = dataclasses.replace(self._loaded)
+        self._watcher: Optional["ConfigWatcher"] = None
+    
+    def _build(self) -> AppConfig:
+        """Build a validated configuration from defaults, file, environment and overrides."""
+        app_config = AppConfig()
+        if self.config_path.is_file():
+            apply_settings(app_config, load_toml(self.config_path), str(self.config_path))
+        self._load_from_env(app_config)
+        apply_settings(app_config, self.overrides, "overrides")
+        app_config.validate()
+        return app_config
     
-    def _load_from_env(self) -> None:
+    def reload(self) -> Set[str]:
+        """
+        Re-read the configuration and apply changed reloadable settings in place.
+        
+        Objects holding the config see the new values on their next read.
+        Changes to other settings are logged and take effect after a restart.
+        
+        Returns:
+            Names of the settings that changed
+            
+        Raises:
+            ConfigError: If the new configuration is invalid; the current one
+                is left untouched
+        """
+        loaded = self._build()
+        changed = {
+            field.name for field in dataclasses.fields(AppConfig)
+            if getattr(loaded, field.name) != getattr(self._loaded, field.name)
+        }
+        self._loaded = loaded
+        applied = changed & RELOADABLE_FIELDS
+        for name in applied:
+            setattr(self.config, name, getattr(loaded, name))
+        if applied:
+            self.logger.info(f"Reloaded settings: {', '.join(sorted(applied))}")
+        if changed - applied:
+            self.logger.warning(
+                f"Changed settings need a restart to take effect: {', '.join(sorted(changed - applied))}"
+            )
+        for listener in self.listeners:
+            try:
+                listener(self.config, applied)
+            except Exception:
+                self.logger.warning("Config listener failed", exc_info=True)
+        return applied
+    
+    def watch(self, interval: Optional[float] = None) -> "ConfigWatcher":
+        """
+        Reload the configuration whenever the TOML file changes.
+        
+        Args:
+            interval: Seconds between checks, defaults to ``config_reload_interval``
+            
+        Returns:
+            The running watcher; stopped by close()
+        """
+        if self._watcher is None:
+            self._watcher = ConfigWatcher(self, interval or self.config.config_reload_interval)
+        return self._watcher
+    
+    def close(self) -> None:
+        """Stop watching the config file."""
+        if self._watcher is not None:
+            self._watcher.close()
+            self._watcher = None
+    
+    def _load_from_env(self, app_config: AppConfig) -> None:
         """Load configuration from environment variables."""
         if os.getenv("BROWSER_TIMEOUT"):
             try:
-                self.config.page_load_timeout = int(os.getenv("BROWSER_TIMEOUT"))
+                app_config.page_load_timeout = int(os.getenv("BROWSER_TIMEOUT"))
             except ValueError:
                 pass
         
         if os.getenv("RETRY_COOLDOWN"):
             try:
-                self.config.retry_cooldown_seconds = int(os.getenv("RETRY_COOLDOWN"))
+                app_config.retry_cooldown_seconds = int(os.getenv("RETRY_COOLDOWN"))
             except ValueError:
                 pass
         
         if os.getenv("LOG_LEVEL"):
-            self.config.log_level = os.getenv("LOG_LEVEL").upper()
+            app_config.log_level = os.getenv("LOG_LEVEL").upper()
+        
+        if os.getenv("LOG_FORMAT"):
+            app_config.log_format = os.getenv("LOG_FORMAT").lower()
         
         if os.getenv("FAUCET_URL"):
-            self.config.solana_faucet_url = os.getenv("FAUCET_URL")
+            app_config.solana_faucet_url = os.getenv("FAUCET_URL")
+        
+        if os.getenv("AIRDROP_BACKEND"):
+            app_config.airdrop_backend = os.getenv("AIRDROP_BACKEND").lower()
+        
+        if os.getenv("RPC_URL"):
+            app_config.rpc_url = os.getenv("RPC_URL")
+        
+        if os.getenv("BROWSER_PROFILE"):
+            app_config.browser_profile = os.getenv("BROWSER_PROFILE").lower()
+        
+        if os.getenv("METRICS_PORT"):
+            try:
+                app_config.metrics_port = int(os.getenv("METRICS_PORT"))
+                app_config.metrics_enabled = True
+            except ValueError:
+                pass
+        
+        if os.getenv("METRICS_SNAPSHOT"):
+            app_config.metrics_snapshot_path = os.getenv("METRICS_SNAPSHOT")
+            app_config.metrics_enabled = True
+        
+        if os.getenv("TRACE_MODE"):
+            app_config.trace_mode = os.getenv("TRACE_MODE").lower()
+        
+        if os.getenv("BROWSER_POOL"):
+            app_config.browser_pool_enabled = os.getenv("BROWSER_POOL").lower() in ("1", "true", "yes")
+        
+        if os.getenv("NOTIFY_SINKS") is not None:
+            app_config.notification_sinks = [
+                sink.strip().lower() for sink in os.getenv("NOTIFY_SINKS").split(",") if sink.strip()
+            ]
+        
+        if os.getenv("NOTIFY_WEBHOOK_URL"):
+            app_config.notification_webhook_url = os.getenv("NOTIFY_WEBHOOK_URL")
+            if "webhook" not in app_config.notification_sinks:
+                app_config.notification_sinks.append("webhook")
     
     def get_config(self) -> AppConfig:
         """
@@ -107,5 +503,104 @@ class ConfigManager:
         self.get_assets_path().mkdir(exist_ok=True)
 
 
-config_manager = ConfigManager()
-config = config_manager.get_config() 
\ No newline at end of file
+class ConfigWatcher:
+    """Polls the config file and reloads the configuration when it changes."""
+    
+    def __init__(self, manager: ConfigManager, interval: float = 2.0):
+        """
+        Start watching.
+        
+        Args:
+            manager: Configuration to reload
+            interval: Seconds between checks of the file's modification time
+        """
+        self.manager = manager
+        self.interval = interval
+        self._signature = self._stat()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="config-watcher", daemon=True)
+        self._thread.start()
+    
+    def _stat(self) -> Optional[tuple]:
+        try:
+            stat = self.manager.config_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def check(self) -> bool:
+        """
+        Reload now if the file changed since the last check.
+        
+        Returns:
+            True if the configuration was reloaded
+        """
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return False
+        self._signature = signature
+        try:
+            self.manager.reload()
+        except ConfigError as e:
+            self.manager.logger.error(f"Keeping the current configuration: {e}")
+            return False
+        return True
+    
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+    
+    def close(self) -> None:
+        """Stop watching."""
+        self._stop.set()
+        self._thread.join()
+
+
+_config_manager: Optional[ConfigManager] = None
+_config_manager_lock = threading.Lock()
+
+
+def get_config_manager() -> ConfigManager:
+    """
+    Get the application's configuration manager, loading it on first use.
+    
+    Loading is deferred to the first call so that importing this module
+    never reads files or raises; entry points call this inside their error
+    handling.
+    
+    Returns:
+        The shared ConfigManager
+        
+    Raises:
+        ConfigError: If the config file or a setting is invalid
+    """
+    global _config_manager
+    with _config_manager_lock:
+        if _config_manager is None:
+            _config_manager = ConfigManager()
+        return _config_manager
+
+
+def set_config_manager(manager: ConfigManager) -> None:
+    """
+    Make a configuration manager the application's shared one.
+    
+    Args:
+        manager: Configuration loaded by the caller, e.g. with command-line overrides
+    """
+    global _config_manager
+    with _config_manager_lock:
+        _config_manager = manager
+
+
+def get_config() -> AppConfig:
+    """
+    Get the application's configuration, loading it on first use.
+    
+    Returns:
+        The shared AppConfig
+        
+    Raises:
+        ConfigError: If the config file or a setting is invalid
+    """
+    return get_config_manager().get_config()
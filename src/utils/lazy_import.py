@@ -0,0 +1,76 @@
+"""
+Lazy Imports - Defer heavy optional dependencies until first use.
+
+Importing DrissionPage or plyer costs a few hundred milliseconds and tens of
+megabytes, which entry points that never open a browser should not pay.
+``lazy_import`` returns a stand-in that imports the real object on first
+call or attribute access and forwards to it from then on.
+"""
+
+import importlib
+import threading
+from typing import Any, Optional
+
+_UNSET = object()
+
+
+class LazyObject:
+    """Proxy for ``module.attribute`` that is imported on first use."""
+
+    __slots__ = ("_module_name", "_attribute", "_target", "_lock")
+
+    def __init__(self, module_name: str, attribute: Optional[str] = None):
+        object.__setattr__(self, "_module_name", module_name)
+        object.__setattr__(self, "_attribute", attribute)
+        object.__setattr__(self, "_target", _UNSET)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _resolve(self) -> Any:
+        """Import and cache the target object."""
+        target = self._target
+        if target is _UNSET:
+            with self._lock:
+                target = self._target
+                if target is _UNSET:
+                    target = importlib.import_module(self._module_name)
+                    if self._attribute:
+                        target = getattr(target, self._attribute)
+                    object.__setattr__(self, "_target", target)
+        return target
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the target has been imported."""
+        return self._target is not _UNSET
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._resolve(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._resolve(), name)
+
+    def __repr__(self) -> str:
+        name = f"{self._module_name}.{self._attribute}" if self._attribute else self._module_name
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy {name} ({state})>"
+
+
+def lazy_import(module_name: str, attribute: Optional[str] = None) -> LazyObject:
+    """
+    Refer to a module, or an attribute of it, without importing it yet.
+
+    Args:
+        module_name: Module to import on first use
+        attribute: Attribute of the module to stand in for, or None for the
+            module itself
+
+    Returns:
+        A proxy that imports the target on first call or attribute access
+    """
+    return LazyObject(module_name, attribute)
@@ -2,65 +2,215 @@
 Logger Utility - Centralized logging configuration.
 
 This module provides a centralized logging setup for the entire application
-with proper formatting and file/console output.
+with proper formatting and file/console output. Records are handed to a
+queue and written by a background listener thread, so logging never blocks
+the GUI or worker threads on disk I/O. Log files rotate by size, rotated
+files are gzipped, and an optional JSON-lines format carries structured
+fields such as the wallet, attempt and phase.
 """
 
+import atexit
+import copy
+import gzip
+import json
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import queue
+import shutil
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import List, Optional
 
+from .config import AppConfig, get_config
 
-def setup_logger(name: str = "solana_airdrop_tool", level: int = logging.INFO) -> logging.Logger:
+# Attributes passed with ``extra=`` that the JSON formatter emits as fields.
+STRUCTURED_FIELDS = ("wallet", "attempt", "phase", "duration", "outcome", "pid", "rss_bytes", "cpu_percent")
+
+# Module loggers (``logging.getLogger(__name__)``) live under this package.
+PACKAGE_LOGGER = __name__.split(".")[0]
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_queue_loggers: List[logging.Logger] = []
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats each record as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        for name in STRUCTURED_FIELDS:
+            value = getattr(record, name, None)
+            if value is not None:
+                entry[name] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that keeps the traceback apart from the message."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Make a record safe to hand to the listener thread.
+
+        The stock handler folds the traceback into ``msg`` and drops
+        ``exc_info``; here the message is merged with its arguments and the
+        traceback is kept as text in ``exc_text``, so each formatter places
+        it as usual and JSON lines still get their ``exception`` field.
+        """
+        record = copy.copy(record)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.getMessage()
+        record.message = record.msg
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+class GzipRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Size-based rotating file handler that gzips rotated files."""
+
+    def __init__(self, filename, max_bytes: int, backup_count: int, encoding: str = "utf-8"):
+        """
+        Initialize the handler.
+
+        Args:
+            filename: Active log file
+            max_bytes: Size at which the file is rotated
+            backup_count: Number of rotated ``.gz`` files kept
+            encoding: File encoding
+        """
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding)
+        self.namer = lambda name: name + ".gz"
+        self.rotator = self._gzip_rotate
+
+    @staticmethod
+    def _gzip_rotate(source: str, dest: str) -> None:
+        with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.remove(source)
+
+
+def _level_value(level_name: str) -> int:
+    """Convert a level name such as ``INFO`` to its numeric value."""
+    value = logging.getLevelName(level_name.upper())
+    return value if isinstance(value, int) else logging.INFO
+
+
+def setup_logger(
+    name: str = "solana_airdrop_tool",
+    level: Optional[int] = None,
+    app_config: Optional[AppConfig] = None,
+) -> logging.Logger:
     """
     Set up and configure the application logger.
-    
+
+    The application logger and the package's module loggers share one
+    queue; a listener thread formats and writes the records.
+
     Args:
         name: Logger name
-        level: Logging level
-        
+        level: Logging level, defaults to ``AppConfig.log_level``
+        app_config: Configuration to read, defaults to the global config
+
     Returns:
         Configured logger instance
     """
-    logs_dir = Path("logs")
-    logs_dir.mkdir(exist_ok=True)
-    
+    global _listener, _queue_handler
+    settings = app_config or get_config()
+    level = _level_value(settings.log_level) if level is None else level
+
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    
+
     if logger.handlers:
         return logger
-    
-    detailed_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
-    )
-    simple_formatter = logging.Formatter(
-        "%(asctime)s - %(levelname)s - %(message)s"
-    )
-    
-    log_filename = f"airdrop_tool_{datetime.now().strftime('%Y%m%d')}.log"
-    file_handler = logging.FileHandler(logs_dir / log_filename, encoding='utf-8')
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(detailed_formatter)
-    
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(level)
-    console_handler.setFormatter(simple_formatter)
-    
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
+
+    handlers = []
+    if settings.log_to_file:
+        logs_dir = Path(settings.logs_dir)
+        logs_dir.mkdir(parents=True, exist_ok=True)
+        if settings.log_format == "json":
+            file_formatter: logging.Formatter = JsonLinesFormatter()
+            log_filename = "airdrop_tool.jsonl"
+        else:
+            file_formatter = logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
+            )
+            log_filename = "airdrop_tool.log"
+        file_handler = GzipRotatingFileHandler(
+            logs_dir / log_filename, settings.log_max_bytes, settings.log_backup_count
+        )
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(file_formatter)
+        handlers.append(file_handler)
+
+    if settings.log_to_console:
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(level)
+        console_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+        handlers.append(console_handler)
+
+    if not handlers:
+        logger.addHandler(logging.NullHandler())
+        return logger
+
+    stop_logging()
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    _queue_handler = StructuredQueueHandler(log_queue)
+    for target in (logger, logging.getLogger(PACKAGE_LOGGER)):
+        target.addHandler(_queue_handler)
+        target.setLevel(level)
+        _queue_loggers.append(target)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
     return logger
 
 
+def stop_logging() -> None:
+    """
+    Flush queued records and stop the background listener.
+
+    The loggers are detached from the queue, so a later setup_logger()
+    call configures them afresh.
+    """
+    global _listener, _queue_handler
+    for target in _queue_loggers:
+        target.removeHandler(_queue_handler)
+    _queue_loggers.clear()
+    _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(stop_logging)
+
+
 def get_logger(name: str = "solana_airdrop_tool") -> logging.Logger:
     """
     Get an existing logger instance.
-    
+
     Args:
         name: Logger name
-        
+
     Returns:
         Logger instance
     """
-    return logging.getLogger(name) 
\ No newline at end of file
+    return logging.getLogger(name)
@@ -0,0 +1,48 @@
+"""
+Shared fixtures for the browser benchmarks.
+
+Benchmarks run against pages served from ``tests/fixtures`` by a local HTTP
+server and are skipped when no Chromium browser can be launched.
+"""
+
+import functools
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """Static file handler that does not log requests."""
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="session")
+def fixture_server():
+    """Serve the HTML fixtures and yield the base URL."""
+    handler = functools.partial(QuietHandler, directory=str(FIXTURES_DIR))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope="session")
+def chromium_page():
+    """Launch a headless Chromium page, skipping when no browser is available."""
+    from DrissionPage import ChromiumOptions, ChromiumPage
+
+    options = ChromiumOptions().headless().auto_port()
+    try:
+        page = ChromiumPage(addr_or_opts=options)
+    except Exception as e:
+        pytest.skip(f"Chromium not available: {e}")
+    yield page
+    page.quit()
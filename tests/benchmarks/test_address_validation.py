@@ -0,0 +1,43 @@
+"""
+Benchmark batch validation of a large address file.
+"""
+
+import os
+import time
+
+import pytest
+
+from src.core.address_validator import BASE58_ALPHABET, iter_validate
+
+LINES = 1_000_000
+BUDGET_SECONDS = 10.0
+
+
+def encode(data: bytes) -> str:
+    """Encode bytes as base58."""
+    number = int.from_bytes(data, "big")
+    digits = ""
+    while number:
+        number, remainder = divmod(number, 58)
+        digits = BASE58_ALPHABET[remainder] + digits
+    return "1" * (len(data) - len(data.lstrip(b"\x00"))) + digits
+
+
+@pytest.mark.benchmark
+def test_million_line_file(tmp_path):
+    """A million-line address file should validate within the budget."""
+    unique = [encode(os.urandom(32)) for _ in range(10_000)] + ["z" * 44, "not-an-address"]
+    path = tmp_path / "wallets.txt"
+    with open(path, "w", encoding="utf-8") as f:
+        for index in range(LINES):
+            f.write(unique[index % len(unique)] + "\n")
+
+    start = time.perf_counter()
+    with open(path, encoding="utf-8") as f:
+        valid = sum(result.valid for result in iter_validate(line.strip() for line in f))
+    elapsed = time.perf_counter() - start
+
+    print(f"\nvalidated {LINES} lines in {elapsed:.2f} s")
+    full_cycles, rest = divmod(LINES, len(unique))
+    assert valid == full_cycles * (len(unique) - 2) + min(rest, len(unique) - 2)
+    assert elapsed < BUDGET_SECONDS
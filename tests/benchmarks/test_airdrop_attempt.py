@@ -0,0 +1,146 @@
+"""
+End-to-end benchmark of browser airdrop attempts against the local faucet stand-in.
+
+Runs whole attempts through ``AirdropManager`` and reports the latency
+distribution of each phase and the peak RSS of the browser processes. The
+medians and peak RSS are compared with ``attempt_baseline.json``, which is
+machine-specific and kept outside the repository: in ``$BENCHMARK_BASELINE_DIR``,
+or under the user cache directory. It is only written when pytest runs with
+``--update-baseline``; without a baseline the comparison is skipped.
+"""
+
+import json
+import os
+import statistics
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from src.core.airdrop_manager import AirdropManager
+from src.core.process_watchdog import proc_available, process_tree, tree_rss_bytes
+from src.utils.config import AppConfig
+from tests.faucet_server import FaucetStubServer
+
+CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache")
+BASELINE_DIR = Path(
+    os.getenv("BENCHMARK_BASELINE_DIR") or CACHE_DIR / "solana-airdrop-tool" / "benchmarks"
+)
+BASELINE_FILE = BASELINE_DIR / "attempt_baseline.json"
+ATTEMPTS = 5
+WALLET = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+
+# Allowed regression over the baseline: relative, plus an absolute slack for
+# phases too short for a relative bound to be meaningful.
+TOLERANCE = 0.5
+SLACK_MS = 100
+RSS_TOLERANCE = 0.25
+
+
+class RssSampler:
+    """Tracks the peak RSS of browser processes started after it was created."""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak = 0
+        # This process and anything it already runs (e.g. the session's Chromium).
+        self._ignore = set(process_tree(os.getpid()))
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            tree = process_tree(os.getpid())
+            started = {pid: stat for pid, stat in tree.items() if pid not in self._ignore}
+            self.peak = max(self.peak, tree_rss_bytes(started))
+
+    def __enter__(self) -> "RssSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def check_baseline(current: Dict[str, object], update: bool = False) -> List[str]:
+    """Compare with the stored baseline, or record it when asked to."""
+    if update:
+        BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+        BASELINE_FILE.write_text(json.dumps(current, indent=4, sort_keys=True) + "\n")
+        print(f"\nWrote baseline to {BASELINE_FILE}")
+        return []
+    if not BASELINE_FILE.exists():
+        pytest.skip(f"No baseline at {BASELINE_FILE}; run with --update-baseline to record one.")
+
+    baseline = json.loads(BASELINE_FILE.read_text())
+    regressions = []
+    for phase, median_ms in current["phase_p50_ms"].items():
+        allowed = baseline["phase_p50_ms"].get(phase, median_ms) * (1 + TOLERANCE) + SLACK_MS
+        if median_ms > allowed:
+            regressions.append(f"{phase}: median {median_ms:.0f} ms > allowed {allowed:.0f} ms")
+    allowed_rss = baseline["peak_rss_mb"] * (1 + RSS_TOLERANCE)
+    if current["peak_rss_mb"] > allowed_rss:
+        regressions.append(f"peak RSS {current['peak_rss_mb']:.0f} MB > allowed {allowed_rss:.0f} MB")
+    return regressions
+
+
+@pytest.mark.benchmark
+def test_attempt_phases_within_baseline(chromium_page, request):
+    """Whole attempts succeed and stay within the stored latency and memory baseline."""
+    if not proc_available():
+        pytest.skip("RSS sampling needs /proc")
+
+    faucet = FaucetStubServer(delay=0.3, challenge_seconds=0.5).start()
+    manager = AirdropManager(AppConfig(
+        solana_faucet_url=faucet.url,
+        browser_profile="lean",
+        browser_pool_enabled=True,
+        browser_pool_idle_timeout=0,
+        response_wait_seconds=0,
+        result_check_timeout=10,
+        challenge_retry_interval=0.1,
+        ledger_path="",
+        notification_sinks=[],
+    ))
+    records = []
+    manager.attempt_listeners.append(records.append)
+    try:
+        with RssSampler() as sampler:
+            results = [manager.perform_airdrop(WALLET, lambda message: None, attempt)
+                       for attempt in range(1, ATTEMPTS + 1)]
+    finally:
+        manager.close()
+        faucet.close()
+
+    assert all(results), [record.message for record in records]
+    assert [request["amount"] for request in faucet.requests] == ["5"] * ATTEMPTS
+
+    phases: Dict[str, List[float]] = {}
+    for record in records:
+        for phase, seconds in record.phases.items():
+            phases.setdefault(phase, []).append(seconds * 1000)
+        phases.setdefault("attempt", []).append((record.ended_at - record.started_at) * 1000)
+
+    lines = [f"\n{'phase':<16}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"]
+    for phase, values in phases.items():
+        lines.append(
+            f"{phase:<16}{statistics.median(values):>10.0f}"
+            f"{percentile(values, 0.95):>10.0f}{max(values):>10.0f}"
+        )
+    peak_rss_mb = sampler.peak / (1024 * 1024)
+    lines.append(f"browser peak RSS: {peak_rss_mb:.0f} MB")
+    print("\n".join(lines))
+
+    current = {
+        "phase_p50_ms": {phase: round(statistics.median(values), 1) for phase, values in phases.items()},
+        "peak_rss_mb": round(peak_rss_mb, 1),
+    }
+    update = request.config.getoption("--update-baseline")
+    assert check_baseline(current, update) == []
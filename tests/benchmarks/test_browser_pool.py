@@ -0,0 +1,72 @@
+"""
+Benchmark cold browser launches against leases from the warm browser pool.
+"""
+
+import statistics
+import time
+
+import pytest
+from DrissionPage import ChromiumOptions, ChromiumPage
+
+from src.core.browser_pool import BrowserPool
+
+ATTEMPTS = 5
+
+
+def headless_options() -> ChromiumOptions:
+    return ChromiumOptions().headless().auto_port()
+
+
+def cold_attempt(url: str) -> float:
+    """Launch a browser, load the page and quit, as an unpooled attempt does."""
+    start = time.perf_counter()
+    page = ChromiumPage(addr_or_opts=headless_options())
+    try:
+        page.get(url)
+    finally:
+        page.quit()
+    return time.perf_counter() - start
+
+
+def warm_attempt(pool: BrowserPool, url: str) -> float:
+    """Lease a fresh context from the pool and load the page."""
+    start = time.perf_counter()
+    with pool.lease() as tab:
+        tab.get(url)
+    return time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+def test_warm_pool_beats_cold_launch(chromium_page, fixture_server):
+    """Pooled attempts should skip the browser start-up cost."""
+    url = f"{fixture_server}/delayed_element.html?delay=0"
+    cold = [cold_attempt(url) for _ in range(ATTEMPTS)]
+
+    pool = BrowserPool(headless_options, max_uses=ATTEMPTS + 1, idle_timeout=0)
+    try:
+        warm_attempt(pool, url)  # the first lease pays for the launch
+        warm = [warm_attempt(pool, url) for _ in range(ATTEMPTS)]
+    finally:
+        pool.close()
+
+    print(
+        f"\ncold launch mean attempt: {statistics.mean(cold) * 1000:.0f} ms"
+        f"\nwarm pool   mean attempt: {statistics.mean(warm) * 1000:.0f} ms"
+    )
+    assert statistics.median(warm) < statistics.median(cold)
+
+
+@pytest.mark.benchmark
+def test_pool_contexts_are_isolated(chromium_page, fixture_server):
+    """Storage written in one lease must not be visible in the next."""
+    url = f"{fixture_server}/delayed_element.html?delay=0"
+    pool = BrowserPool(headless_options, max_uses=10, idle_timeout=0)
+    try:
+        with pool.lease() as tab:
+            tab.get(url)
+            tab.run_js("localStorage.setItem('seen', '1')")
+        with pool.lease() as tab:
+            tab.get(url)
+            assert tab.run_js("return localStorage.getItem('seen')") is None
+    finally:
+        pool.close()
@@ -0,0 +1,67 @@
+"""
+Measure memory and wall time per attempt for each browser profile.
+
+Run with ``pytest -m benchmark -s tests/benchmarks/test_browser_profiles.py``
+to see the report.
+"""
+
+import statistics
+import time
+
+import pytest
+
+from src.core.airdrop_manager import AirdropManager
+from src.core.browser_profile import PROFILES, apply_page_settings
+from src.core.process_watchdog import proc_available, process_tree, tree_rss_bytes
+from src.utils.config import AppConfig
+
+ChromiumPage = pytest.importorskip("DrissionPage").ChromiumPage
+
+ATTEMPTS = 3
+
+
+def measure_profile(name: str, url: str):
+    """Run browser attempts with a profile, returning (wall seconds, peak RSS bytes) lists."""
+    manager = AirdropManager(AppConfig(browser_profile=name, ledger_path=""))
+    walls, peaks = [], []
+    try:
+        for _ in range(ATTEMPTS):
+            options = manager.get_chromium_options().auto_port()
+            start = time.perf_counter()
+            page = ChromiumPage(addr_or_opts=options)
+            try:
+                apply_page_settings(page, manager.browser_profile)
+                page.get(url)
+                page.wait.doc_loaded()
+                walls.append(time.perf_counter() - start)
+                peaks.append(tree_rss_bytes(process_tree(page.process_id)))
+            finally:
+                page.quit()
+    finally:
+        manager.close()
+    return walls, peaks
+
+
+@pytest.mark.benchmark
+def test_profile_footprint(chromium_page, fixture_server):
+    """Report RSS and wall time per attempt; the lean profile should use less memory."""
+    if not proc_available():
+        pytest.skip("RSS sampling needs /proc")
+    url = f"{fixture_server}/heavy_page.html"
+    report = {}
+    for name in PROFILES:
+        try:
+            report[name] = measure_profile(name, url)
+        except Exception as e:
+            print(f"\n{name}: could not launch ({e})")
+
+    for name, (walls, peaks) in report.items():
+        print(
+            f"\n{name:8s} wall {statistics.mean(walls) * 1000:7.0f} ms"
+            f"   rss {statistics.mean(peaks) / 2 ** 20:7.1f} MiB"
+        )
+
+    if "lean" not in report:
+        pytest.fail("The lean profile could not launch.")
+    if "default" in report:
+        assert statistics.mean(report["lean"][1]) < statistics.mean(report["default"][1])
@@ -0,0 +1,53 @@
+"""
+Benchmark MutationObserver waits against polling waits.
+"""
+
+import statistics
+import time
+
+import pytest
+
+from src.core.browser_utils import BrowserUtils
+
+DELAYS_MS = [100, 250, 400, 650, 900]
+
+
+def poll_for_element(page, xpath, timeout=5, interval=0.5):
+    """The polling wait the observer replaced: one lookup every ``interval`` seconds."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        element = page.ele(f"xpath:{xpath}", timeout=0)
+        if element:
+            return element
+        time.sleep(interval)
+    return None
+
+
+def measure(page, url, wait):
+    """Return how long after the element appeared the wait returned, in seconds."""
+    overheads = []
+    for delay in DELAYS_MS:
+        page.get(f"{url}/delayed_element.html?delay={delay}")
+        start = time.perf_counter()
+        assert wait(page)
+        overheads.append(time.perf_counter() - start - delay / 1000)
+    return overheads
+
+
+@pytest.mark.benchmark
+def test_mutation_observer_beats_polling(chromium_page, fixture_server):
+    """The observer-based wait should return sooner after the element appears."""
+    polling = measure(
+        chromium_page, fixture_server,
+        lambda page: poll_for_element(page, '//*[@id="target"]'),
+    )
+    observer = measure(
+        chromium_page, fixture_server,
+        lambda page: BrowserUtils.wait_for_element(page, '//*[@id="target"]', timeout=5),
+    )
+
+    print(
+        f"\npolling  mean latency after appearance: {statistics.mean(polling) * 1000:.1f} ms"
+        f"\nobserver mean latency after appearance: {statistics.mean(observer) * 1000:.1f} ms"
+    )
+    assert statistics.mean(observer) < statistics.mean(polling)
@@ -0,0 +1,68 @@
+"""
+Benchmark filling in the faucet form with per-element lookups and fixed sleeps
+against the page object's batched lookups and readiness checks.
+"""
+
+import statistics
+import time
+
+import pytest
+
+from src.core.faucet_page import FaucetPage
+from tests.faucet_server import FaucetStubServer
+
+RUNS = 5
+WALLET = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+
+
+def fill_with_lookups(page) -> None:
+    """The form sequence as it was: one XPath lookup per element and fixed sleeps."""
+    page.ele('xpath://*[@type="button"]').click()
+    time.sleep(0.2)
+    page.ele('xpath://*[@type="button" and text()="5"]').click()
+    wallet_input = page.ele('xpath://*[@placeholder="Wallet Address"]')
+    wallet_input.click()
+    time.sleep(0.1)
+    wallet_input.input(WALLET)
+    time.sleep(0.2)
+    page.ele('xpath://*[@type="submit"]').click()
+
+
+def fill_with_page_object(page) -> None:
+    """The form sequence through FaucetPage."""
+    form = FaucetPage(page, timeout=5)
+    form.resolve("amount_toggle", "wallet_input")
+    form.element("amount_toggle").click()
+    form.ready("amount_button").click()
+    wallet_input = form.element("wallet_input")
+    wallet_input.click()
+    wallet_input.input(WALLET)
+    form.ready("submit_button").click()
+
+
+def measure(page, url, fill) -> list:
+    timings = []
+    for _ in range(RUNS):
+        page.get(url)
+        start = time.perf_counter()
+        fill(page)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+@pytest.mark.benchmark
+def test_page_object_beats_lookups(chromium_page):
+    """Batched resolution without fixed sleeps should fill the form faster."""
+    faucet = FaucetStubServer().start()
+    try:
+        lookups = measure(chromium_page, faucet.url, fill_with_lookups)
+        page_object = measure(chromium_page, faucet.url, fill_with_page_object)
+    finally:
+        faucet.close()
+
+    assert [request["amount"] for request in faucet.requests] == ["5"] * (2 * RUNS)
+    print(
+        f"\nper-element lookups mean fill time: {statistics.mean(lookups) * 1000:.0f} ms"
+        f"\npage object         mean fill time: {statistics.mean(page_object) * 1000:.0f} ms"
+    )
+    assert statistics.median(page_object) < statistics.median(lookups)
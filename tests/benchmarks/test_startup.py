@@ -0,0 +1,84 @@
+"""
+Startup budget for each entry point.
+
+Each entry module is imported in a fresh interpreter under
+``python -X importtime``. The import time reported for the module, the
+process's peak RSS and the set of loaded modules are checked against
+``startup_budget.json``.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BUDGET_FILE = Path(__file__).parent / "startup_budget.json"
+REPO_ROOT = Path(__file__).parent.parent.parent
+RUNS = 3
+
+# __import__ goes through the import statement's code path, which -X importtime
+# reports; importlib.import_module does not.
+# ru_maxrss survives exec on Linux and would report the forking pytest process,
+# so VmHWM from /proc is preferred where available.
+PROBE = """
+import json, resource, sys
+__import__(sys.argv[1])
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+try:
+    with open("/proc/self/status") as status:
+        peak = next(int(line.split()[1]) for line in status if line.startswith("VmHWM:"))
+except (OSError, StopIteration):
+    pass
+print(json.dumps({"peak_rss_kb": peak, "modules": sorted(sys.modules)}))
+"""
+
+BUDGETS = json.loads(BUDGET_FILE.read_text())
+
+
+def parse_importtime(stderr: str) -> dict:
+    """Map each imported module to its cumulative import time in microseconds."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def measure(module: str) -> dict:
+    """Import a module in a fresh interpreter and return its startup cost."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE, module],
+        cwd=REPO_ROOT, capture_output=True, text=True, timeout=60, check=True,
+    )
+    probe = json.loads(result.stdout)
+    return {
+        "import_ms": parse_importtime(result.stderr)[module] / 1000,
+        "peak_rss_mb": probe["peak_rss_kb"] / 1024,
+        "modules": set(probe["modules"]),
+    }
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("module", sorted(BUDGETS))
+def test_startup_budget(module):
+    """Entry points must start within budget and without heavy optional dependencies."""
+    if sys.platform == "win32":
+        pytest.skip("peak RSS is measured with the resource module")
+    budget = BUDGETS[module]
+    runs = [measure(module) for _ in range(RUNS)]
+    # The fastest run is the least disturbed by other load on the machine.
+    import_ms = min(run["import_ms"] for run in runs)
+    peak_rss_mb = min(run["peak_rss_mb"] for run in runs)
+    print(f"\n{module}: import {import_ms:.0f} ms, peak RSS {peak_rss_mb:.1f} MiB")
+
+    loaded = sorted(
+        name for name in budget["forbidden_modules"]
+        if any(module_name == name or module_name.startswith(name + ".") for module_name in runs[0]["modules"])
+    )
+    assert not loaded, f"{module} eagerly imports {loaded}"
+    assert import_ms <= budget["import_ms"]
+    assert peak_rss_mb <= budget["peak_rss_mb"]
@@ -0,0 +1,211 @@
+"""
+Shared test fixtures.
+"""
+
+import base64
+import hashlib
+import json
+import socket
+import struct
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Set
+
+import pytest
+
+from tests.faucet_server import FaucetStubServer
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--update-baseline",
+        action="store_true",
+        default=False,
+        help="Record benchmark baselines instead of comparing with them.",
+    )
+
+
+class RpcStubServer:
+    """Local stand-in for a validator's JSON-RPC endpoint."""
+
+    def __init__(self):
+        self.handlers: Dict[str, Callable[[List[Any]], Any]] = {}
+        self.requests: List[Any] = []
+        self.paths: List[str] = []
+        self.connections = 0
+        # Methods whose connection is dropped after the request is read, without a response.
+        self.hang_up: Set[str] = set()
+        # Close every connection after its response, without announcing it.
+        self.close_idle = False
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                stub.connections += 1
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length))
+                stub.requests.append(payload)
+                stub.paths.append(self.path)
+                if isinstance(payload, dict) and payload.get("method") in stub.hang_up:
+                    self.close_connection = True
+                    return
+                if isinstance(payload, list):
+                    response = [stub.dispatch(item) for item in payload]
+                else:
+                    response = stub.dispatch(payload)
+                body = json.dumps(response).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                if stub.close_idle:
+                    self.close_connection = True
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the JSON-RPC response for a single request object."""
+        handler = self.handlers.get(request.get("method"))
+        if handler is None:
+            error = {"code": -32601, "message": "Method not found"}
+            return {"jsonrpc": "2.0", "id": request.get("id"), "error": error}
+        try:
+            result = handler(request.get("params", []))
+        except Exception as e:
+            error = {"code": -32000, "message": str(e)}
+            return {"jsonrpc": "2.0", "id": request.get("id"), "error": error}
+        return {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
+
+
+@pytest.fixture
+def rpc_server():
+    """Run a local JSON-RPC stand-in server for the duration of a test."""
+    stub = RpcStubServer()
+    stub.thread.start()
+    yield stub
+    stub.server.shutdown()
+    stub.server.server_close()
+
+
+class WebSocketStubServer:
+    """Minimal single-client websocket server for signature subscriptions."""
+
+    GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+    def __init__(self):
+        self.subscribed: List[str] = []
+        self.notify_after: Dict[str, float] = {}
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen(1)
+        self.url = f"ws://127.0.0.1:{self.sock.getsockname()[1]}"
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+
+    def _serve(self):
+        try:
+            conn, _ = self.sock.accept()
+        except OSError:
+            return
+        with conn:
+            request = b""
+            while b"\r\n\r\n" not in request:
+                request += conn.recv(4096)
+            key = next(
+                line.split(b":", 1)[1].strip()
+                for line in request.split(b"\r\n")
+                if line.lower().startswith(b"sec-websocket-key")
+            )
+            accept = base64.b64encode(hashlib.sha1(key + self.GUID.encode()).digest())
+            conn.sendall(
+                b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+                b"Connection: Upgrade\r\nSec-WebSocket-Accept: " + accept + b"\r\n\r\n"
+            )
+            try:
+                while True:
+                    message = json.loads(self._recv_frame(conn))
+                    signature = message["params"][0]
+                    subscription = len(self.subscribed) + 100
+                    self.subscribed.append(signature)
+                    self._send_frame(conn, {"jsonrpc": "2.0", "id": message["id"], "result": subscription})
+                    delay = self.notify_after.get(signature)
+                    if delay is not None:
+                        threading.Timer(delay, self._notify, (conn, subscription)).start()
+            except (OSError, ValueError, ConnectionError):
+                pass
+
+    def _notify(self, conn, subscription):
+        params = {"result": {"context": {"slot": 1}, "value": {"err": None}}, "subscription": subscription}
+        try:
+            self._send_frame(conn, {"jsonrpc": "2.0", "method": "signatureNotification", "params": params})
+        except OSError:
+            pass
+
+    @staticmethod
+    def _recv_exact(conn, size):
+        data = b""
+        while len(data) < size:
+            chunk = conn.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("closed")
+            data += chunk
+        return data
+
+    def _recv_frame(self, conn):
+        header = self._recv_exact(conn, 2)
+        if header[0] & 0x0F == 0x8:
+            raise ConnectionError("close frame")
+        length = header[1] & 0x7F
+        if length == 126:
+            length = struct.unpack(">H", self._recv_exact(conn, 2))[0]
+        elif length == 127:
+            length = struct.unpack(">Q", self._recv_exact(conn, 8))[0]
+        mask = self._recv_exact(conn, 4)
+        payload = self._recv_exact(conn, length)
+        return bytes(b ^ mask[i % 4] for i, b in enumerate(payload)).decode("utf-8")
+
+    @staticmethod
+    def _send_frame(conn, message):
+        payload = json.dumps(message).encode("utf-8")
+        if len(payload) < 126:
+            header = struct.pack(">BB", 0x81, len(payload))
+        else:
+            header = struct.pack(">BBH", 0x81, 126, len(payload))
+        conn.sendall(header + payload)
+
+
+@pytest.fixture
+def ws_server():
+    """Run a local websocket stand-in server for the duration of a test."""
+    stub = WebSocketStubServer()
+    stub.thread.start()
+    yield stub
+    stub.sock.close()
+
+
+@pytest.fixture
+def faucet_server():
+    """Run a local faucet website stand-in for the duration of a test."""
+    stub = FaucetStubServer().start()
+    yield stub
+    stub.close()
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    """Keep ledgers and watchdog state from default settings out of the real data directory."""
+    path = tmp_path / "data"
+    monkeypatch.setenv("AIRDROP_DATA_DIR", str(path))
+    return path
@@ -0,0 +1,350 @@
+"""
+Browserless stand-in for ChromiumPage.
+
+``FakeDriver`` implements ``src.core.driver.Driver`` over lxml trees parsed
+from HTML snapshots in ``tests/fixtures/faucet``. Element behaviour is
+scripted: a click on an element matching an XPath runs a Python callback,
+and callbacks can schedule later DOM changes on a ``FakeClock``. The
+in-page scripts the airdrop code runs are emulated in Python, and their
+waits fast-forward the virtual clock to the next scheduled change, so a
+whole attempt, challenge and cooldown included, runs in milliseconds.
+
+``FakeFaucetDriver`` scripts the faucet form the same way the local
+stand-in in ``tests/faucet_server.py`` behaves.
+"""
+
+import heapq
+import itertools
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import lxml.html
+
+from src.core.browser_utils import _MUTATION_WAIT_JS
+from src.core.clock import Clock
+from src.core.faucet_page import _RESOLVE_JS
+
+SNAPSHOTS = Path(__file__).parent / "fixtures" / "faucet"
+FAUCET_URL = "https://faucet.solana.com/"
+
+
+def load_snapshot(name: str) -> str:
+    """Read an HTML snapshot from ``tests/fixtures/faucet``."""
+    return (SNAPSHOTS / name).read_text(encoding="utf-8")
+
+
+class FakeClock(Clock):
+    """Virtual clock: sleeps and timed waits advance time instead of blocking."""
+
+    def __init__(self, start: float = 1_700_000_000.0):
+        self.start = start
+        self.now = start
+        self._lock = threading.Lock()
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now - self.start
+
+    def advance(self, seconds: float) -> None:
+        """Move time forward."""
+        with self._lock:
+            self.now += max(0.0, seconds)
+
+    def sleep(self, seconds, cancel_token=None) -> None:
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        self.advance(seconds)
+
+    def wait(self, condition, timeout) -> bool:
+        if timeout is None:
+            return condition.wait()
+        self.advance(timeout)
+        condition.wait(0)
+        return False
+
+
+class FakeElement:
+    """An element of the current snapshot."""
+
+    shadow_root = None
+
+    def __init__(self, driver: "FakeDriver", node):
+        self.driver = driver
+        self.node = node
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, FakeElement) and other.node is self.node
+
+    def __hash__(self) -> int:
+        return id(self.node)
+
+    def __repr__(self) -> str:
+        return f"<FakeElement {self.tag} {dict(self.node.attrib)}>"
+
+    @property
+    def tag(self) -> str:
+        return self.node.tag
+
+    @property
+    def text(self) -> str:
+        return " ".join(self.node.text_content().split())
+
+    @property
+    def attrs(self) -> Dict[str, str]:
+        return dict(self.node.attrib)
+
+    @property
+    def value(self) -> str:
+        return self.node.get("value", "")
+
+    @property
+    def is_attached(self) -> bool:
+        """Whether the element belongs to the document currently shown."""
+        return self.node.getroottree().getroot() is self.driver.document
+
+    @property
+    def is_displayed(self) -> bool:
+        for node in self.node.iterancestors():
+            if _hidden(node):
+                return False
+        return not _hidden(self.node)
+
+    @property
+    def is_enabled(self) -> bool:
+        return "disabled" not in self.node.attrib
+
+    def click(self) -> None:
+        self.driver._tick()
+        if not self.is_attached:
+            raise RuntimeError(f"Element is no longer attached to the page: {self!r}")
+        if not self.is_displayed:
+            raise RuntimeError(f"Element has no location to click: {self!r}")
+        self.driver.clicks.append(self)
+        self.driver._dispatch_click(self)
+
+    def input(self, text: str) -> None:
+        if not self.is_attached:
+            raise RuntimeError(f"Element is no longer attached to the page: {self!r}")
+        self.node.set("value", self.value + str(text))
+
+    def children(self) -> List["FakeElement"]:
+        return [FakeElement(self.driver, child) for child in self.node if isinstance(child.tag, str)]
+
+    def parent(self) -> "FakeElement":
+        return FakeElement(self.driver, self.node.getparent())
+
+    def ele(self, locator: str, timeout: Optional[float] = None) -> Optional["FakeElement"]:
+        nodes = self.node.xpath(_to_xpath(locator, relative=True))
+        return FakeElement(self.driver, nodes[0]) if nodes else None
+
+    __call__ = ele
+
+
+def _hidden(node) -> bool:
+    style = node.get("style", "").replace(" ", "")
+    return "hidden" in node.attrib or "display:none" in style
+
+
+def _to_xpath(locator: str, relative: bool = False) -> str:
+    """Translate the DrissionPage locators used by the airdrop code to XPath."""
+    for prefix in ("xpath:", "x:"):
+        if locator.startswith(prefix):
+            return locator[len(prefix):]
+    if locator.startswith("tag:"):
+        return (".//" if relative else "//") + locator[4:]
+    if locator.startswith(("/", "(")):
+        return locator
+    raise NotImplementedError(f"Unsupported locator: {locator}")
+
+
+# A scheduled change: replacement HTML or a callback that edits the driver.
+Action = Union[str, Callable[["FakeDriver"], None]]
+
+
+class FakeDriver:
+    """In-memory Driver replaying HTML snapshots with scripted behaviour."""
+
+    def __init__(self, pages: Optional[Dict[str, str]] = None, clock: Optional[FakeClock] = None):
+        """
+        Create a driver with no page loaded.
+
+        Args:
+            pages: HTML served for each URL by get()
+            clock: Virtual clock for scheduled changes and waits
+        """
+        self.pages = dict(pages or {})
+        self.clock = clock or FakeClock()
+        self.document = None
+        self.visited: List[str] = []
+        self.clicks: List[FakeElement] = []
+        self.script_calls = 0
+        self.closed = False
+        self._on_click: List[Tuple[str, Callable[["FakeDriver", FakeElement], None]]] = []
+        self._timeline: List[Tuple[float, int, Action]] = []
+        self._sequence = itertools.count()
+        self._scripts: Dict[str, Callable[..., Any]] = {
+            _RESOLVE_JS: self._resolve_form,
+            _MUTATION_WAIT_JS: self._wait_for_any,
+        }
+
+    # Scripting
+
+    def load(self, html: str) -> None:
+        """Replace the current document."""
+        self.document = lxml.html.document_fromstring(html)
+
+    def when_clicked(self, xpath: str, callback: Callable[["FakeDriver", FakeElement], None]) -> None:
+        """Run a callback whenever an element matching the XPath is clicked."""
+        self._on_click.append((xpath, callback))
+
+    def after(self, seconds: float, action: Action) -> None:
+        """Apply a change once the virtual clock has moved on by ``seconds``."""
+        heapq.heappush(self._timeline, (self.clock.time() + seconds, next(self._sequence), action))
+
+    def find(self, xpath: str) -> Optional[FakeElement]:
+        """First element of the current document matching an XPath."""
+        nodes = self.document.xpath(xpath)
+        return FakeElement(self, nodes[0]) if nodes else None
+
+    def _tick(self) -> None:
+        """Apply the scheduled changes that are due."""
+        while self._timeline and self._timeline[0][0] <= self.clock.time():
+            action = heapq.heappop(self._timeline)[2]
+            if isinstance(action, str):
+                self.load(action)
+            else:
+                action(self)
+
+    def _dispatch_click(self, element: FakeElement) -> None:
+        for xpath, callback in self._on_click:
+            if element.node in self.document.xpath(xpath):
+                callback(self, element)
+
+    # Driver
+
+    @property
+    def html(self) -> str:
+        return lxml.html.tostring(self.document, encoding="unicode")
+
+    @property
+    def title(self) -> str:
+        self._tick()
+        return self.document.findtext(".//title") or ""
+
+    def get(self, url: str, timeout: Optional[float] = None) -> bool:
+        if self.closed:
+            raise RuntimeError("The browser has been closed.")
+        if url not in self.pages:
+            raise RuntimeError(f"No snapshot for {url}")
+        self.visited.append(url)
+        self._timeline.clear()
+        self.load(self.pages[url])
+        return True
+
+    def ele(self, locator: str, timeout: Optional[float] = None) -> Optional[FakeElement]:
+        found = self.eles(locator)
+        return found[0] if found else None
+
+    def eles(self, locator: str) -> List[FakeElement]:
+        self._tick()
+        return [FakeElement(self, node) for node in self.document.xpath(_to_xpath(locator))]
+
+    def run_js(self, script: str, *args: Any, timeout: Optional[float] = None) -> Any:
+        if self.closed:
+            raise RuntimeError("The browser has been closed.")
+        handler = self._scripts.get(script)
+        if handler is None:
+            raise NotImplementedError("The fake driver cannot run this script")
+        self.script_calls += 1
+        self._tick()
+        return handler(*args)
+
+    def quit(self) -> None:
+        self.closed = True
+
+    # In-page scripts
+
+    def _wait_until(self, done: Callable[[], bool], timeout_ms: float) -> None:
+        """Fast-forward through scheduled changes until done() or the timeout."""
+        deadline = self.clock.time() + timeout_ms / 1000
+        while not done():
+            if self._timeline and self._timeline[0][0] <= deadline:
+                self.clock.advance(self._timeline[0][0] - self.clock.time())
+            else:
+                self.clock.advance(deadline - self.clock.time())
+                return
+            self._tick()
+
+    @staticmethod
+    def _ready(element: Optional[FakeElement]) -> bool:
+        return element is not None and element.is_displayed and element.is_enabled
+
+    def _resolve_form(self, selectors: List[str], required: List[int], timeout_ms: int) -> list:
+        """Python version of ``faucet_page._RESOLVE_JS``."""
+        def done() -> bool:
+            return all(self._ready(self.find(selectors[index])) for index in required)
+
+        self._wait_until(done, timeout_ms)
+        nodes = [self.find(xpath) for xpath in selectors]
+        return [nodes, [self._ready(node) for node in nodes]]
+
+    def _wait_for_any(self, selectors: List[str], timeout_ms: int) -> Optional[list]:
+        """Python version of ``browser_utils._MUTATION_WAIT_JS``."""
+        def first() -> Optional[list]:
+            for index, xpath in enumerate(selectors):
+                element = self.find(xpath)
+                if element is not None:
+                    return [index, element]
+            return None
+
+        self._wait_until(lambda: first() is not None, timeout_ms)
+        return first()
+
+
+class FakeFaucetDriver(FakeDriver):
+    """FakeDriver scripted to behave like the faucet form."""
+
+    def __init__(
+        self,
+        clock: Optional[FakeClock] = None,
+        result: str = "success.html",
+        challenge_seconds: float = 4.0,
+        url: str = FAUCET_URL,
+    ):
+        """
+        Create the driver.
+
+        Args:
+            clock: Virtual clock
+            result: Snapshot shown once the challenge clears after submit
+            challenge_seconds: How long the challenge page shows after submit
+            url: URL serving the form
+        """
+        super().__init__({url: load_snapshot("form.html")}, clock)
+        self.result = result
+        self.challenge_seconds = challenge_seconds
+        self.amount: Optional[str] = None
+        self.submissions: List[Dict[str, Optional[str]]] = []
+        self.when_clicked('//*[@id="amount-toggle"]', self._toggle_amounts)
+        self.when_clicked('//*[@id="amounts"]/button', self._choose_amount)
+        self.when_clicked('//*[@type="submit"]', self._submit)
+
+    def _toggle_amounts(self, driver: FakeDriver, element: FakeElement) -> None:
+        amounts = self.document.get_element_by_id("amounts")
+        if "hidden" in amounts.attrib:
+            del amounts.attrib["hidden"]
+        else:
+            amounts.set("hidden", "")
+
+    def _choose_amount(self, driver: FakeDriver, element: FakeElement) -> None:
+        self.amount = element.text
+        self.document.get_element_by_id("amounts").set("hidden", "")
+
+    def _submit(self, driver: FakeDriver, element: FakeElement) -> None:
+        wallet = self.find('//*[@name="wallet"]').value
+        self.submissions.append({"wallet": wallet, "amount": self.amount})
+        self.load(load_snapshot("challenge.html"))
+        self.after(self.challenge_seconds, load_snapshot(self.result))
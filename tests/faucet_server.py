@@ -0,0 +1,207 @@
+"""
+Local stand-in for the Solana faucet website.
+
+Serves a form with the elements ``AirdropManager`` looks for: an amount
+toggle, an amount button labelled "5", the wallet input, a submit button and
+a result list at ``/html/body/section/main/form/div/ol/li/div``. Submitting
+shows a "Just a moment..." title for ``challenge_seconds`` (where the real
+site runs its Cloudflare check), then POSTs to ``/api/airdrop``, which
+answers after ``delay`` seconds with the configured outcome.
+
+Run it on its own to point the GUI or CLI at it::
+
+    python -m tests.faucet_server --port 8080 --delay 0.5
+    FAUCET_URL=http://127.0.0.1:8080/ python -m src.cli WALLET
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+RESULT_XPATH = "/html/body/section/main/form/div/ol/li/div"
+
+SUCCESS_MESSAGE = "Airdrop successful! {amount} SOL sent to {wallet}."
+ERROR_MESSAGE = (
+    "Airdrop request failed. You have reached your airdrop limit today. "
+    "Try again in 8 hours."
+)
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>Solana Faucet</title></head>
+<body>
+<section>
+<main>
+<form id="faucet">
+    <button type="button" id="amount-toggle">Amount</button>
+    <div id="amounts" hidden>
+        <button type="button">0.5</button>
+        <button type="button">1</button>
+        <button type="button">2.5</button>
+        <button type="button">5</button>
+    </div>
+    <input type="text" placeholder="Wallet Address" name="wallet" autocomplete="off">
+    <button type="submit">Confirm Airdrop</button>
+    <div id="results"></div>
+</form>
+</main>
+</section>
+<script>
+    const CHALLENGE_MS = __CHALLENGE_MS__;
+    const form = document.getElementById("faucet");
+    const amounts = document.getElementById("amounts");
+    let amount = null;
+
+    document.getElementById("amount-toggle").addEventListener("click", () => {
+        amounts.hidden = !amounts.hidden;
+    });
+    amounts.addEventListener("click", (event) => {
+        amount = event.target.textContent;
+        amounts.hidden = true;
+    });
+
+    function showResult(text) {
+        const list = document.createElement("ol");
+        const item = document.createElement("li");
+        const message = document.createElement("div");
+        message.textContent = text;
+        item.appendChild(message);
+        list.appendChild(item);
+        document.getElementById("results").replaceChildren(list);
+    }
+
+    form.addEventListener("submit", (event) => {
+        event.preventDefault();
+        const wallet = form.elements.wallet.value;
+        const title = document.title;
+        document.title = "Just a moment...";
+        setTimeout(async () => {
+            document.title = title;
+            const response = await fetch("/api/airdrop", {
+                method: "POST",
+                headers: {"Content-Type": "application/json"},
+                body: JSON.stringify({wallet: wallet, amount: amount}),
+            });
+            showResult((await response.json()).message);
+        }, CHALLENGE_MS);
+    });
+</script>
+</body>
+</html>
+"""
+
+
+class FaucetStubServer:
+    """Faucet stand-in whose response delay and outcome can be changed at any time."""
+
+    def __init__(
+        self,
+        delay: float = 0.0,
+        succeed: bool = True,
+        challenge_seconds: float = 0.0,
+        message: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Create the server; call start() to serve.
+
+        Args:
+            delay: Seconds before ``/api/airdrop`` answers
+            succeed: Whether airdrops succeed
+            challenge_seconds: How long the page shows the challenge title
+                after submit
+            message: Result text, defaults to a success or rate-limit message
+            host: Interface to bind
+            port: TCP port, or 0 to pick a free one
+        """
+        self.delay = delay
+        self.succeed = succeed
+        self.challenge_seconds = challenge_seconds
+        self.message = message
+        self.requests: List[Dict[str, Any]] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/", "/index.html"):
+                    self.send_error(404)
+                    return
+                self._send(200, "text/html; charset=utf-8", stub.render_page().encode("utf-8"))
+
+            def do_POST(self):
+                if self.path != "/api/airdrop":
+                    self.send_error(404)
+                    return
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                stub.requests.append(request)
+                time.sleep(stub.delay)
+                body = json.dumps(stub.respond(request)).encode("utf-8")
+                self._send(200, "application/json", body)
+
+            def _send(self, status, content_type, body):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://{host}:{self.server.server_address[1]}/"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def render_page(self) -> str:
+        """Return the faucet page with the current challenge duration."""
+        return PAGE.replace("__CHALLENGE_MS__", str(int(self.challenge_seconds * 1000)))
+
+    def respond(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the API response for an airdrop request."""
+        wallet = request.get("wallet", "")
+        if self.message is not None:
+            text = self.message
+        elif self.succeed:
+            text = SUCCESS_MESSAGE.format(amount=request.get("amount"), wallet=wallet)
+        else:
+            text = ERROR_MESSAGE
+        return {"ok": self.succeed, "message": text}
+
+    def start(self) -> "FaucetStubServer":
+        """Serve from a background thread."""
+        self.thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop serving."""
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main() -> None:
+    """Serve the stand-in until interrupted."""
+    parser = argparse.ArgumentParser(description="Local Solana faucet stand-in.")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds before the API answers")
+    parser.add_argument("--challenge", type=float, default=0.0, help="seconds of challenge title")
+    parser.add_argument("--fail", action="store_true", help="answer with the rate-limit error")
+    args = parser.parse_args()
+
+    stub = FaucetStubServer(args.delay, not args.fail, args.challenge, port=args.port)
+    print(f"Serving faucet stand-in on {stub.url}")
+    try:
+        stub.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
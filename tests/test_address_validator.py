@@ -0,0 +1,83 @@
+"""
+Tests for the address validator module.
+"""
+
+import pytest
+
+from src.core.address_validator import (
+    REASON_DECODED_LENGTH,
+    REASON_EMPTY,
+    REASON_LENGTH,
+    REASON_OFF_CURVE,
+    REJECT_CHARACTER,
+    REJECT_DECODED_LENGTH,
+    REJECT_EMPTY,
+    REJECT_LENGTH,
+    REJECT_TYPE,
+    b58decode,
+    is_on_curve,
+    validate_address,
+    validate_batch,
+)
+
+
+class TestAddressValidator:
+    """Test cases for base58 decoding and address validation."""
+
+    def test_b58decode(self):
+        """Test decoding keeps leading zero bytes and rejects bad characters."""
+        assert b58decode("11111111111111111111111111111111") == b"\x00" * 32
+        assert b58decode("1112") == b"\x00\x00\x00\x01"
+        assert b58decode("z") == bytes([57])
+        with pytest.raises(ValueError):
+            b58decode("0OIl")
+
+    def test_valid_public_keys(self):
+        """Test real 32-byte public keys are accepted."""
+        for address in [
+            "11111111111111111111111111111111",
+            "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM",
+            "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA",
+        ]:
+            assert validate_address(address).valid, address
+            assert len(b58decode(address)) == 32
+
+    def test_rejection_reasons(self):
+        """Test each rejected address reports why."""
+        assert validate_address("").reason == REASON_EMPTY
+        assert validate_address(None).reason == REASON_EMPTY
+        assert validate_address("short").reason == REASON_LENGTH
+        assert validate_address("9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWW0").reason == (
+            "invalid base58 character '0' at position 43"
+        )
+        # Valid characters and length, but 44 "z"s decode to 33 bytes.
+        assert validate_address("z" * 44).reason == REASON_DECODED_LENGTH
+        # 33 leading "1"s decode to 33 zero bytes.
+        assert validate_address("1" * 33).reason == REASON_DECODED_LENGTH
+
+    def test_rejection_codes(self):
+        """Test each rejection carries a stable code alongside its message."""
+        assert validate_address("").code == REJECT_EMPTY
+        assert validate_address(42).code == REJECT_TYPE
+        assert validate_address("short").code == REJECT_LENGTH
+        bad_character = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWW0"
+        assert validate_address(bad_character).code == REJECT_CHARACTER
+        assert validate_address("z" * 44).code == REJECT_DECODED_LENGTH
+        assert validate_address("11111111111111111111111111111111").code is None
+
+    def test_on_curve(self):
+        """Test the optional ed25519 check rejects off-curve keys."""
+        assert is_on_curve(b"\x00" * 32)
+        # y = 2 has no matching x on the curve.
+        off_curve = (2).to_bytes(32, "little")
+        assert not is_on_curve(off_curve)
+
+        address = "11111111111111111111111111111112"
+        assert validate_address(address).valid
+        assert validate_address(address, check_on_curve=True).reason == REASON_OFF_CURVE
+
+    def test_validate_batch(self):
+        """Test batch validation keeps input order."""
+        results = validate_batch(["short", "11111111111111111111111111111111"])
+        assert [result.valid for result in results] == [False, True]
+        assert results[0].reason == REASON_LENGTH
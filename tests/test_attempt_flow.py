@@ -0,0 +1,163 @@
+"""
+Tests for the whole browser attempt flow against the browserless fake driver.
+"""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("lxml")
+
+from src.core.airdrop_manager import AirdropManager
+from src.core.browser_utils import BrowserUtils
+from src.core.cloudflare_bypasser import CloudflareBypasser
+from src.core.outcome import INVALID_ADDRESS, NOT_FOUND, RATE_LIMITED, SUCCESS
+from src.utils.config import AppConfig
+from tests.fake_driver import FAUCET_URL, FakeClock, FakeDriver, FakeFaucetDriver, load_snapshot
+
+WALLET = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+
+
+def offline_manager(clock, results, **overrides):
+    """A manager whose attempts each open a FakeFaucetDriver showing the next result."""
+    overrides.setdefault("ledger_path", "")
+    overrides.setdefault("notification_sinks", [])
+    drivers = []
+
+    def open_driver():
+        drivers.append(FakeFaucetDriver(clock, result=results[len(drivers)]))
+        return drivers[-1]
+
+    manager = AirdropManager(AppConfig(**overrides), driver_factory=open_driver, clock=clock)
+    records = []
+    manager.attempt_listeners.append(records.append)
+    return manager, drivers, records
+
+
+class TestFakeDriver:
+    """Test the fake driver's snapshot replay and scripted behaviour."""
+
+    def test_hidden_elements_cannot_be_clicked(self):
+        """Amount buttons can only be clicked after the toggle opens the menu."""
+        driver = FakeFaucetDriver()
+        driver.get(FAUCET_URL)
+        five = driver.ele('xpath://*[@type="button" and text()="5"]')
+        with pytest.raises(RuntimeError, match="no location"):
+            five.click()
+
+        driver.ele("xpath://*[@id='amount-toggle']").click()
+        five.click()
+        assert driver.amount == "5"
+        assert not five.is_displayed
+
+    def test_waits_fast_forward_the_clock(self):
+        """A wait for a later change advances virtual time to it, not past it."""
+        clock = FakeClock()
+        driver = FakeDriver({FAUCET_URL: load_snapshot("challenge.html")}, clock)
+        driver.get(FAUCET_URL)
+        driver.after(7, load_snapshot("success.html"))
+
+        match = BrowserUtils.wait_for_any(driver, ["//ol/li/div"], timeout=30, clock=clock)
+        assert match[1].text.startswith("Airdrop successful!")
+        assert clock.monotonic() == 7
+
+        assert BrowserUtils.wait_for_any(driver, ["//dialog"], timeout=30, clock=clock) is None
+        assert clock.monotonic() == 37
+
+    def test_bypass_gives_up_after_max_retries(self):
+        """The bypass loop sleeps on the injected clock between clicks."""
+        clock = FakeClock()
+        driver = FakeDriver({FAUCET_URL: load_snapshot("challenge.html")}, clock)
+        driver.get(FAUCET_URL)
+        bypasser = CloudflareBypasser(driver, max_retries=2, retry_interval=5, log=False, clock=clock)
+        assert not bypasser.bypass()
+        assert clock.monotonic() == 15
+
+
+class TestAttemptFlow:
+    """Test perform_airdrop end to end without a browser."""
+
+    def test_successful_attempt(self):
+        """The form is filled in, the challenge waited out and the result read."""
+        clock = FakeClock()
+        manager, drivers, records = offline_manager(clock, ["success.html"])
+        messages = []
+
+        assert manager.perform_airdrop(WALLET, messages.append, 1)
+
+        driver = drivers[0]
+        assert driver.submissions == [{"wallet": WALLET, "amount": "5"}]
+        assert driver.closed
+        assert messages[-1].startswith("Status: Airdrop successful!")
+        assert records[0].outcome == SUCCESS
+        assert records[0].phases["challenge"] == pytest.approx(4.0)
+        assert records[0].phases["response_wait"] == pytest.approx(manager.config.response_wait_seconds)
+        manager.close()
+
+    def test_rate_limited_attempt_schedules_retry(self):
+        """The server's wait decides when the wallet is due again."""
+        clock = FakeClock()
+        manager, drivers, records = offline_manager(clock, ["rate_limited.html"])
+
+        assert not manager.perform_airdrop(WALLET, lambda message: None, 1)
+        assert records[0].outcome == RATE_LIMITED
+        assert manager.next_eligible_time(WALLET) == pytest.approx(clock.time() + 8 * 3600)
+        manager.close()
+
+    def test_missing_element_is_reported(self):
+        """A form without a submit button fails after the element wait, naming the button."""
+        clock = FakeClock()
+        manager, drivers, records = offline_manager(clock, ["success.html"], element_wait_timeout=6)
+        driver_factory = manager.driver_factory
+
+        def without_submit():
+            driver = driver_factory()
+            driver.pages[FAUCET_URL] = driver.pages[FAUCET_URL].replace(
+                '<button type="submit">Confirm Airdrop</button>', ""
+            )
+            return driver
+
+        manager.driver_factory = without_submit
+        messages = []
+        assert not manager.perform_airdrop(WALLET, messages.append, 1)
+        assert messages[-1] == "Status: Faucet form elements not found: submit_button"
+        assert records[0].outcome == NOT_FOUND
+        assert records[0].phases["interact"] >= 6
+        assert drivers[0].submissions == []
+        manager.close()
+
+    def test_attempt_schedule_runs_on_virtual_time(self):
+        """Hours of cooldowns between scheduled attempts pass in well under a second."""
+        clock = FakeClock()
+        manager, drivers, records = offline_manager(
+            clock, ["rate_limited.html", "success.html", "success.html"], retry_cooldown_seconds=1800
+        )
+        manager.attempt_listeners.append(lambda record: len(records) == 3 and manager.stop())
+
+        start = time.monotonic()
+        manager.perform_airdrop_attempts(WALLET, lambda message: None)
+        assert time.monotonic() - start < 5
+
+        assert [record.outcome for record in records] == [RATE_LIMITED, SUCCESS, SUCCESS]
+        gaps = [later.started_at - earlier.ended_at for earlier, later in zip(records, records[1:])]
+        assert gaps == [pytest.approx(8 * 3600), pytest.approx(1800)]
+        assert all(driver.closed for driver in drivers)
+        manager.close()
+
+    def test_attempt_schedule_ends_when_wallet_cannot_succeed(self):
+        """The attempt loop returns on its own once a result rules out any retry."""
+        clock = FakeClock()
+        manager, drivers, records = offline_manager(clock, ["invalid_address.html"])
+        messages = []
+
+        thread = threading.Thread(target=manager.perform_airdrop_attempts, args=(WALLET, messages.append))
+        thread.start()
+        thread.join(5)
+        finished = not thread.is_alive()
+        manager.close()
+        thread.join(5)
+
+        assert finished
+        assert [record.outcome for record in records] == [INVALID_ADDRESS]
+        assert messages[-1] == "Status: Attempt 1 failed. Not retrying this wallet."
@@ -0,0 +1,73 @@
+"""
+Tests for the persistent attempt ledger.
+"""
+
+import sqlite3
+
+from src.core.airdrop_manager import AirdropManager
+from src.core.attempt_ledger import AttemptLedger, AttemptRecord
+from src.utils.config import AppConfig
+
+WALLET_A = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+WALLET_B = "DjVE6JNiYqPL2QXyCUUh8rNjHrbz9hXHNYt99MQ59qw1"
+
+
+class TestAttemptLedger:
+    """Test cases for AttemptLedger."""
+
+    def test_next_eligible_uses_latest_attempt(self, tmp_path):
+        """Test each wallet's next eligible time comes from its newest attempt."""
+        ledger = AttemptLedger(tmp_path / "attempts.db")
+        ledger.record(AttemptRecord(WALLET_A, 100.0, 110.0, "failure", next_eligible_at=3710.0))
+        ledger.record(AttemptRecord(WALLET_A, 4000.0, 4010.0, "success", next_eligible_at=7610.0))
+        ledger.record(AttemptRecord(WALLET_B, 200.0, 205.0, "success", next_eligible_at=3805.0))
+        ledger.flush()
+
+        assert ledger.next_eligible_times() == {WALLET_A: 7610.0, WALLET_B: 3805.0}
+        ledger.close()
+
+    def test_persists_across_restarts(self, tmp_path):
+        """Test records and phase timings survive reopening the database."""
+        path = tmp_path / "attempts.db"
+        ledger = AttemptLedger(path)
+        ledger.record(AttemptRecord(
+            WALLET_A, 1.0, 2.5, "success", "ok", next_eligible_at=3602.5, phases={"page_load": 0.75}
+        ))
+        ledger.close()
+
+        reopened = AttemptLedger(path)
+        history = reopened.history(WALLET_A)
+        assert len(history) == 1
+        assert history[0].phases == {"page_load": 0.75}
+        assert history[0].message == "ok"
+        reopened.close()
+
+        connection = sqlite3.connect(str(path))
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        plan = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT wallet, next_eligible_at, MAX(started_at) "
+            "FROM attempts GROUP BY wallet"
+        ).fetchall()
+        assert "idx_attempts_wallet_started" in str(plan)
+        connection.close()
+
+    def test_manager_loads_eligibility_at_startup(self, tmp_path, rpc_server):
+        """Test a new manager knows the cooldowns recorded by a previous one."""
+        rpc_server.handlers["requestAirdrop"] = lambda params: "sig"
+        app_config = AppConfig(
+            airdrop_backend="rpc",
+            rpc_url=rpc_server.url,
+            confirm_airdrops=False,
+            ledger_path=str(tmp_path / "attempts.db"),
+        )
+        manager = AirdropManager(app_config)
+        assert manager.next_eligible_time(WALLET_A) == 0.0
+        assert manager.perform_airdrop(WALLET_A, lambda message: None, 1)
+        manager.ledger.close()
+
+        restarted = AirdropManager(app_config)
+        next_eligible = restarted.next_eligible_time(WALLET_A)
+        assert next_eligible == manager.next_eligible_time(WALLET_A)
+        assert next_eligible > manager.last_attempt_time + 3500
+        assert restarted.ledger.history(WALLET_A)[0].outcome == "success"
+        restarted.ledger.close()
@@ -0,0 +1,127 @@
+"""
+Tests for the warm browser pool.
+"""
+
+import time
+
+import pytest
+
+from src.core import browser_pool as browser_pool_module
+from src.core.browser_pool import BrowserPool
+
+
+class FakeStates:
+    def __init__(self):
+        self.is_alive = True
+
+
+class FakeBrowser:
+    """Stands in for the Chromium object behind a page."""
+
+    def __init__(self):
+        self.states = FakeStates()
+        self.disposed = []
+
+    def _run_cdp(self, cmd, **kwargs):
+        if not self.states.is_alive:
+            raise ConnectionError("browser is gone")
+        if cmd == "Target.disposeBrowserContext":
+            self.disposed.append(kwargs["browserContextId"])
+        return {}
+
+
+class FakeTab:
+    def __init__(self, browser, context_id):
+        self.browser = browser
+        self.context_id = context_id
+        self.closed = False
+
+    def run_cdp(self, cmd, **kwargs):
+        return {"targetInfo": {"browserContextId": self.context_id}}
+
+    def close(self):
+        self.closed = True
+
+
+class FakeChromiumPage:
+    launched = []
+
+    def __init__(self, addr_or_opts=None):
+        self.browser = FakeBrowser()
+        self.quit_called = False
+        self.contexts = 0
+        FakeChromiumPage.launched.append(self)
+
+    def new_tab(self, new_context=False):
+        assert new_context
+        self.contexts += 1
+        return FakeTab(self.browser, f"ctx-{self.contexts}")
+
+    def quit(self):
+        self.quit_called = True
+        self.browser.states.is_alive = False
+
+
+@pytest.fixture
+def fake_chromium(monkeypatch):
+    FakeChromiumPage.launched = []
+    monkeypatch.setattr(browser_pool_module, "ChromiumPage", FakeChromiumPage)
+    return FakeChromiumPage.launched
+
+
+class TestBrowserPool:
+    """Test lease, recycle and idle behaviour of BrowserPool."""
+
+    def test_reuses_browser_with_fresh_context_per_lease(self, fake_chromium):
+        """Leases share one process but each gets and disposes its own context."""
+        pool = BrowserPool(lambda: None, max_uses=10, idle_timeout=0)
+        tabs = []
+        for _ in range(3):
+            with pool.lease() as tab:
+                tabs.append(tab)
+
+        assert len(fake_chromium) == 1
+        assert len({tab.context_id for tab in tabs}) == 3
+        assert all(tab.closed for tab in tabs)
+        assert fake_chromium[0].browser.disposed == ["ctx-1", "ctx-2", "ctx-3"]
+        pool.close()
+        assert fake_chromium[0].quit_called
+
+    def test_recycles_after_max_uses(self, fake_chromium):
+        """The browser is restarted once it has served max_uses leases."""
+        pool = BrowserPool(lambda: None, max_uses=2, idle_timeout=0)
+        for _ in range(5):
+            with pool.lease():
+                pass
+
+        assert len(fake_chromium) == 3
+        assert fake_chromium[0].quit_called and fake_chromium[1].quit_called
+        pool.close()
+
+    def test_restarts_unhealthy_browser(self, fake_chromium):
+        """A browser that stopped answering is replaced on the next lease."""
+        pool = BrowserPool(lambda: None, max_uses=10, idle_timeout=0)
+        with pool.lease():
+            pass
+        fake_chromium[0].browser.states.is_alive = False
+        with pool.lease():
+            pass
+
+        assert len(fake_chromium) == 2
+        pool.close()
+
+    def test_idle_timeout_quits_browser(self, fake_chromium):
+        """The browser is shut down after idling for idle_timeout seconds."""
+        pool = BrowserPool(lambda: None, max_uses=10, idle_timeout=0.1)
+        with pool.lease():
+            pass
+
+        deadline = time.monotonic() + 2
+        while not fake_chromium[0].quit_called and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert fake_chromium[0].quit_called
+
+        with pool.lease():
+            pass
+        assert len(fake_chromium) == 2
+        pool.close()
@@ -0,0 +1,60 @@
+"""
+Tests for browser profiles.
+"""
+
+import pytest
+
+from src.core.airdrop_manager import AirdropManager
+from src.core.browser_profile import BLOCKED_RESOURCE_PATTERNS, apply_page_settings, get_profile
+from src.utils.config import AppConfig
+
+
+class FakeSetter:
+    def __init__(self):
+        self.blocked = None
+
+    def blocked_urls(self, urls):
+        self.blocked = urls
+
+
+class FakePage:
+    def __init__(self):
+        self.set = FakeSetter()
+
+
+class TestBrowserProfiles:
+    """Test profile lookup and how profiles reach the browser."""
+
+    def test_lean_options_come_from_config(self):
+        """The lean profile's flags are combined with the configured arguments."""
+        manager = AirdropManager(AppConfig(
+            browser_profile="lean", browser_arguments=["--lang=en"], ledger_path=""
+        ))
+        arguments = manager.get_chromium_options().arguments
+
+        assert "--headless=new" in arguments
+        assert "--disable-gpu" in arguments
+        assert "--renderer-process-limit=2" in arguments
+        assert arguments[-1] == "--lang=en"
+
+    def test_default_profile_stays_headed(self):
+        """The default profile adds no flags beyond the configured ones."""
+        manager = AirdropManager(AppConfig(ledger_path=""))
+        arguments = manager.get_chromium_options().arguments
+
+        assert not any(argument.startswith("--headless") for argument in arguments)
+        assert "-no-first-run" in arguments
+
+    def test_page_settings_block_resources(self):
+        """Only profiles with blocked URLs touch the page's request blocking."""
+        lean_page, default_page = FakePage(), FakePage()
+        apply_page_settings(lean_page, get_profile("lean"))
+        apply_page_settings(default_page, get_profile("default"))
+
+        assert lean_page.set.blocked == BLOCKED_RESOURCE_PATTERNS
+        assert default_page.set.blocked is None
+
+    def test_unknown_profile(self):
+        """An unknown profile name is rejected when the manager is created."""
+        with pytest.raises(ValueError, match="Unknown browser profile"):
+            AirdropManager(AppConfig(browser_profile="turbo", ledger_path=""))
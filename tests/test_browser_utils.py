@@ -31,4 +31,43 @@ class TestBrowserUtils:
         ]
         
         for address in invalid_addresses:
-            assert BrowserUtils.validate_wallet_address(address) is False 
\ No newline at end of file
+            assert BrowserUtils.validate_wallet_address(address) is False
+
+    def test_wait_for_any_uses_observer_result(self):
+        """Test the in-page observer result is returned without polling."""
+        class Page:
+            def run_js(self, script, xpaths, timeout_ms, timeout):
+                self.call = (xpaths, timeout_ms)
+                return [1, "element"]
+            
+            def ele(self, locator, timeout=None):
+                raise AssertionError("should not poll")
+        
+        page = Page()
+        assert BrowserUtils.wait_for_any(page, ["//a", "//b"], timeout=2) == (1, "element")
+        assert page.call == (["//a", "//b"], 2000)
+    
+    def test_wait_for_any_falls_back_to_polling(self):
+        """Test polling is used when the observer script cannot run."""
+        class Page:
+            def run_js(self, *args, **kwargs):
+                raise RuntimeError("context lost")
+            
+            def ele(self, locator, timeout=None):
+                return "element" if locator == "xpath://b" else None
+        
+        assert BrowserUtils.wait_for_any(Page(), ["//a", "//b"], timeout=1) == (1, "element")
+    
+    def test_wait_for_element_uses_observer(self):
+        """Test wait_for_element resolves through the observer wait, not polling."""
+        class Page:
+            def run_js(self, script, xpaths, timeout_ms, timeout):
+                self.call = (xpaths, timeout_ms)
+                return [0, "element"]
+            
+            def ele(self, locator, timeout=None):
+                raise AssertionError("should not poll")
+        
+        page = Page()
+        assert BrowserUtils.wait_for_element(page, "//a", timeout=3) == "element"
+        assert page.call == (["//a"], 3000)
@@ -0,0 +1,131 @@
+"""
+Tests for cooperative cancellation.
+"""
+
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from src.core import airdrop_manager as airdrop_manager_module
+from src.core.airdrop_manager import AirdropManager
+from src.core.cancellation import CancellationToken, OperationCancelled
+from src.utils.config import AppConfig
+
+
+class FakeElement:
+    """Element stand-in that accepts clicks and input."""
+
+    shadow_root = None
+    text = ""
+
+    def click(self):
+        pass
+
+    def input(self, text):
+        pass
+
+    def children(self):
+        return []
+
+
+class FakeChromiumPage:
+    """Page stand-in that owns a real child process, like Chromium does."""
+
+    instances = []
+
+    def __init__(self, addr_or_opts=None):
+        self.process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        self.challenge_seen = threading.Event()
+        FakeChromiumPage.instances.append(self)
+
+    @property
+    def title(self):
+        # Stays on the Cloudflare interstitial until the test stops the run.
+        self.challenge_seen.set()
+        return "Just a moment..."
+
+    def get(self, url, timeout=None):
+        pass
+
+    def ele(self, locator, timeout=None):
+        return FakeElement()
+
+    def run_js(self, script, selectors, *args, timeout=None):
+        # Every form selector matches a ready element.
+        return [[FakeElement() for _ in selectors], [True] * len(selectors)]
+
+    def eles(self, locator):
+        return []
+
+    def quit(self):
+        self.process.kill()
+        self.process.wait()
+
+
+class TestCancellationToken:
+    """Test cases for CancellationToken."""
+
+    def test_sleep_is_interrupted(self):
+        """Test cancel() wakes a sleeping thread immediately."""
+        token = CancellationToken()
+        threading.Timer(0.05, token.cancel).start()
+
+        start = time.monotonic()
+        with pytest.raises(OperationCancelled):
+            token.sleep(10)
+        assert time.monotonic() - start < 1
+
+    def test_callbacks_run_once(self):
+        """Test callbacks run on cancel, and immediately once cancelled."""
+        token = CancellationToken()
+        calls = []
+        token.register(lambda: calls.append("a"))
+        unregister = token.register(lambda: calls.append("b"))
+        unregister()
+
+        token.cancel()
+        token.cancel()
+        token.register(lambda: calls.append("c"))
+
+        assert calls == ["a", "c"]
+
+
+class TestStopTearsDownBrowser:
+    """Test that stopping a run leaves no threads or child processes behind."""
+
+    def test_stop_during_challenge(self, monkeypatch):
+        """Test stop() aborts the bypass loop, quits the browser and ends the thread."""
+        monkeypatch.setattr(airdrop_manager_module, "ChromiumPage", FakeChromiumPage)
+        FakeChromiumPage.instances.clear()
+        threads_before = set(threading.enumerate())
+
+        manager = AirdropManager(AppConfig(ledger_path="", notification_sinks=[]))
+        monkeypatch.setattr(manager, "_human_type", lambda element, text, cancel_token: None)
+        messages = []
+        for _ in range(3):
+            worker = threading.Thread(
+                target=manager.perform_airdrop_attempts,
+                args=("9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM", messages.append),
+            )
+            worker.start()
+            deadline = time.monotonic() + 5
+            while not FakeChromiumPage.instances and time.monotonic() < deadline:
+                time.sleep(0.01)
+            page = FakeChromiumPage.instances[-1]
+            assert page.challenge_seen.wait(5)
+
+            start = time.monotonic()
+            manager.stop()
+            worker.join(5)
+
+            assert not worker.is_alive()
+            assert time.monotonic() - start < 3
+            assert page.process.poll() is not None
+            FakeChromiumPage.instances.clear()
+
+        assert messages[-1] == "Status: Stopped."
+        leaked = [thread for thread in set(threading.enumerate()) - threads_before if thread.is_alive()]
+        assert leaked == []
@@ -0,0 +1,81 @@
+"""
+Tests for the headless command-line interface.
+"""
+
+import json
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from src import cli
+
+WALLET = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+OTHER_WALLET = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+REPO_ROOT = Path(__file__).parent.parent
+
+
+def rpc_args(rpc_server, tmp_path):
+    return [
+        "--backend", "rpc", "--rpc-url", rpc_server.url, "--no-confirm",
+        "--ledger", "", "--log-dir", str(tmp_path / "logs"), "--json",
+    ]
+
+
+def read_events(text):
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+class TestCli:
+    """Test the one-shot and daemon modes of the CLI."""
+
+    def test_one_shot_json_progress(self, rpc_server, tmp_path, capsys):
+        """Wallets from arguments and files are funded once and reported as JSON."""
+        rpc_server.handlers["requestAirdrop"] = lambda params: "sig-" + params[0][:4]
+        wallet_file = tmp_path / "wallets.txt"
+        wallet_file.write_text(f"{OTHER_WALLET}\n{WALLET}\nnot-a-wallet\n")
+
+        code = cli.main([WALLET, "--file", str(wallet_file)] + rpc_args(rpc_server, tmp_path))
+        events = read_events(capsys.readouterr().out)
+
+        assert code == 0
+        attempts = [event for event in events if event["event"] == "attempt"]
+        assert sorted(event["wallet"] for event in attempts) == sorted([WALLET, OTHER_WALLET])
+        assert all(event["outcome"] == "success" for event in attempts)
+        assert events[0]["event"] == "import" and events[0]["invalid"] == 1
+        assert events[-1] == {**events[-1], "event": "finished", "succeeded": 2, "total": 2}
+
+    def test_failures_set_exit_code(self, rpc_server, tmp_path, capsys):
+        """A failed airdrop makes the process exit with status 1."""
+        def fail(params):
+            raise ValueError("rate limited")
+
+        rpc_server.handlers["requestAirdrop"] = fail
+        assert cli.main([WALLET] + rpc_args(rpc_server, tmp_path)) == 1
+
+    def test_no_wallets_is_a_usage_error(self, tmp_path, capsys):
+        """Running without wallets exits with status 2."""
+        assert cli.main(["--log-dir", str(tmp_path), "--ledger", ""]) == 2
+
+    def test_daemon_stops_on_sigterm(self, rpc_server, tmp_path):
+        """The daemon keeps running until SIGTERM, then exits cleanly."""
+        rpc_server.handlers["requestAirdrop"] = lambda params: "sig"
+        process = subprocess.Popen(
+            [sys.executable, "-m", "src.cli", WALLET, "--daemon", "--cooldown", "3600"]
+            + rpc_args(rpc_server, tmp_path),
+            cwd=REPO_ROOT, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+        )
+        deadline = time.monotonic() + 30
+        while not rpc_server.requests and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert rpc_server.requests, "daemon never requested an airdrop"
+
+        process.send_signal(signal.SIGTERM)
+        stdout, stderr = process.communicate(timeout=15)
+        events = read_events(stdout)
+
+        assert process.returncode == 0, stderr
+        assert "tkinter" not in stderr
+        assert [event["event"] for event in events][-1] == "stopped"
+        assert any(event["event"] == "attempt" and event["outcome"] == "success" for event in events)
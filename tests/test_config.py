@@ -0,0 +1,152 @@
+"""
+Tests for layered configuration and live reload.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from src.utils.config import AppConfig, ConfigError, ConfigManager
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def write(path, text):
+    """Write a config file and make sure its modification time moves forward."""
+    previous = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(text)
+    os.utime(path, ns=(previous + 1_000_000_000, previous + 1_000_000_000))
+
+
+class TestLayering:
+    """Test defaults, file, environment and override precedence."""
+
+    def test_file_overrides_defaults(self, tmp_path):
+        """TOML values replace defaults; tables are flattened."""
+        path = tmp_path / "config.toml"
+        write(path, 'response_wait_seconds = 4\n[browser]\nsolana_faucet_url = "http://127.0.0.1:8080/"\n')
+        settings = ConfigManager(path)
+
+        assert settings.config.response_wait_seconds == 4.0
+        assert isinstance(settings.config.response_wait_seconds, float)
+        assert settings.config.solana_faucet_url == "http://127.0.0.1:8080/"
+        assert settings.config.result_check_timeout == AppConfig().result_check_timeout
+
+    def test_environment_and_overrides_win(self, tmp_path, monkeypatch):
+        """Environment variables beat the file and overrides beat both."""
+        path = tmp_path / "config.toml"
+        write(path, 'retry_cooldown_seconds = 10\nlog_level = "DEBUG"\n')
+        monkeypatch.setenv("RETRY_COOLDOWN", "20")
+        monkeypatch.setenv("LOG_LEVEL", "warning")
+
+        settings = ConfigManager(path, {"log_level": "ERROR"})
+        assert settings.config.retry_cooldown_seconds == 20
+        assert settings.config.log_level == "ERROR"
+
+    @pytest.mark.parametrize("text, message", [
+        ("typing_delay = 1\n", "Unknown setting"),
+        ('page_load_timeout = "fast"\n', "page_load_timeout must be of type float"),
+        ("scheduler_workers = 1.5\n", "scheduler_workers must be of type int"),
+        ("element_wait_timeout = 0\n", "element_wait_timeout must be greater than 0"),
+        ("typing_min_delay = 0.5\n", "typing_min_delay must not exceed typing_max_delay"),
+        ("page_load_timeout = \n", "Invalid TOML"),
+        ('trace_mode = "verbose"\n', "trace_mode must be"),
+        ('browser_profile = "tiny"\n', "browser_profile must be one of default, lean"),
+        ('confirmation_commitment = "final"\n', "confirmation_commitment must be one of"),
+        ('notification_sinks = ["desktop", "pager"]\n', "notification_sinks entries must be"),
+    ])
+    def test_invalid_settings_raise(self, tmp_path, text, message):
+        """Unknown names, wrong types, bad ranges and bad syntax are rejected."""
+        path = tmp_path / "config.toml"
+        write(path, text)
+        with pytest.raises(ConfigError, match=message):
+            ConfigManager(path)
+
+    def test_missing_explicit_file_raises(self, tmp_path):
+        """A config file that was asked for must exist."""
+        with pytest.raises(ConfigError, match="not found"):
+            ConfigManager(tmp_path / "missing.toml")
+
+    def test_import_does_not_load_config(self, tmp_path):
+        """A broken config file surfaces where it is loaded, not on import."""
+        path = tmp_path / "config.toml"
+        write(path, "page_load_timeout = [\n")
+        env = dict(os.environ, AIRDROP_CONFIG=str(path))
+        script = (
+            "import src.cli, src.core.airdrop_manager, src.utils.logger\n"
+            "from src.utils.config import ConfigError, get_config\n"
+            "try:\n"
+            "    get_config()\n"
+            "except ConfigError:\n"
+            "    print('deferred')\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], cwd=ROOT, env=env, capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "deferred"
+
+
+class TestDataPaths:
+    """Test where the ledger and watchdog state are written."""
+
+    def test_relative_paths_use_the_data_dir(self, tmp_path, monkeypatch):
+        """Relative data paths resolve against the data directory, not the working directory."""
+        monkeypatch.setenv("AIRDROP_DATA_DIR", str(tmp_path / "user"))
+        app_config = AppConfig()
+        assert app_config.data_path(app_config.ledger_path) == str(tmp_path / "user" / "attempts.db")
+
+        app_config.data_dir = str(tmp_path / "app")
+        assert app_config.data_path(app_config.watchdog_state_dir) == str(tmp_path / "app" / "browsers")
+        assert app_config.data_path(str(tmp_path / "elsewhere.db")) == str(tmp_path / "elsewhere.db")
+        assert app_config.data_path("") == ""
+
+
+class TestReload:
+    """Test applying a changed file to a running configuration."""
+
+    def test_reload_updates_timing_in_place(self, tmp_path):
+        """Reloadable settings change on the same object; others wait for a restart."""
+        path = tmp_path / "config.toml"
+        write(path, "response_wait_seconds = 10\n")
+        settings = ConfigManager(path)
+        live = settings.config
+        seen = []
+        settings.listeners.append(lambda app_config, changed: seen.append(changed))
+
+        write(path, 'response_wait_seconds = 1.5\nrpc_url = "http://10.0.0.1:8899"\n')
+        assert settings.reload() == {"response_wait_seconds"}
+
+        assert live.response_wait_seconds == 1.5
+        assert live.rpc_url == AppConfig().rpc_url
+        assert seen == [{"response_wait_seconds"}]
+
+    def test_invalid_reload_keeps_current_config(self, tmp_path):
+        """A broken edit is rejected and the running values stay."""
+        path = tmp_path / "config.toml"
+        write(path, "result_check_timeout = 5\n")
+        settings = ConfigManager(path)
+
+        write(path, "result_check_timeout = -1\n")
+        with pytest.raises(ConfigError):
+            settings.reload()
+        assert settings.config.result_check_timeout == 5.0
+
+    def test_watcher_picks_up_changes(self, tmp_path):
+        """The watcher reloads after the file is modified."""
+        path = tmp_path / "config.toml"
+        write(path, "typing_max_delay = 0.2\n")
+        settings = ConfigManager(path)
+        settings.watch(interval=0.02)
+        try:
+            write(path, "typing_max_delay = 0.15\n")
+            deadline = time.monotonic() + 5
+            while settings.config.typing_max_delay != 0.15 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert settings.config.typing_max_delay == 0.15
+        finally:
+            settings.close()
@@ -0,0 +1,144 @@
+"""
+Tests for the confirmation tracker.
+"""
+
+import logging
+import sys
+import time
+
+from src.core import confirmation
+from src.core.confirmation import ConfirmationTracker, derive_websocket_url
+from src.core.rpc_client import SolanaRpcClient
+from tests.fake_driver import FakeClock
+
+
+def status_handler(confirm_at, level="confirmed"):
+    """Build a getSignatureStatuses handler that confirms signatures at given times."""
+    def handler(params):
+        now = time.monotonic()
+        value = []
+        for signature in params[0]:
+            if now >= confirm_at.get(signature, float("inf")):
+                value.append({"slot": 1, "confirmations": 1, "err": None, "confirmationStatus": level})
+            else:
+                value.append(None)
+        return {"context": {"slot": 1}, "value": value}
+    return handler
+
+
+class TestConfirmationTracker:
+    """Test cases for ConfirmationTracker."""
+
+    def test_derive_websocket_url(self):
+        """Test the websocket URL uses the RPC port plus one."""
+        assert derive_websocket_url("http://127.0.0.1:8899") == "ws://127.0.0.1:8900"
+        assert derive_websocket_url("https://api.devnet.solana.com") == "wss://api.devnet.solana.com"
+
+    def test_polling_resolves_as_soon_as_confirmed(self, rpc_server):
+        """Test polling returns shortly after the status flips, not after a fixed sleep."""
+        start = time.monotonic()
+        rpc_server.handlers["getSignatureStatuses"] = status_handler({"a": start + 0.2, "b": start})
+        tracker = ConfirmationTracker(SolanaRpcClient(rpc_server.url), timeout=5, max_poll_interval=0.1)
+
+        results = tracker.wait_for(["a", "b"], submitted_at=start)
+
+        assert results["a"].confirmed and results["b"].confirmed
+        assert time.monotonic() - start < 1
+        # Both signatures are checked in one batched call per poll.
+        assert all(len(request["params"][0]) <= 2 for request in rpc_server.requests)
+        assert tracker.stats()["count"] == 2
+
+    def test_lower_commitment_does_not_resolve(self, rpc_server):
+        """Test a processed status does not satisfy a finalized target."""
+        rpc_server.handlers["getSignatureStatuses"] = status_handler({"a": 0}, level="processed")
+        tracker = ConfirmationTracker(SolanaRpcClient(rpc_server.url), commitment="finalized")
+
+        result = tracker.wait_for(["a"], timeout=0.3)["a"]
+
+        assert not result.confirmed
+        assert result.error == "Timed out waiting for confirmation."
+
+    def test_unknown_commitment_level_stays_pending(self, rpc_server):
+        """Test a confirmationStatus the tracker does not know is not reached and not an error."""
+        rpc_server.handlers["getSignatureStatuses"] = status_handler({"a": 0}, level="optimistic")
+        tracker = ConfirmationTracker(SolanaRpcClient(rpc_server.url), clock=FakeClock())
+
+        result = tracker.wait_for(["a"], timeout=30)["a"]
+
+        assert not result.confirmed
+        assert result.error == "Timed out waiting for confirmation."
+
+    def test_backoff_runs_on_the_injected_clock(self, rpc_server):
+        """Test deadlines and poll waits use the tracker clock, not real time."""
+        clock = FakeClock()
+
+        def statuses(params):
+            if clock.monotonic() < 10:
+                return {"value": [None]}
+            return {"value": [{"confirmations": 1, "err": None, "confirmationStatus": "confirmed"}]}
+
+        rpc_server.handlers["getSignatureStatuses"] = statuses
+        tracker = ConfirmationTracker(
+            SolanaRpcClient(rpc_server.url), min_poll_interval=1, max_poll_interval=4, clock=clock
+        )
+
+        started = time.monotonic()
+        result = tracker.wait_for(["a"], timeout=60)["a"]
+
+        assert result.confirmed
+        # Polls at virtual 0, 2, 6 and 10 seconds as the wait doubles up to the maximum.
+        assert result.elapsed == 10
+        assert len(rpc_server.requests) == 4
+        assert time.monotonic() - started < 5
+
+    def test_failed_transaction(self, rpc_server):
+        """Test a transaction error resolves the signature as failed."""
+        rpc_server.handlers["getSignatureStatuses"] = lambda params: {
+            "value": [{"confirmationStatus": "processed", "err": {"InstructionError": [0, "Custom"]}}]
+        }
+        tracker = ConfirmationTracker(SolanaRpcClient(rpc_server.url))
+
+        result = tracker.wait_for(["a"], timeout=1)["a"]
+
+        assert not result.confirmed
+        assert "InstructionError" in result.error
+
+    def test_websocket_notification(self, rpc_server, ws_server):
+        """Test a signature resolves from a signatureNotification."""
+        rpc_server.handlers["getSignatureStatuses"] = status_handler({})
+        ws_server.notify_after["a"] = 0.1
+        tracker = ConfirmationTracker(
+            SolanaRpcClient(rpc_server.url), ws_url=ws_server.url, timeout=5, max_poll_interval=3
+        )
+
+        start = time.monotonic()
+        result = tracker.wait_for(["a"])["a"]
+
+        assert result.confirmed
+        assert ws_server.subscribed == ["a"]
+        assert time.monotonic() - start < 2
+
+    def test_missing_websocket_client_warns_once(self, rpc_server, monkeypatch, caplog):
+        """Test a missing websocket-client falls back to polling with a single warning."""
+        monkeypatch.setitem(sys.modules, "websocket", None)
+        monkeypatch.setattr(confirmation, "_warned_no_websocket", False)
+        rpc_server.handlers["getSignatureStatuses"] = status_handler({"a": 0, "b": 0})
+        tracker = ConfirmationTracker(SolanaRpcClient(rpc_server.url), ws_url="ws://127.0.0.1:1")
+
+        with caplog.at_level(logging.WARNING, logger="src.core.confirmation"):
+            assert tracker.wait_for(["a"], timeout=1)["a"].confirmed
+            assert tracker.wait_for(["b"], timeout=1)["b"].confirmed
+
+        warnings = [record for record in caplog.records if "websocket-client" in record.getMessage()]
+        assert len(warnings) == 1
+
+    def test_stats_percentiles(self, rpc_server):
+        """Test p50/p99 summarize recorded time-to-confirm samples."""
+        tracker = ConfirmationTracker(SolanaRpcClient(rpc_server.url))
+        assert tracker.stats() == {"count": 0, "p50": None, "p99": None}
+
+        tracker._latencies.extend(i / 100 for i in range(1, 101))
+
+        stats = tracker.stats()
+        assert stats["p50"] == 0.5
+        assert stats["p99"] == 0.99
@@ -0,0 +1,60 @@
+"""
+Tests for the GUI event queue.
+"""
+
+import threading
+import time
+
+from src.gui.event_queue import (
+    STATUS_ERROR_COLOR,
+    STATUS_INFO_COLOR,
+    STATUS_SUCCESS_COLOR,
+    STATUS_WAITING_COLOR,
+    UiEventQueue,
+    classify_status,
+)
+
+
+class TestUiEventQueue:
+    """Test coalescing and status classification."""
+
+    def test_drain_keeps_latest_value_per_field(self):
+        """Only the newest update of each field survives until the next drain."""
+        events = UiEventQueue()
+        events.post("status", "one")
+        events.post("status", "two")
+        events.post("import_finished")
+
+        assert events.drain() == {"status": "two", "import_finished": None}
+        assert events.drain() == {}
+        assert events.coalesced == 1
+
+    def test_flood_from_threads_is_bounded(self):
+        """Thousands of updates from several threads leave one pending value."""
+        events = UiEventQueue()
+
+        def flood(worker: int) -> None:
+            for index in range(5000):
+                events.post("status", f"worker {worker} message {index}")
+
+        threads = [threading.Thread(target=flood, args=(n,)) for n in range(4)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        drained = events.drain()
+        assert list(drained) == ["status"]
+        assert drained["status"].endswith("message 4999")
+        assert events.posted == 20000
+        assert elapsed < 2.0
+
+    def test_classify_status(self):
+        """Messages map to the status colors used by the label."""
+        assert classify_status("Status: An error occurred") == STATUS_ERROR_COLOR
+        assert classify_status("Status: Attempt 2 failed. Retrying in 60 minutes.") == STATUS_ERROR_COLOR
+        assert classify_status("Status: Attempt 1 successful. Retrying...") == STATUS_SUCCESS_COLOR
+        assert classify_status("Status: Submitted form. Waiting for response...") == STATUS_WAITING_COLOR
+        assert classify_status("Starting airdrop process...") == STATUS_INFO_COLOR
@@ -0,0 +1,81 @@
+"""
+Tests for the faucet form page object.
+"""
+
+import pytest
+
+from src.core.cancellation import CancellationToken, OperationCancelled
+from src.core.faucet_page import FORM_SELECTORS, FaucetPage, MissingElementsError
+
+
+class ScriptedPage:
+    """Page stand-in answering the resolve script from a table of elements."""
+
+    def __init__(self, present, hidden=()):
+        self.present = set(present)
+        self.hidden = set(hidden)
+        self.calls = []
+
+    def run_js(self, script, selectors, required, timeout_ms, timeout=None):
+        self.calls.append((list(selectors), list(required), timeout_ms))
+        names = {xpath: name for name, xpath in FORM_SELECTORS.items()}
+        nodes = [names[xpath] if names[xpath] in self.present else None for xpath in selectors]
+        ready = [node is not None and node not in self.hidden for node in nodes]
+        return [nodes, ready]
+
+
+class TestFaucetPage:
+    """Test batched resolution, caching and missing-element reporting."""
+
+    def test_one_evaluation_resolves_every_selector(self):
+        """All selectors go into one script call and the handles are cached."""
+        page = ScriptedPage(FORM_SELECTORS)
+        form = FaucetPage(page, timeout=2)
+
+        assert form.resolve("amount_toggle", "wallet_input") == []
+        assert len(page.calls) == 1
+        selectors, required, timeout_ms = page.calls[0]
+        assert selectors == list(FORM_SELECTORS.values())
+        assert required == [0, 2]
+        assert timeout_ms == 2000
+
+        assert form.element("wallet_input") == "wallet_input"
+        assert form.element("submit_button") == "submit_button"
+        assert form.round_trips == 1
+
+    def test_ready_rechecks_the_page(self):
+        """ready() waits in the page again even for a cached element."""
+        page = ScriptedPage(FORM_SELECTORS)
+        form = FaucetPage(page)
+        form.resolve()
+        assert form.ready("amount_button") == "amount_button"
+        assert form.round_trips == 2
+        assert page.calls[1][1] == [1]
+
+    def test_missing_and_hidden_elements_are_named(self):
+        """Elements that are absent or not visible in time are listed exactly."""
+        page = ScriptedPage({"amount_toggle", "amount_button", "wallet_input"}, hidden={"amount_button"})
+        form = FaucetPage(page)
+
+        assert form.resolve() == ["submit_button"]
+        with pytest.raises(MissingElementsError) as raised:
+            form.resolve("amount_button", "wallet_input", "submit_button")
+        assert raised.value.missing == ["amount_button", "submit_button"]
+        assert "amount_button, submit_button" in str(raised.value)
+
+    def test_unknown_name(self):
+        """Asking for an undeclared element is a programming error."""
+        with pytest.raises(KeyError):
+            FaucetPage(ScriptedPage(FORM_SELECTORS)).resolve("captcha")
+
+    def test_cancelled_wait_raises(self):
+        """A wait that ends because the attempt was cancelled raises OperationCancelled."""
+        token = CancellationToken()
+
+        class QuitPage:
+            def run_js(self, *args, **kwargs):
+                token.cancel()
+                raise RuntimeError("browser closed")
+
+        with pytest.raises(OperationCancelled):
+            FaucetPage(QuitPage(), cancel_token=token).resolve("wallet_input")
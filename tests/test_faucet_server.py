@@ -0,0 +1,67 @@
+"""
+Tests for the local faucet stand-in used by the end-to-end benchmarks.
+"""
+
+import json
+import time
+import urllib.request
+
+import pytest
+
+from tests.faucet_server import RESULT_XPATH
+
+WALLET = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+
+# The locators AirdropManager uses on the real faucet page, in order.
+FORM_XPATHS = [
+    '//*[@type="button"]',
+    '//*[@type="button" and text()="5"]',
+    '//*[@placeholder="Wallet Address"]',
+    '//*[@type="submit"]',
+]
+
+
+def post_airdrop(url, payload):
+    request = urllib.request.Request(
+        url + "api/airdrop",
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return json.loads(response.read())
+
+
+class TestFaucetServer:
+    """Test the page structure and the airdrop API of the stand-in."""
+
+    def test_page_matches_manager_locators(self, faucet_server):
+        """Every element the manager looks for exists; the result list appears later."""
+        html = pytest.importorskip("lxml.html")
+        with urllib.request.urlopen(faucet_server.url, timeout=5) as response:
+            document = html.fromstring(response.read())
+
+        assert document.findtext(".//title") == "Solana Faucet"
+        for xpath in FORM_XPATHS:
+            assert document.xpath(xpath), xpath
+        assert document.xpath('//*[@type="button"]')[0].get("id") == "amount-toggle"
+        assert not document.xpath(RESULT_XPATH)
+
+    def test_api_reports_configured_outcome(self, faucet_server):
+        """The API answers with success or the rate-limit message and records requests."""
+        result = post_airdrop(faucet_server.url, {"wallet": WALLET, "amount": "5"})
+        assert result["ok"]
+        assert "success" in result["message"].lower()
+        assert WALLET in result["message"]
+
+        faucet_server.succeed = False
+        result = post_airdrop(faucet_server.url, {"wallet": WALLET, "amount": "5"})
+        assert not result["ok"]
+        assert "Try again in 8 hours" in result["message"]
+        assert [request["wallet"] for request in faucet_server.requests] == [WALLET, WALLET]
+
+    def test_api_delay(self, faucet_server):
+        """Responses are held back by the configured delay."""
+        faucet_server.delay = 0.2
+        start = time.monotonic()
+        post_airdrop(faucet_server.url, {"wallet": WALLET, "amount": "5"})
+        assert time.monotonic() - start >= 0.2
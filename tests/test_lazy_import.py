@@ -0,0 +1,56 @@
+"""
+Tests for lazy imports.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.utils.lazy_import import lazy_import
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+class TestLazyImport:
+    """Test deferred loading and forwarding of lazy objects."""
+
+    def test_loads_on_first_use(self):
+        """The target is imported on first call and then cached."""
+        dumps = lazy_import("json", "dumps")
+        assert not dumps.is_loaded
+
+        assert dumps({"a": 1}) == '{"a": 1}'
+        assert dumps.is_loaded
+        assert "json" in repr(dumps)
+
+    def test_forwards_attributes(self):
+        """Attribute reads and writes go to the imported object."""
+        module = lazy_import("types")
+        namespace = module.SimpleNamespace(value=1)
+        assert namespace.value == 1
+
+        target = lazy_import("argparse", "Namespace")
+        target.marker = "set"
+        try:
+            assert lazy_import("argparse").Namespace.marker == "set"
+        finally:
+            del target.marker
+
+    def test_missing_module_fails_on_use(self):
+        """A missing dependency only raises when it is actually used."""
+        missing = lazy_import("module_that_does_not_exist")
+        with pytest.raises(ImportError):
+            missing.anything
+
+    def test_airdrop_manager_does_not_import_browser(self):
+        """Importing the manager leaves DrissionPage and plyer unloaded."""
+        code = (
+            "import sys, src.core.airdrop_manager;"
+            "print(sorted(m for m in ('DrissionPage', 'plyer') if m in sys.modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        assert output.strip() == "[]"
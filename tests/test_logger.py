@@ -0,0 +1,87 @@
+"""
+Tests for the logging setup.
+"""
+
+import gzip
+import json
+import logging
+
+import pytest
+
+from src.utils import logger as logger_module
+from src.utils.config import AppConfig
+from src.utils.logger import GzipRotatingFileHandler, setup_logger, stop_logging
+
+
+@pytest.fixture
+def fresh_logger(request):
+    """Yield a unique logger name and remove its handlers afterwards."""
+    name = f"test_logger_{request.node.name}"
+    yield name
+    stop_logging()
+    for target in (logging.getLogger(name), logging.getLogger(logger_module.PACKAGE_LOGGER)):
+        for handler in list(target.handlers):
+            target.removeHandler(handler)
+
+
+class TestLogger:
+    """Test queue-based logging, JSON lines and rotation."""
+
+    def test_json_lines_with_structured_fields(self, tmp_path, fresh_logger):
+        """JSON records carry the extra wallet/attempt/phase fields."""
+        settings = AppConfig(logs_dir=str(tmp_path / "logs"), log_format="json", log_to_console=False)
+        logger = setup_logger(fresh_logger, app_config=settings)
+        logger.info("attempt done", extra={"wallet": "abc", "attempt": 2, "duration": 1.5})
+        logger.info("plain")
+        stop_logging()
+
+        lines = (tmp_path / "logs" / "airdrop_tool.jsonl").read_text().splitlines()
+        first, second = (json.loads(line) for line in lines)
+        assert first["message"] == "attempt done"
+        assert (first["wallet"], first["attempt"], first["duration"]) == ("abc", 2, 1.5)
+        assert "wallet" not in second
+
+    def test_exceptions_pass_through_the_queue(self, tmp_path, fresh_logger):
+        """Tracebacks logged through the queue land in the exception field, not the message."""
+        settings = AppConfig(logs_dir=str(tmp_path), log_format="json", log_to_console=False)
+        logger = setup_logger(fresh_logger, app_config=settings)
+        try:
+            raise ValueError("bad wallet")
+        except ValueError:
+            logger.exception("attempt %d failed", 3)
+        stop_logging()
+
+        entry = json.loads((tmp_path / "airdrop_tool.jsonl").read_text())
+        assert entry["message"] == "attempt 3 failed"
+        assert entry["exception"].startswith("Traceback")
+        assert "ValueError: bad wallet" in entry["exception"]
+
+    def test_module_loggers_share_the_queue(self, tmp_path, fresh_logger):
+        """Records from package module loggers reach the file too."""
+        settings = AppConfig(logs_dir=str(tmp_path), log_to_console=False)
+        setup_logger(fresh_logger, app_config=settings)
+        logging.getLogger(f"{logger_module.PACKAGE_LOGGER}.core.example").warning("from a module")
+        stop_logging()
+
+        assert "from a module" in (tmp_path / "airdrop_tool.log").read_text()
+
+    def test_no_outputs(self, tmp_path, fresh_logger):
+        """With both outputs disabled nothing is written or started."""
+        settings = AppConfig(logs_dir=str(tmp_path / "logs"), log_to_file=False, log_to_console=False)
+        setup_logger(fresh_logger, app_config=settings).error("dropped")
+
+        assert not (tmp_path / "logs").exists()
+        assert logger_module._listener is None
+
+    def test_rotation_gzips_and_keeps_backup_count(self, tmp_path):
+        """Rotated files are gzipped and only backup_count of them are kept."""
+        path = tmp_path / "app.log"
+        handler = GzipRotatingFileHandler(path, max_bytes=200, backup_count=2)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        for index in range(40):
+            handler.emit(logging.makeLogRecord({"msg": f"line {index:02d} " + "x" * 40}))
+        handler.close()
+
+        rotated = sorted(p.name for p in tmp_path.iterdir() if p.name != "app.log")
+        assert rotated == ["app.log.1.gz", "app.log.2.gz"]
+        assert gzip.decompress((tmp_path / "app.log.1.gz").read_bytes()).startswith(b"line")
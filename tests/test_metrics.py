@@ -0,0 +1,65 @@
+"""
+Tests for attempt metrics.
+"""
+
+import json
+import urllib.request
+
+from src.core.airdrop_manager import AirdropManager
+from src.core.metrics import AirdropMetrics, NullMetrics, SnapshotWriter, create_metrics
+from src.utils.config import AppConfig
+
+
+class TestMetrics:
+    """Test recording, Prometheus rendering and JSON snapshots."""
+
+    def test_histogram_renders_cumulative_buckets(self):
+        """Bucket counts are cumulative and end with +Inf, _sum and _count."""
+        metrics = AirdropMetrics()
+        for seconds in (0.07, 0.3, 0.3, 500):
+            metrics.phase_duration.observe(seconds, "page_load")
+        text = metrics.registry.render_prometheus()
+
+        assert 'airdrop_phase_duration_seconds_bucket{phase="page_load",le="0.1"} 1' in text
+        assert 'airdrop_phase_duration_seconds_bucket{phase="page_load",le="0.5"} 3' in text
+        assert 'airdrop_phase_duration_seconds_bucket{phase="page_load",le="120"} 3' in text
+        assert 'airdrop_phase_duration_seconds_bucket{phase="page_load",le="+Inf"} 4' in text
+        assert 'airdrop_phase_duration_seconds_count{phase="page_load"} 4' in text
+        assert "# TYPE airdrop_phase_duration_seconds histogram" in text
+
+    def test_endpoint_serves_recorded_attempts(self):
+        """Attempts recorded by the manager appear on the /metrics endpoint."""
+        manager = AirdropManager(AppConfig(ledger_path="", metrics_enabled=True, metrics_port=0))
+        server = manager.metrics.serve("127.0.0.1", 0)
+        try:
+            manager._record_attempt("wallet", 0.0, True, "ok", {"interact": 1.5})
+            manager._record_attempt("wallet", 0.0, False, "no", {"interact": 0.2})
+            with urllib.request.urlopen(server.url, timeout=5) as response:
+                content_type = response.headers["Content-Type"]
+                text = response.read().decode()
+        finally:
+            manager.close()
+
+        assert content_type.startswith("text/plain; version=0.0.4")
+        assert 'airdrop_attempts_total{backend="browser",outcome="success"} 1' in text
+        assert 'airdrop_attempts_total{backend="browser",outcome="failure"} 1' in text
+        assert 'airdrop_phase_duration_seconds_count{phase="interact"} 2' in text
+
+    def test_snapshot_file(self, tmp_path):
+        """The snapshot writer leaves a complete JSON file behind on close."""
+        metrics = AirdropMetrics()
+        metrics.record_attempt("rpc", "success", 0.4)
+        path = tmp_path / "metrics.json"
+        SnapshotWriter(metrics.registry, path, interval=60).close()
+
+        snapshot = json.loads(path.read_text())
+        samples = snapshot["metrics"]["airdrop_attempts_total"]["samples"]
+        assert samples == [{"labels": {"backend": "rpc", "outcome": "success"}, "value": 1.0}]
+        assert snapshot["metrics"]["airdrop_attempt_duration_seconds"]["samples"][0]["count"] == 1
+
+    def test_disabled_metrics_are_no_ops(self):
+        """With metrics disabled nothing is registered or served."""
+        metrics = create_metrics(AppConfig())
+        assert isinstance(metrics, NullMetrics)
+        metrics.record_attempt("browser", "success", 1.0, {"interact": 1.0})
+        metrics.close()
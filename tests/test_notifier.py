@@ -0,0 +1,164 @@
+"""
+Tests for the background notifier.
+"""
+
+import json
+import threading
+import time
+
+from src.core.notifier import (
+    FileSink,
+    Notifier,
+    NullNotifier,
+    WebhookSink,
+    coalesce_key,
+    create_notifier,
+)
+from src.utils.config import AppConfig
+
+
+class RecordingSink:
+    """Sink that records what it is sent and can be made to block or fail."""
+
+    def __init__(self, fail=False):
+        self.items = []
+        self.fail = fail
+        self.gate = threading.Event()
+        self.gate.set()
+        self.closed = False
+
+    def send(self, item):
+        self.gate.wait(5)
+        if self.fail:
+            raise OSError("sink unavailable")
+        self.items.append((item.title, item.text, item.count))
+
+    def close(self):
+        self.closed = True
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll until condition() is true or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestNotifier:
+    """Test queuing, coalescing and rate limiting."""
+
+    def test_coalesce_key_ignores_numbers(self):
+        """Messages differing only in numbers share a key."""
+        assert coalesce_key("Tool", "Attempt 3 failed") == coalesce_key("Tool", "Attempt 14 failed")
+        assert coalesce_key("Tool", "Attempt 3 failed") != coalesce_key("Tool", "Attempt 3 succeeded")
+
+    def test_notify_does_not_block_on_slow_sink(self):
+        """notify() returns immediately even while a sink is stuck."""
+        sink = RecordingSink()
+        sink.gate.clear()
+        notifier = Notifier([sink], min_interval=0)
+
+        start = time.monotonic()
+        for i in range(50):
+            notifier.notify("Tool", f"message {i}", key=str(i))
+        assert time.monotonic() - start < 0.5
+
+        sink.gate.set()
+        notifier.close()
+        assert len(sink.items) == 50
+
+    def test_similar_messages_are_merged_within_interval(self):
+        """The first notification goes out at once; a burst after it becomes one."""
+        sink = RecordingSink()
+        notifier = Notifier([sink], min_interval=0.3)
+
+        notifier.notify("Tool", "Attempt 1 failed")
+        assert wait_for(lambda: len(sink.items) == 1)
+        for attempt in range(2, 6):
+            notifier.notify("Tool", f"Attempt {attempt} failed")
+        notifier.notify("Tool", "Run finished")
+        time.sleep(0.1)
+        assert len(sink.items) == 1
+
+        assert wait_for(lambda: len(sink.items) == 3)
+        assert sink.items[0] == ("Tool", "Attempt 1 failed", 1)
+        assert ("Tool", "Attempt 5 failed (x4)", 4) in sink.items
+        assert ("Tool", "Run finished", 1) in sink.items
+        notifier.close()
+
+    def test_close_flushes_pending_and_closes_sinks(self):
+        """close() sends merged notifications without waiting out the interval."""
+        sink = RecordingSink()
+        notifier = Notifier([sink], min_interval=60)
+        notifier.notify("Tool", "first")
+        assert wait_for(lambda: len(sink.items) == 1)
+        notifier.notify("Tool", "second")
+
+        start = time.monotonic()
+        notifier.close()
+        assert time.monotonic() - start < 1
+        assert sink.items[-1] == ("Tool", "second", 1)
+        assert sink.closed
+        notifier.notify("Tool", "after close")
+        assert len(sink.items) == 2
+
+    def test_full_queue_drops(self):
+        """Notifications beyond the queue bound are counted and dropped."""
+        sink = RecordingSink()
+        sink.gate.clear()
+        notifier = Notifier([sink], min_interval=0, max_queue=2)
+        for i in range(10):
+            notifier.notify("Tool", f"message {i}", key=str(i))
+        assert notifier.dropped >= 7
+        sink.gate.set()
+        notifier.close()
+
+    def test_failing_sink_does_not_stop_others(self):
+        """A sink error is logged and the remaining sinks still receive it."""
+        broken, working = RecordingSink(fail=True), RecordingSink()
+        notifier = Notifier([broken, working], min_interval=0)
+        notifier.notify("Tool", "hello")
+        notifier.close()
+        assert working.items == [("Tool", "hello", 1)]
+
+
+class TestSinks:
+    """Test the file and webhook sinks."""
+
+    def test_file_sink_appends_json_lines(self, tmp_path):
+        """Each notification is one JSON line."""
+        path = tmp_path / "notifications" / "out.jsonl"
+        notifier = Notifier([FileSink(path)], min_interval=0)
+        notifier.notify("Tool", "one", key="a")
+        notifier.notify("Tool", "two", key="b")
+        notifier.close()
+
+        entries = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [entry["message"] for entry in entries] == ["one", "two"]
+
+    def test_webhook_sink_posts_over_one_connection(self, rpc_server):
+        """Webhook posts reuse a pooled keep-alive connection."""
+        notifier = Notifier([WebhookSink(rpc_server.url)], min_interval=0)
+        for i in range(3):
+            notifier.notify("Tool", f"message {i}", key=str(i))
+        notifier.close()
+
+        assert [request["message"] for request in rpc_server.requests] == [
+            "message 0", "message 1", "message 2"
+        ]
+        assert rpc_server.requests[0]["title"] == "Tool"
+        assert rpc_server.connections == 1
+
+    def test_create_notifier_from_config(self, tmp_path, rpc_server):
+        """Sinks come from the configuration; none configured means no thread."""
+        assert isinstance(create_notifier(AppConfig(notification_sinks=[])), NullNotifier)
+        assert isinstance(create_notifier(AppConfig(notification_sinks=["webhook"])), NullNotifier)
+
+        notifier = create_notifier(AppConfig(
+            notification_sinks=["webhook", "file"],
+            notification_webhook_url=rpc_server.url,
+            notification_file=str(tmp_path / "out.jsonl"),
+        ))
+        assert [type(sink) for sink in notifier.sinks] == [WebhookSink, FileSink]
+        notifier.close()
@@ -0,0 +1,113 @@
+"""
+Tests for attempt outcome classification and retry scheduling.
+"""
+
+import math
+import time
+
+import pytest
+
+from src.core.airdrop_manager import AirdropManager
+from src.core.outcome import (
+    FAILURE,
+    INVALID_ADDRESS,
+    NOT_FOUND,
+    RATE_LIMITED,
+    SERVICE_ERROR,
+    SUCCESS,
+    classify,
+    parse_retry_after,
+)
+from src.utils.config import AppConfig
+
+WALLET = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+
+
+class TestClassify:
+    """Test mapping response text to outcomes."""
+
+    @pytest.mark.parametrize("message, kind", [
+        ("Airdrop successful! 5 SOL sent to the wallet.", SUCCESS),
+        ("Status: Airdrop request failed. You have reached your airdrop limit today.", RATE_LIMITED),
+        ("Status: Airdrop failed: HTTP 429: Too Many Requests", RATE_LIMITED),
+        ("Please wait 2h 15m before requesting again", RATE_LIMITED),
+        ("Status: Airdrop failed: RPC error -32602: Invalid param: WrongSize", INVALID_ADDRESS),
+        ("Invalid wallet address format.", INVALID_ADDRESS),
+        ("Status: Airdrop failed: HTTP 503: Service Unavailable", SERVICE_ERROR),
+        ("Status: An error occurred: The page timed out", SERVICE_ERROR),
+        ("Something went wrong, please try again later.", SERVICE_ERROR),
+        ("Status: Notification not found. Check manually.", NOT_FOUND),
+        ("Airdrop unsuccessful", FAILURE),
+        ("", FAILURE),
+    ])
+    def test_kinds(self, message, kind):
+        """Each kind of response maps to its outcome."""
+        assert classify(message).kind == kind
+
+    def test_backend_verdict_wins(self):
+        """A known result overrides what the text suggests."""
+        assert classify("Signature: 5xyz", succeeded=True).is_success
+        assert classify("Airdrop success? no", succeeded=False).kind == FAILURE
+
+    @pytest.mark.parametrize("message, seconds", [
+        ("Try again in 8 hours.", 8 * 3600),
+        ("try again in 1 hour and 30 minutes", 5400),
+        ("Please wait 2h 15m", 8100),
+        ("Retry after 45 seconds", 45),
+        ("Retry-After: 120", 120),
+        ("You can request again in 1 day", 86400),
+        ("Try again later", None),
+        ("Limit is 2 requests every 8 hours", None),
+    ])
+    def test_retry_after(self, message, seconds):
+        """Waits are extracted from the phrases servers use."""
+        assert parse_retry_after(message) == seconds
+
+
+class TestScheduling:
+    """Test that outcomes decide when a wallet is tried next."""
+
+    def manager(self, **overrides):
+        overrides.setdefault("ledger_path", "")
+        overrides.setdefault("notification_sinks", [])
+        return AirdropManager(AppConfig(retry_cooldown_seconds=3600, transient_retry_seconds=30, **overrides))
+
+    def test_next_eligible_follows_outcome(self):
+        """Server waits are followed exactly, transient errors retry soon, others cool down."""
+        manager = self.manager()
+        cases = [
+            ("Status: You have reached your airdrop limit. Try again in 8 hours.", 8 * 3600),
+            ("Status: Notification not found. Check manually.", 30),
+            ("Status: An error occurred: disconnected", 30),
+            ("Status: Airdrop unsuccessful", 3600),
+        ]
+        for message, wait in cases:
+            outcome = manager._record_attempt(WALLET, time.time(), False, message)
+            expected = time.time() + wait
+            assert manager.next_eligible_time(WALLET) == pytest.approx(expected, abs=1), outcome
+
+    def test_invalid_address_is_never_retried(self):
+        """A rejected address is dropped from the scheduler instead of rescheduled."""
+        manager = self.manager()
+        manager._record_attempt(WALLET, time.time(), False, "Invalid wallet address format.")
+        assert math.isinf(manager.next_eligible_time(WALLET))
+
+        manager.perform_airdrop = lambda *args, **kwargs: False
+        messages = []
+        assert manager._run_scheduled_attempt(WALLET, messages.append) is None
+        assert messages == ["Status: Attempt 1 failed. Not retrying this wallet."]
+
+    def test_rpc_rate_limit_sets_retry_time(self, rpc_server):
+        """An RPC rate-limit error schedules the wallet when the server allows."""
+        def limited(params):
+            raise RuntimeError("airdrop request limit reached. Try again in 2 hours")
+
+        rpc_server.handlers["requestAirdrop"] = limited
+        manager = self.manager(airdrop_backend="rpc", rpc_url=rpc_server.url, confirm_airdrops=False)
+        records = []
+        manager.attempt_listeners.append(records.append)
+
+        assert not manager.perform_airdrop(WALLET, lambda message: None, 1)
+        assert records[0].outcome == RATE_LIMITED
+        assert records[0].next_eligible_at == pytest.approx(records[0].ended_at + 7200)
+        manager.close()
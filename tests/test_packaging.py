@@ -0,0 +1,44 @@
+"""
+Tests for the installable package layout.
+"""
+
+import configparser
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+def test_console_scripts_resolve_from_the_built_package(tmp_path):
+    """Every console script imports from the built package alone, not the source tree."""
+    pytest.importorskip("setuptools")
+    build = subprocess.run(
+        [sys.executable, "setup.py", "-q", "egg_info", "--egg-base", str(tmp_path),
+         "build", "--build-base", str(tmp_path)],
+        cwd=REPO_ROOT, capture_output=True, text=True,
+    )
+    assert build.returncode == 0, build.stderr
+
+    entry_points = configparser.ConfigParser()
+    entry_points.read(next(tmp_path.glob("*.egg-info")) / "entry_points.txt")
+    scripts = dict(entry_points["console_scripts"])
+    assert set(scripts) == {"solana-airdrop-tool", "solana-airdrop-cli"}
+
+    check = (
+        "import importlib, sys\n"
+        f"sys.path.insert(0, {str(tmp_path / 'lib')!r})\n"
+        "for target in sys.argv[1:]:\n"
+        "    module, _, attribute = target.partition(':')\n"
+        "    loaded = importlib.import_module(module)\n"
+        f"    assert loaded.__file__.startswith({str(tmp_path)!r}), loaded.__file__\n"
+        "    assert callable(getattr(loaded, attribute)), target\n"
+    )
+    # -I keeps the repository checkout off sys.path.
+    result = subprocess.run(
+        [sys.executable, "-I", "-c", check, *scripts.values()],
+        cwd=tmp_path, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,217 @@
+"""
+Tests for the browser process watchdog.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from src.core.process_watchdog import ProcessWatchdog, proc_available, process_tree, read_stat
+
+pytestmark = pytest.mark.skipif(not proc_available(), reason="needs /proc")
+
+WALLET = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+
+# A parent that starts a child, like Chromium starting its renderers.
+TREE_SCRIPT = (
+    "import subprocess, sys, time\n"
+    "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+    "{body}\n"
+)
+
+
+def spawn_tree(busy=False):
+    """Start a two-process tree and wait until both processes exist."""
+    body = "while True: pass" if busy else "time.sleep(60)"
+    process = subprocess.Popen([sys.executable, "-c", TREE_SCRIPT.format(body=body)])
+    deadline = time.monotonic() + 10
+    while len(process_tree(process.pid)) < 2 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    pids = set(process_tree(process.pid))
+    assert len(pids) == 2
+    return process, pids
+
+
+def running(pids):
+    """The pids that are still running, not counting zombies."""
+    stats = {pid: read_stat(pid) for pid in pids}
+    return {pid for pid, stat in stats.items() if stat is not None and stat.state != "Z"}
+
+
+@pytest.fixture
+def trees():
+    """Spawn process trees, killing any the test leaves behind."""
+    started = []
+
+    def spawn(busy=False):
+        process, pids = spawn_tree(busy)
+        started.append((process, pids))
+        return process, pids
+
+    yield spawn
+    for process, pids in started:
+        for pid in running(pids):
+            os.kill(pid, 9)
+        process.wait(5)
+
+
+class TestSampling:
+    """Test resource accounting and limit enforcement."""
+
+    def test_sample_reports_tree_usage(self, trees):
+        """RSS and CPU are summed over the browser and its children."""
+        process, pids = trees(busy=True)
+        watchdog = ProcessWatchdog()
+        watchdog.track(process.pid, label="test browser")
+
+        watchdog.sample()
+        time.sleep(0.3)
+        sample = watchdog.sample()[0]
+
+        assert sample.pid == process.pid
+        assert sample.processes == 2
+        assert sample.rss_bytes > 1024 * 1024
+        assert sample.cpu_percent > 20
+        watchdog.close()
+
+    def test_rss_limit_kills_the_tree(self, trees):
+        """A tree over the memory limit is killed, children included."""
+        process, pids = trees()
+        watchdog = ProcessWatchdog(max_rss_mb=1)
+        watchdog.track(process.pid)
+
+        watchdog.sample()
+        assert running(pids) == set()
+        assert watchdog.sample() == []
+        watchdog.close()
+
+    def test_cpu_limit_needs_consecutive_samples(self, trees):
+        """A CPU spike is tolerated; sustained use over the limit is not."""
+        process, pids = trees(busy=True)
+        watchdog = ProcessWatchdog(max_cpu_percent=10, cpu_samples=2)
+        watchdog.track(process.pid)
+
+        watchdog.sample()
+        time.sleep(0.2)
+        watchdog.sample()
+        assert running(pids) == pids
+        time.sleep(0.2)
+        watchdog.sample()
+        assert running(pids) == set()
+        watchdog.close()
+
+    def test_lifetime_limit(self, trees):
+        """A tree that outlives its attempt is killed."""
+        process, pids = trees()
+        watchdog = ProcessWatchdog()
+        watchdog.track(process.pid, lifetime=0.05)
+
+        watchdog.sample()
+        assert running(pids) == pids
+        time.sleep(0.1)
+        watchdog.sample()
+        assert running(pids) == set()
+        watchdog.close()
+
+
+class TestCleanup:
+    """Test killing leftovers and reaping orphans of crashed runs."""
+
+    def test_release_kills_survivors(self, trees, tmp_path):
+        """Processes still running when their owner is done with them are killed."""
+        process, pids = trees()
+        watchdog = ProcessWatchdog(state_dir=str(tmp_path))
+        watchdog.track(process.pid)
+        assert watchdog.state_file.exists()
+
+        assert watchdog.release(process.pid) == 2
+        assert running(pids) == set()
+        assert not watchdog.state_file.exists()
+        watchdog.close()
+
+    def test_release_kills_children_of_an_exited_root(self, tmp_path):
+        """Children the browser orphans by exiting during quit are killed from the snapshot."""
+        # The root exits when its stdin closes, leaving its child reparented to init.
+        script = TREE_SCRIPT.format(body="sys.stdin.readline()")
+        process = subprocess.Popen([sys.executable, "-c", script], stdin=subprocess.PIPE)
+        deadline = time.monotonic() + 10
+        while len(process_tree(process.pid)) < 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        pids = set(process_tree(process.pid))
+        assert len(pids) == 2
+        (child,) = pids - {process.pid}
+        try:
+            watchdog = ProcessWatchdog(state_dir=str(tmp_path))
+            watchdog.track(process.pid)
+            assert watchdog.snapshot(process.pid) == 2
+
+            process.stdin.close()
+            process.wait(5)
+            assert running({child}) == {child}
+            assert process_tree(process.pid) == {}
+
+            assert watchdog.release(process.pid) == 1
+            assert running({child}) == set()
+            watchdog.close()
+        finally:
+            for pid in running({child}):
+                os.kill(pid, 9)
+
+    def test_reap_orphans_of_dead_instances(self, trees, tmp_path):
+        """Processes recorded by an instance that has exited are killed at startup."""
+        orphan, orphan_pids = trees()
+        survivor, survivor_pids = trees()
+        dead_owner = subprocess.Popen([sys.executable, "-c", "pass"])
+        dead_owner.wait()
+
+        def state(owner, pids):
+            start = read_stat(owner).start_ticks if read_stat(owner) else 12345
+            return json.dumps({
+                "owner": [owner, start],
+                "processes": [[pid, read_stat(pid).start_ticks] for pid in pids],
+            })
+
+        (tmp_path / "dead.json").write_text(state(dead_owner.pid, orphan_pids))
+        # The survivor tree's recorded owner is alive, so it belongs to another running instance.
+        (tmp_path / "alive.json").write_text(state(survivor.pid, survivor_pids))
+
+        watchdog = ProcessWatchdog(state_dir=str(tmp_path))
+        assert watchdog.reap_orphans() == 2
+        assert running(orphan_pids) == set()
+        assert running(survivor_pids) == survivor_pids
+        assert not (tmp_path / "dead.json").exists()
+        assert (tmp_path / "alive.json").exists()
+
+
+class TestManagerIntegration:
+    """Test that attempts hand their browser to the watchdog."""
+
+    def test_failed_quit_leaves_nothing_running(self, trees, tmp_path):
+        """A browser whose quit fails is killed when the attempt ends."""
+        pytest.importorskip("lxml")
+        from src.core.airdrop_manager import AirdropManager
+        from src.utils.config import AppConfig
+        from tests.fake_driver import FakeClock, FakeFaucetDriver
+
+        process, pids = trees()
+
+        class StuckBrowser(FakeFaucetDriver):
+            process_id = process.pid
+
+            def quit(self):
+                raise RuntimeError("browser did not respond")
+
+        clock = FakeClock()
+        app_config = AppConfig(
+            ledger_path="", notification_sinks=[], watchdog_state_dir=str(tmp_path)
+        )
+        manager = AirdropManager(app_config, driver_factory=lambda: StuckBrowser(clock), clock=clock)
+
+        assert manager.perform_airdrop(WALLET, lambda message: None, 1)
+        assert running(pids) == set()
+        assert list(tmp_path.iterdir()) == []
+        manager.close()
@@ -0,0 +1,238 @@
+"""
+Tests for the JSON-RPC airdrop backend.
+"""
+
+import time
+
+import pytest
+
+from src.core import airdrop_manager
+from src.core.airdrop_manager import AirdropManager
+from src.core.http_client import _is_dropped
+from src.core.rpc_client import RpcError, SolanaRpcClient
+from src.utils.config import AppConfig
+from tests.fake_driver import FakeClock
+
+WALLET = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+
+
+def rpc_config(url, **overrides):
+    """Build an RPC backend config that skips confirmation tracking and notifications."""
+    overrides.setdefault("confirm_airdrops", False)
+    overrides.setdefault("ledger_path", "")
+    overrides.setdefault("notification_sinks", [])
+    return AppConfig(airdrop_backend="rpc", rpc_url=url, **overrides)
+
+
+class TestRpcAirdropBackend:
+    """Test cases for the RPC airdrop backend."""
+
+    def test_request_airdrop_success(self, rpc_server):
+        """Test a successful airdrop is reported through the progress callback."""
+        rpc_server.handlers["requestAirdrop"] = lambda params: "sig-" + params[0][:4]
+        manager = AirdropManager(rpc_config(rpc_server.url))
+        messages = []
+
+        assert manager.perform_airdrop(WALLET, messages.append, 1) is True
+        assert rpc_server.requests[0]["params"] == [WALLET, 1_000_000_000]
+        assert messages[-1] == "Status: Airdrop success. Signature: sig-9WzD"
+        assert manager.last_attempt_time > 0
+
+    def test_request_airdrop_error(self, rpc_server):
+        """Test an RPC error fails the attempt without raising."""
+        def fail(params):
+            raise ValueError("airdrop request limit reached")
+
+        rpc_server.handlers["requestAirdrop"] = fail
+        manager = AirdropManager(rpc_config(rpc_server.url))
+        messages = []
+
+        assert manager.perform_airdrop(WALLET, messages.append, 1) is False
+        assert "airdrop request limit reached" in messages[-1]
+
+    def test_connections_are_reused(self, rpc_server):
+        """Test sequential calls share one keep-alive connection."""
+        rpc_server.handlers["getHealth"] = lambda params: "ok"
+        client = SolanaRpcClient(rpc_server.url)
+
+        for _ in range(5):
+            assert client.call("getHealth") == "ok"
+        client.close()
+
+        assert rpc_server.connections == 1
+
+    def test_query_string_is_kept(self, rpc_server):
+        """Test the endpoint's query string (e.g. an API key) is sent with every request."""
+        rpc_server.handlers["getHealth"] = lambda params: "ok"
+        client = SolanaRpcClient(rpc_server.url + "/rpc?api-key=secret")
+
+        assert client.call("getHealth") == "ok"
+        client.close()
+
+        assert rpc_server.paths == ["/rpc?api-key=secret"]
+
+    def test_sent_request_is_not_resent(self, rpc_server):
+        """Test a request whose connection drops before the response is not sent twice."""
+        rpc_server.handlers["getHealth"] = lambda params: "ok"
+        rpc_server.handlers["requestAirdrop"] = lambda params: "sig"
+        rpc_server.hang_up.add("requestAirdrop")
+        client = SolanaRpcClient(rpc_server.url)
+
+        assert client.call("getHealth") == "ok"
+        with pytest.raises(RpcError):
+            client.call("requestAirdrop", [WALLET, 1])
+        client.close()
+
+        methods = [request["method"] for request in rpc_server.requests]
+        assert methods == ["getHealth", "requestAirdrop"]
+
+    def test_dropped_idle_connection_is_replaced(self, rpc_server):
+        """Test a pooled connection the server has closed is swapped for a fresh one."""
+        rpc_server.handlers["getHealth"] = lambda params: "ok"
+        rpc_server.close_idle = True
+        client = SolanaRpcClient(rpc_server.url)
+
+        assert client.call("getHealth") == "ok"
+        idle = client.http._pool.queue[0]
+        deadline = time.monotonic() + 5
+        while not _is_dropped(idle) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert client.call("getHealth") == "ok"
+        client.close()
+
+        assert len(rpc_server.requests) == 2
+        assert rpc_server.connections == 2
+
+    def test_unreachable_server(self):
+        """Test connection failures surface as RpcError."""
+        client = SolanaRpcClient("http://127.0.0.1:9", timeout=1)
+        with pytest.raises(RpcError):
+            client.call("getHealth")
+
+    def test_unknown_backend(self):
+        """Test an unknown backend name is rejected."""
+        with pytest.raises(ValueError):
+            AirdropManager(AppConfig(airdrop_backend="carrier-pigeon"))
+
+
+class TestBulkAirdrop:
+    """Test cases for batched multi-wallet funding."""
+
+    WALLETS = [
+        "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM",
+        "DjVE6JNiYqPL2QXyCUUh8rNjHrbz9hXHNYt99MQ59qw1",
+        "11111111111111111111111111111111",
+    ]
+
+    def test_batches_are_chunked(self, rpc_server):
+        """Test addresses are sent as batch arrays of the configured size."""
+        rpc_server.handlers["requestAirdrop"] = lambda params: "sig-" + params[0]
+        manager = AirdropManager(rpc_config(rpc_server.url))
+
+        results = manager.perform_bulk_airdrop(self.WALLETS, chunk_size=2)
+
+        assert [len(request) for request in rpc_server.requests] == [2, 1]
+        assert [result.address for result in results] == self.WALLETS
+        assert all(result.success for result in results)
+        assert results[1].signature == "sig-" + self.WALLETS[1]
+
+    def test_wallets_are_read_a_window_at_a_time(self, rpc_server, monkeypatch):
+        """Test a streamed wallet list is consumed as batches go out, not all up front."""
+        monkeypatch.setattr(airdrop_manager, "BULK_WINDOW_SIZE", 2)
+        pulled = []
+
+        def wallets():
+            for wallet in self.WALLETS:
+                pulled.append(wallet)
+                yield wallet
+
+        seen_at_request = []
+
+        def request_airdrop(params):
+            seen_at_request.append(len(pulled))
+            return "sig"
+
+        rpc_server.handlers["requestAirdrop"] = request_airdrop
+        manager = AirdropManager(rpc_config(rpc_server.url))
+
+        results = manager.perform_bulk_airdrop(wallets(), chunk_size=2)
+
+        assert seen_at_request == [2, 2, 3]
+        assert [result.address for result in results] == self.WALLETS
+        assert all(result.success for result in results)
+
+    def test_per_address_errors(self, rpc_server):
+        """Test invalid addresses and per-call errors are reported individually."""
+        def request_airdrop(params):
+            if params[0].startswith("1111"):
+                raise ValueError("account in use")
+            return "sig"
+
+        rpc_server.handlers["requestAirdrop"] = request_airdrop
+        manager = AirdropManager(rpc_config(rpc_server.url))
+
+        results = manager.perform_bulk_airdrop(["not-a-wallet"] + self.WALLETS)
+
+        assert len(rpc_server.requests) == 1
+        assert len(rpc_server.requests[0]) == 3
+        assert results[0].error == "Invalid wallet address format."
+        assert results[1].success and results[2].success
+        assert results[3].error == "account in use"
+
+    def test_cancelled_wallets_are_not_recorded(self, rpc_server):
+        """Test stopping a run records only the wallets that were actually tried."""
+        manager = AirdropManager(rpc_config(rpc_server.url))
+        scheduled_token = manager.cancel_token
+
+        def request_airdrop(params):
+            manager.stop()
+            return "sig"
+
+        rpc_server.handlers["requestAirdrop"] = request_airdrop
+        records = []
+        manager.attempt_listeners.append(records.append)
+
+        results = manager.perform_bulk_airdrop(self.WALLETS, chunk_size=1)
+
+        assert len(rpc_server.requests) == 1
+        assert [result.error for result in results[1:]] == ["Cancelled.", "Cancelled."]
+        assert [record.wallet for record in records] == [self.WALLETS[0]]
+        assert list(manager.next_eligible) == [self.WALLETS[0]]
+        assert manager.cancel_token is scheduled_token
+        assert manager.bulk_tokens == set()
+
+
+class TestConfirmedAirdrop:
+    """Test cases for RPC airdrops that wait for confirmation."""
+
+    def test_attempt_waits_for_confirmation(self, rpc_server):
+        """Test an attempt succeeds only once the signature is confirmed."""
+        rpc_server.handlers["requestAirdrop"] = lambda params: "sig"
+        rpc_server.handlers["getSignatureStatuses"] = lambda params: {
+            "value": [{"confirmationStatus": "finalized", "err": None}]
+        }
+        manager = AirdropManager(rpc_config(rpc_server.url, confirm_airdrops=True, rpc_ws_url=""))
+        messages = []
+
+        assert manager.perform_airdrop(WALLET, messages.append, 1) is True
+        assert "Waiting for confirmation" in messages[1]
+        assert manager.rpc_backend.tracker.stats()["count"] == 1
+
+    def test_confirmation_wait_uses_the_manager_clock(self, rpc_server):
+        """Test the backend times submission and confirmation on the injected clock."""
+        clock = FakeClock()
+        rpc_server.handlers["requestAirdrop"] = lambda params: "sig"
+
+        def statuses(params):
+            if clock.monotonic() < 20:
+                return {"value": [None]}
+            return {"value": [{"confirmationStatus": "confirmed", "err": None}]}
+
+        rpc_server.handlers["getSignatureStatuses"] = statuses
+        manager = AirdropManager(
+            rpc_config(rpc_server.url, confirm_airdrops=True, confirmation_timeout=60), clock=clock
+        )
+
+        assert manager.perform_airdrop(WALLET, lambda message: None, 1) is True
+        assert clock.monotonic() >= 20
+        assert manager.rpc_backend.tracker.stats()["p50"] == clock.monotonic()
@@ -0,0 +1,112 @@
+"""
+Tests for the cooldown scheduler.
+"""
+
+import threading
+import time
+
+from src.core.airdrop_manager import AirdropManager
+from src.core.scheduler import CooldownScheduler
+from src.utils.config import AppConfig
+
+
+class TestCooldownScheduler:
+    """Test cases for CooldownScheduler."""
+
+    def test_runs_in_due_order(self):
+        """Test jobs run in order of their due times."""
+        ran = []
+        done = threading.Event()
+
+        def job(wallet):
+            ran.append(wallet)
+            if len(ran) == 3:
+                done.set()
+            return None
+
+        scheduler = CooldownScheduler(job, workers=1)
+        now = time.time()
+        scheduler.schedule("c", now + 0.06)
+        scheduler.schedule("a", now)
+        scheduler.schedule("b", now + 0.03)
+        scheduler.start()
+
+        assert done.wait(2)
+        assert ran == ["a", "b", "c"]
+        scheduler.shutdown()
+
+    def test_thousands_of_wallets_use_fixed_threads(self):
+        """Test tracked wallets cost no threads beyond the workers."""
+        scheduler = CooldownScheduler(lambda wallet: None, workers=2, name="fixed-threads")
+        for index in range(5000):
+            scheduler.schedule(f"wallet-{index}", time.time() + 3600)
+        scheduler.start()
+
+        assert len(scheduler) == 5000
+        workers = [thread for thread in threading.enumerate() if thread.name.startswith("fixed-threads")]
+        assert len(workers) == 2
+        scheduler.shutdown()
+
+    def test_wake_and_reschedule(self):
+        """Test a wallet due in an hour can be woken immediately."""
+        ran = threading.Event()
+        scheduler = CooldownScheduler(lambda wallet: ran.set(), workers=1)
+        scheduler.schedule("a", time.time() + 3600)
+        scheduler.start()
+
+        assert not ran.wait(0.05)
+        scheduler.wake("a")
+        assert ran.wait(1)
+        scheduler.shutdown()
+
+    def test_job_result_reschedules(self):
+        """Test a job's returned due time puts the wallet back on the heap."""
+        runs = []
+
+        def job(wallet):
+            runs.append(time.time())
+            return time.time() + 0.05 if len(runs) < 3 else None
+
+        scheduler = CooldownScheduler(job, workers=1)
+        scheduler.schedule("a")
+        scheduler.start()
+        deadline = time.time() + 2
+        while len(runs) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        scheduler.shutdown()
+
+        assert len(runs) == 3
+        assert runs[2] - runs[1] >= 0.05
+        assert scheduler.next_due("a") is None
+
+    def test_shutdown_is_immediate(self):
+        """Test idle workers exit without waiting for the next due time."""
+        scheduler = CooldownScheduler(lambda wallet: None, workers=3)
+        scheduler.schedule("a", time.time() + 3600)
+        scheduler.start()
+
+        start = time.monotonic()
+        scheduler.shutdown()
+        assert time.monotonic() - start < 0.5
+        assert not any(thread.is_alive() for thread in scheduler._threads)
+
+    def test_manager_attempts_stop_immediately(self, rpc_server):
+        """Test perform_airdrop_attempts returns as soon as the manager is stopped."""
+        rpc_server.handlers["requestAirdrop"] = lambda params: "sig"
+        manager = AirdropManager(AppConfig(
+            airdrop_backend="rpc", rpc_url=rpc_server.url, confirm_airdrops=False, ledger_path=""
+        ))
+        messages = []
+        thread = threading.Thread(
+            target=manager.perform_airdrop_attempts,
+            args=("9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM", messages.append),
+        )
+        thread.start()
+        deadline = time.time() + 2
+        while "Status: Attempt 1 successful. Retrying..." not in messages and time.time() < deadline:
+            time.sleep(0.01)
+
+        manager.stop()
+        thread.join(1)
+        assert not thread.is_alive()
+        assert len(rpc_server.requests) == 1
@@ -0,0 +1,108 @@
+"""
+Tests for Chrome trace-event export of attempts.
+"""
+
+import json
+from collections import Counter
+
+import pytest
+
+from src.core.airdrop_manager import AirdropManager
+from src.core.clock import SYSTEM_CLOCK
+from src.core.tracing import NULL_TRACER, Tracer, create_tracer
+from src.utils.config import AppConfig
+
+WALLET = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+
+
+def traced_manager(tmp_path, mode, **overrides):
+    """A manager tracing attempts against the browserless fake faucet."""
+    pytest.importorskip("lxml")
+    from tests.fake_driver import FakeClock, FakeFaucetDriver
+
+    clock = FakeClock()
+    app_config = AppConfig(
+        ledger_path="",
+        notification_sinks=[],
+        trace_mode=mode,
+        trace_dir=str(tmp_path),
+        **overrides,
+    )
+    return AirdropManager(app_config, driver_factory=lambda: FakeFaucetDriver(clock), clock=clock)
+
+
+def complete_events(trace):
+    return [event for event in trace["traceEvents"] if event["ph"] == "X"]
+
+
+class TestTracerDisabled:
+    """Test that tracing off adds nothing to an attempt."""
+
+    def test_off_uses_shared_null_objects(self):
+        """No tracer state, a shared no-op span and the clock left as it is."""
+        tracer = create_tracer(AppConfig())
+        assert tracer is NULL_TRACER
+        assert tracer.span("a") is tracer.span("b", x=1)
+        assert tracer.wrap_clock(SYSTEM_CLOCK) is SYSTEM_CLOCK
+
+        manager = AirdropManager(AppConfig(ledger_path="", notification_sinks=[]))
+        assert manager.tracer is NULL_TRACER
+        assert manager.clock is SYSTEM_CLOCK
+        manager.close()
+
+
+class TestTracer:
+    """Test span recording and trace files."""
+
+    def test_span_records_errors(self, tmp_path):
+        """A span that raises is still recorded, with the exception type."""
+        tracer = Tracer("buffer", str(tmp_path))
+        with pytest.raises(KeyError):
+            with tracer.span("lookup", key="a"):
+                raise KeyError("a")
+
+        trace = json.loads(tracer.dump().read_text())
+        assert complete_events(trace)[0]["args"] == {"key": "a", "error": "KeyError"}
+
+    def test_attempt_file_covers_every_step(self, tmp_path):
+        """One file per attempt with phases, bypass iterations, waits and sleeps."""
+        manager = traced_manager(tmp_path, "attempt")
+        assert manager.perform_airdrop(WALLET, lambda message: None, 1)
+        manager.close()
+
+        files = list(tmp_path.glob("*.json"))
+        assert len(files) == 1 and f"{WALLET[:8]}-attempt1" in files[0].name
+        trace = json.loads(files[0].read_text())
+        events = complete_events(trace)
+        names = Counter(event["name"] for event in events)
+
+        assert names["perform_airdrop"] == 1
+        phases = ("browser_launch", "page_load", "interact", "challenge", "response_wait", "result_check")
+        assert [names[phase] for phase in phases] == [1] * len(phases)
+        assert names["bypass_iteration"] == 2
+        assert names["wait_for_any"] == 1
+        # One per typed character, one per bypass iteration and the response wait.
+        assert names["sleep"] == len(WALLET) + 2 + 1
+
+        attempt = next(event for event in events if event["name"] == "perform_airdrop")
+        assert attempt["args"]["outcome"] == "success"
+        challenge = next(event for event in events if event["name"] == "challenge")
+        assert challenge["dur"] == pytest.approx(4_000_000)
+        for event in events:
+            assert attempt["ts"] <= event["ts"]
+            assert event["ts"] + event["dur"] <= attempt["ts"] + attempt["dur"] + 1
+        assert any(event["name"] == "thread_name" for event in trace["traceEvents"])
+
+    def test_rolling_buffer_keeps_latest_events(self, tmp_path):
+        """Buffer mode writes no per-attempt files and keeps only the newest events."""
+        manager = traced_manager(tmp_path, "buffer", trace_buffer_events=20)
+        manager.perform_airdrop(WALLET, lambda message: None, 1)
+        manager.perform_airdrop(WALLET, lambda message: None, 2)
+        assert list(tmp_path.iterdir()) == []
+        manager.close()
+
+        trace = json.loads((tmp_path / "trace-buffer.json").read_text())
+        events = complete_events(trace)
+        assert len(events) == 20
+        assert events[-1]["name"] == "perform_airdrop"
+        assert events[-1]["args"]["attempt"] == 2
@@ -0,0 +1,82 @@
+"""
+Tests for the wallet dashboard model.
+"""
+
+import time
+
+import pytest
+
+from src.core.attempt_ledger import AttemptRecord
+from src.gui.wallet_dashboard import WalletDashboardModel
+
+
+def wallets(count):
+    return [f"Wallet{index:06d}" for index in range(count)]
+
+
+class TestWalletDashboardModel:
+    """Test sorting, filtering, windowing and incremental updates."""
+
+    def test_window_sorted_by_wallet(self):
+        """The default view is sorted by address and sliced by window()."""
+        model = WalletDashboardModel(min_resort_interval=0)
+        model.add_wallets(reversed(wallets(10)))
+
+        rows = model.window(2, 3)
+        assert [row[0] for row in rows] == ["Wallet000002", "Wallet000003", "Wallet000004"]
+        assert rows[0][1:] == ("pending", "now", "")
+
+    def test_record_attempt_and_sort_by_latency(self):
+        """Attempt records fill the row; sorting toggles on repeated columns."""
+        model = WalletDashboardModel(min_resort_interval=0)
+        for index, latency in enumerate([3.0, 1.0, 2.0]):
+            model.record_attempt(AttemptRecord(
+                wallet=f"w{index}", started_at=100.0, ended_at=100.0 + latency,
+                outcome="success", next_eligible_at=200.0,
+            ))
+
+        model.set_sort("latency")
+        assert [row[0] for row in model.window(0, 3)] == ["w1", "w2", "w0"]
+        model.set_sort("latency")
+        assert [row[0] for row in model.window(0, 3)] == ["w0", "w2", "w1"]
+        assert model.window(0, 1)[0][3] == "3.0s"
+
+    def test_filters(self):
+        """Text and outcome filters combine and update with new outcomes."""
+        model = WalletDashboardModel(min_resort_interval=0)
+        model.add_wallets(wallets(20))
+        model.update("Wallet000011", outcome="failure")
+        model.set_filter("00001")
+        assert model.visible_count() == 11  # Wallet000001 and Wallet000010-19
+
+        model.set_filter("00001", outcome="failure")
+        assert [row[0] for row in model.window(0, 10)] == ["Wallet000011"]
+        model.update("Wallet000012", outcome="failure")
+        assert model.visible_count() == 2
+
+        with pytest.raises(ValueError):
+            model.set_sort("balance")
+
+    def test_value_updates_do_not_resort(self):
+        """Updating a non-sort field changes values without rebuilding the order."""
+        model = WalletDashboardModel(min_resort_interval=0)
+        model.add_wallets(wallets(3))
+        model.window(0, 3)
+        version = model.version
+
+        model.update("Wallet000001", outcome="success")
+        assert not model.resort_pending
+        assert model.version == version + 1
+        assert model.window(1, 1)[0][1] == "success"
+
+    def test_large_model_window_is_cheap(self):
+        """With 50k wallets, reading a screenful after an update stays fast."""
+        model = WalletDashboardModel(min_resort_interval=0)
+        model.add_wallets(wallets(50000))
+        model.window(0, 20)
+
+        start = time.perf_counter()
+        for index in range(1000):
+            model.update(f"Wallet{index:06d}", outcome="success", latency=1.0)
+            model.window(25000, 20)
+        assert time.perf_counter() - start < 1.0
@@ -0,0 +1,79 @@
+"""
+Tests for the streaming wallet import pipeline.
+"""
+
+from src.core.address_validator import REJECT_LENGTH
+from src.core.wallet_import import WalletImporter, import_wallets, iter_chunks
+
+WALLET_A = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+WALLET_B = "DjVE6JNiYqPL2QXyCUUh8rNjHrbz9hXHNYt99MQ59qw1"
+
+
+class TestWalletImport:
+    """Test cases for WalletImporter."""
+
+    def test_text_file(self, tmp_path):
+        """Test text lists are normalized, validated and deduplicated."""
+        path = tmp_path / "wallets.txt"
+        path.write_text(
+            f"\ufeff  {WALLET_A}  \n\n# comment\n{WALLET_B} funded-later\n{WALLET_A}\nnot-a-wallet\n",
+            encoding="utf-8",
+        )
+        importer = WalletImporter(path)
+
+        assert list(importer) == [WALLET_A, WALLET_B]
+        assert importer.stats.lines_read == 6
+        assert importer.stats.imported == 2
+        assert importer.stats.duplicates == 1
+        assert importer.stats.invalid == 1
+        assert importer.stats.rejections == {REJECT_LENGTH: 1}
+
+    def test_csv_with_header(self, tmp_path):
+        """Test the address column is picked from the CSV header."""
+        path = tmp_path / "wallets.csv"
+        path.write_text(f'label,Address\nalice,"{WALLET_B}"\nbob,{WALLET_A}\n', encoding="utf-8")
+
+        assert list(import_wallets(path)) == [WALLET_B, WALLET_A]
+
+    def test_is_lazy_with_progress(self, tmp_path):
+        """Test progress is reported incrementally while consuming the iterator."""
+        path = tmp_path / "wallets.txt"
+        path.write_text(f"{WALLET_A}\n{WALLET_B}\n" + "bad\n" * 10, encoding="utf-8")
+        reports = []
+        importer = WalletImporter(
+            path, progress_callback=lambda stats: reports.append(stats.lines_read), progress_every=5
+        )
+
+        iterator = iter(importer)
+        assert next(iterator) == WALLET_A
+        assert reports == []
+        assert list(iterator) == [WALLET_B]
+        assert reports == [5, 10, 12]
+
+    def test_max_wallets(self, tmp_path):
+        """Test the import stops at the wallet limit."""
+        path = tmp_path / "wallets.txt"
+        path.write_text(f"{WALLET_A}\n{WALLET_B}\n", encoding="utf-8")
+        importer = WalletImporter(path, max_wallets=1)
+
+        assert list(importer) == [WALLET_A]
+        assert importer.stats.truncated
+
+    def test_max_wallets_reached_at_end_of_file(self, tmp_path):
+        """Test a list that ends at the limit, or only repeats after it, is not truncated."""
+        path = tmp_path / "wallets.txt"
+        path.write_text(f"{WALLET_A}\n{WALLET_B}\n{WALLET_A}\nbad\n", encoding="utf-8")
+        importer = WalletImporter(path, max_wallets=2)
+
+        assert list(importer) == [WALLET_A, WALLET_B]
+        assert not importer.stats.truncated
+        assert importer.stats.duplicates == 1
+
+    def test_chunks_stream_the_import(self, tmp_path):
+        """Test chunks are filled from the importer as it reads, not after it finishes."""
+        path = tmp_path / "wallets.txt"
+        path.write_text(f"{WALLET_A}\n{WALLET_B}\n{WALLET_A}\n", encoding="utf-8")
+        chunks = iter_chunks(WalletImporter(path), 1)
+
+        assert next(chunks) == [WALLET_A]
+        assert list(chunks) == [[WALLET_B]]